@@ -0,0 +1,53 @@
+"""
+Import time benchmark: time the import of the package in new interpreters
+(as in a CLI tool or a serverless function cold start)
+
+Usage: python benchmarks/import_time.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import koios_api",
+    "from koios_api import API_BASE_URL",
+    "from koios_api import get_tip",
+    "import requests",
+]
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+def time_import(statement: str, runs: int) -> list:
+    """
+    Time an import statement in new interpreters
+    :param statement: The import statement
+    :param runs: The number of interpreters to start
+    :return: The list of import times, in milliseconds
+    """
+    code = (
+        "from time import perf_counter\n"
+        "start = perf_counter()\n"
+        f"{statement}\n"
+        "print((perf_counter() - start) * 1000)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC)
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, check=True
+        ).stdout
+        times.append(float(output))
+    return times
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'statement':40} {'median (ms)':>12} {'min (ms)':>10}")
+    for statement in STATEMENTS:
+        times = time_import(statement, runs)
+        print(f"{statement:40} {statistics.median(times):12.1f} {min(times):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Throughput benchmark: time the paginated and bulk functions against the mock Koios server
+(tests/mock_server.py), and report the rows and requests per second of each scenario
+
+With --replay, the responses of each scenario are recorded to a cassette once,
+and the runs replay them, to measure the client-side time only (paging, decoding and merging)
+
+Usage: python benchmarks/throughput.py [--rows ROWS] [--latency SECONDS] [--error-rate RATE] [--runs RUNS] [--replay]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [os.path.join(ROOT, "src"), ROOT]
+
+from koios_api import KoiosClient  # noqa: E402
+from tests.mock_server import MockKoiosServer  # noqa: E402
+
+STAKE_ADDRESS = "stake1u8yxtugdv63wxafy9d00nuz6hjyyp4qnggvc9a3vxh8yl0ckml2uz"
+
+# Name, client settings and call of each scenario
+SCENARIOS = [
+    ("get_pool_list (GET pages)", {}, lambda client, rows: client.get_pool_list()),
+    (
+        "get_pool_list, 4 parallel pages",
+        {"PARALLEL_PAGES": 4},
+        lambda client, rows: client.get_pool_list(),
+    ),
+    (
+        "get_account_txs, keyset pages",
+        {"KEYSET_PAGINATION": True},
+        lambda client, rows: client.get_account_txs(STAKE_ADDRESS),
+    ),
+    (
+        "get_pool_list, 2 fields",
+        {},
+        lambda client, rows: client.get_pool_list(
+            fields=["pool_id_bech32", "block_height"]
+        ),
+    ),
+    (
+        "get_tx_info (POST bulk)",
+        {},
+        lambda client, rows: client.get_tx_info([f"{i:064x}" for i in range(rows)]),
+    ),
+    (
+        "get_tx_status, 8 bulk workers",
+        {"BULK_WORKERS": 8},
+        lambda client, rows: client.get_tx_status([f"{i:064x}" for i in range(rows)]),
+    ),
+]
+
+
+def run_scenario(
+    server: MockKoiosServer,
+    settings: dict,
+    call,
+    rows: int,
+    runs: int,
+    replay: bool = False,
+) -> tuple:
+    """
+    Time a scenario
+    :param server: The mock server
+    :param settings: The settings of the client
+    :param call: The function making the calls, given the client and the number of rows
+    :param rows: The number of rows of the dataset
+    :param runs: The number of runs
+    :param replay: (optional) Replay the responses recorded in a first run if True
+    :return: The median time in seconds, the number of rows returned and of requests sent per run
+    """
+    settings = dict(settings, API_BASE_URL=server.base_url, SLEEP_TIME=0)
+    with tempfile.TemporaryDirectory() as directory:
+        if replay:
+            settings["CASSETTE"] = os.path.join(directory, "cassette.jsonl")
+            server.reset_stats()
+            with KoiosClient(**settings) as client:
+                call(client, rows)
+            requests = server.requests
+        times = []
+        for _ in range(runs):
+            server.reset_stats()
+            with KoiosClient(**settings) as client:
+                start = perf_counter()
+                result = call(client, rows)
+                times.append(perf_counter() - start)
+            if not replay:
+                requests = server.requests
+    return statistics.median(times), len(result), requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000, help="rows of the dataset")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="latency of each request in seconds"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction of failed requests"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="runs of each scenario")
+    parser.add_argument(
+        "--replay", action="store_true", help="replay recorded responses"
+    )
+    args = parser.parse_args()
+    with MockKoiosServer(
+        rows=args.rows, latency=args.latency, error_rate=args.error_rate
+    ) as server:
+        print(
+            f"{'scenario':36} {'median (s)':>10} {'rows':>8} {'requests':>9} {'rows/s':>10} {'requests/s':>11}"
+        )
+        for name, settings, call in SCENARIOS:
+            elapsed, rows, requests = run_scenario(
+                server, settings, call, args.rows, args.runs, args.replay
+            )
+            print(
+                f"{name:36} {elapsed:10.3f} {rows:8} {requests:9} "
+                f"{rows / elapsed:10.0f} {requests / elapsed:11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
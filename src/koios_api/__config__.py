@@ -20,6 +20,118 @@ if "REQUEST_TIMEOUT" not in env:
     REQUEST_TIMEOUT = 60
 else:
     REQUEST_TIMEOUT = int(env["REQUEST_TIMEOUT"])
+if "POOL_SIZE" not in env:
+    POOL_SIZE = 10
+else:
+    POOL_SIZE = int(env["POOL_SIZE"])
+if "KEEP_ALIVE" not in env:
+    KEEP_ALIVE = True
+else:
+    KEEP_ALIVE = env["KEEP_ALIVE"].lower() in ("1", "true", "yes")
+if "ACCEPT_ENCODING" not in env:
+    ACCEPT_ENCODING = "auto"
+else:
+    ACCEPT_ENCODING = env["ACCEPT_ENCODING"]
+if "PARALLEL_PAGES" not in env:
+    PARALLEL_PAGES = 1
+else:
+    PARALLEL_PAGES = int(env["PARALLEL_PAGES"])
+if "KEYSET_PAGINATION" not in env:
+    KEYSET_PAGINATION = False
+else:
+    KEYSET_PAGINATION = env["KEYSET_PAGINATION"].lower() in ("1", "true", "yes")
+if "BULK_WORKERS" not in env:
+    BULK_WORKERS = 4
+else:
+    BULK_WORKERS = int(env["BULK_WORKERS"])
+if "JSON_DECODER" not in env:
+    JSON_DECODER = "auto"
+else:
+    JSON_DECODER = env["JSON_DECODER"]
+if "ROW_FORMAT" not in env:
+    ROW_FORMAT = "dict"
+else:
+    ROW_FORMAT = env["ROW_FORMAT"]
+if "NUMERIC_AMOUNTS" not in env:
+    NUMERIC_AMOUNTS = False
+else:
+    NUMERIC_AMOUNTS = env["NUMERIC_AMOUNTS"].lower() in ("1", "true", "yes")
+if "RESPONSE_CACHE" not in env:
+    RESPONSE_CACHE = False
+else:
+    RESPONSE_CACHE = env["RESPONSE_CACHE"].lower() in ("1", "true", "yes")
+if "CACHE_TTL" not in env:
+    CACHE_TTL = 60
+else:
+    CACHE_TTL = int(env["CACHE_TTL"])
+if "CACHE_MAX_ENTRIES" not in env:
+    CACHE_MAX_ENTRIES = 1024
+else:
+    CACHE_MAX_ENTRIES = int(env["CACHE_MAX_ENTRIES"])
+if "CACHE_MAX_BYTES" not in env:
+    CACHE_MAX_BYTES = 64 * 1024 * 1024
+else:
+    CACHE_MAX_BYTES = int(env["CACHE_MAX_BYTES"])
+if "SINGLE_FLIGHT" not in env:
+    SINGLE_FLIGHT = False
+else:
+    SINGLE_FLIGHT = env["SINGLE_FLIGHT"].lower() in ("1", "true", "yes")
+if "MICRO_BATCH_WINDOW" not in env:
+    MICRO_BATCH_WINDOW = 0
+else:
+    MICRO_BATCH_WINDOW = int(env["MICRO_BATCH_WINDOW"])
+if "MICRO_BATCH_SIZE" not in env:
+    MICRO_BATCH_SIZE = 100
+else:
+    MICRO_BATCH_SIZE = int(env["MICRO_BATCH_SIZE"])
+if "CHAIN_STORE" not in env:
+    CHAIN_STORE = ""
+else:
+    CHAIN_STORE = env["CHAIN_STORE"]
+if "CONFIRMATION_DEPTH" not in env:
+    CONFIRMATION_DEPTH = 2160
+else:
+    CONFIRMATION_DEPTH = int(env["CONFIRMATION_DEPTH"])
+if "RETRY_ATTEMPTS" not in env:
+    RETRY_ATTEMPTS = 10
+else:
+    RETRY_ATTEMPTS = int(env["RETRY_ATTEMPTS"])
+if "RETRY_DEADLINE" not in env:
+    RETRY_DEADLINE = 0
+else:
+    RETRY_DEADLINE = int(env["RETRY_DEADLINE"])
+if "RETRY_MAX_SLEEP" not in env:
+    RETRY_MAX_SLEEP = 60
+else:
+    RETRY_MAX_SLEEP = int(env["RETRY_MAX_SLEEP"])
+if "RATE_LIMIT" not in env:
+    RATE_LIMIT = 0
+else:
+    RATE_LIMIT = float(env["RATE_LIMIT"])
+if "RATE_BURST" not in env:
+    RATE_BURST = 10
+else:
+    RATE_BURST = int(env["RATE_BURST"])
+if "CASSETTE" not in env:
+    CASSETTE = ""
+else:
+    CASSETTE = env["CASSETTE"]
+if "CASSETTE_MODE" not in env:
+    CASSETTE_MODE = "auto"
+else:
+    CASSETTE_MODE = env["CASSETTE_MODE"]
+if "REPLAY_TIMING" not in env:
+    REPLAY_TIMING = False
+else:
+    REPLAY_TIMING = env["REPLAY_TIMING"].lower() in ("1", "true", "yes")
+if "CIRCUIT_BREAKER_THRESHOLD" not in env:
+    CIRCUIT_BREAKER_THRESHOLD = 3
+else:
+    CIRCUIT_BREAKER_THRESHOLD = int(env["CIRCUIT_BREAKER_THRESHOLD"])
+if "CIRCUIT_BREAKER_COOLDOWN" not in env:
+    CIRCUIT_BREAKER_COOLDOWN = 30
+else:
+    CIRCUIT_BREAKER_COOLDOWN = int(env["CIRCUIT_BREAKER_COOLDOWN"])
 if "CARDANO_NET" not in env:
     CARDANO_NET = "mainnet"
     if "API_BASE_URL" not in env:
@@ -48,16 +160,27 @@ else:
     else:
         CARDANO_NET = env["CARDANO_NET"]
         API_BASE_URL = env["API_BASE_URL"]
+# API_BASE_URL can be a comma-separated list of Koios instances
+API_BASE_URLS = [url.strip() for url in API_BASE_URL.split(",") if url.strip()]
+API_BASE_URL = API_BASE_URLS[0]
+
+# The package logs to the "koios_api" logger, and leaves the logging configuration to the application
+logger = logging.getLogger("koios_api")
+logger.addHandler(logging.NullHandler())
+
 
-# Set up logging
-logging.basicConfig(
-    format="%(asctime)-15s %(levelname)s :: %(filename)s:%(lineno)s:%(funcName)s() :: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    level="INFO",
-    handlers=[
-        logging.StreamHandler(),
-    ],
-)
-# Format logs using UTC time
-logging.Formatter.converter = gmtime
-logger = logging.getLogger(__name__)
+def configure_logging(level="INFO") -> None:
+    """
+    Log the messages of the package to stderr, with UTC timestamps
+    (the format of the logs that the package used to configure at import)
+    :param level: (optional) The logging level, default: INFO
+    """
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter(
+        "%(asctime)-15s %(levelname)s :: %(filename)s:%(lineno)s:%(funcName)s() :: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    formatter.converter = gmtime
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(level)
@@ -1,12 +1,283 @@
 """Module initialization"""
-from .__config__ import *
-from .account import *
-from .address import *
-from .asset import *
-from .block import *
-from .epoch import *
-from .network import *
-from .ogmios import *
-from .pool import *
-from .script import *
-from .transactions import *
+import importlib
+
+# Public names of the package, for each module defining them.
+# The modules (and requests) are only imported when one of their names is first accessed,
+# so that importing the package is fast
+_exports = {
+    "__config__": [
+        "env",
+        "KOIOS_API_TOKEN",
+        "SLEEP_TIME",
+        "API_RESP_COUNT",
+        "REQUEST_TIMEOUT",
+        "POOL_SIZE",
+        "KEEP_ALIVE",
+        "ACCEPT_ENCODING",
+        "PARALLEL_PAGES",
+        "KEYSET_PAGINATION",
+        "BULK_WORKERS",
+        "JSON_DECODER",
+        "ROW_FORMAT",
+        "NUMERIC_AMOUNTS",
+        "RESPONSE_CACHE",
+        "CACHE_TTL",
+        "CACHE_MAX_ENTRIES",
+        "CACHE_MAX_BYTES",
+        "SINGLE_FLIGHT",
+        "MICRO_BATCH_WINDOW",
+        "MICRO_BATCH_SIZE",
+        "CHAIN_STORE",
+        "CONFIRMATION_DEPTH",
+        "RETRY_ATTEMPTS",
+        "RETRY_DEADLINE",
+        "RETRY_MAX_SLEEP",
+        "RATE_LIMIT",
+        "RATE_BURST",
+        "CASSETTE",
+        "CASSETTE_MODE",
+        "REPLAY_TIMING",
+        "CIRCUIT_BREAKER_THRESHOLD",
+        "CIRCUIT_BREAKER_COOLDOWN",
+        "CARDANO_NET",
+        "API_BASE_URL",
+        "API_BASE_URLS",
+        "logger",
+        "configure_logging",
+    ],
+    "account": [
+        "get_account_list",
+        "iter_account_list",
+        "get_account_info",
+        "get_account_info_cached",
+        "get_account_utxos",
+        "iter_account_utxos",
+        "get_account_txs",
+        "iter_account_txs",
+        "get_account_rewards",
+        "get_account_updates",
+        "get_account_addresses",
+        "get_account_assets",
+        "iter_account_assets",
+        "get_account_history",
+    ],
+    "address": [
+        "get_address_info",
+        "get_address_utxos",
+        "iter_address_utxos",
+        "get_credential_utxos",
+        "iter_credential_utxos",
+        "get_address_txs",
+        "iter_address_txs",
+        "get_credential_txs",
+        "get_address_assets",
+        "iter_address_assets",
+    ],
+    "asset": [
+        "get_asset_list",
+        "iter_asset_list",
+        "get_policy_asset_list",
+        "iter_policy_asset_list",
+        "get_asset_token_registry",
+        "iter_asset_token_registry",
+        "get_asset_info",
+        "get_asset_utxos",
+        "iter_asset_utxos",
+        "get_asset_history",
+        "iter_asset_history",
+        "get_asset_addresses",
+        "iter_asset_addresses",
+        "get_asset_nft_address",
+        "iter_asset_nft_address",
+        "get_policy_asset_addresses",
+        "iter_policy_asset_addresses",
+        "get_policy_asset_info",
+        "iter_policy_asset_info",
+        "get_asset_summary",
+        "get_asset_txs",
+        "iter_asset_txs",
+        "get_asset_address_list",
+        "get_asset_policy_info",
+    ],
+    "block": ["get_blocks", "iter_blocks", "get_block_info", "get_block_txs"],
+    "cassette": ["CassetteError", "request_key", "CassetteResponse", "Cassette"],
+    "epoch": ["get_epoch_info", "get_epoch_params", "get_epoch_block_protocols"],
+    "library": [
+        "BULK_BATCH_SIZES",
+        "CACHE_TTLS",
+        "CLOSED_EPOCH_ENDPOINTS",
+        "CLOSED_EPOCH_CACHE_TTL",
+        "RETRYABLE_STATUS_CODES",
+        "UNCACHED_ENDPOINTS",
+        "KEYSET_COLUMNS",
+        "FILTER_OPERATORS",
+        "LOGICAL_OPERATORS",
+        "set_json_decoder",
+        "decode_json",
+        "get_accept_encoding",
+        "get_session",
+        "close_sessions",
+        "ResponseCache",
+        "RateLimiter",
+        "get_wire_size",
+        "EndpointPool",
+        "SingleFlight",
+        "CLIENT_SETTINGS",
+        "ENDPOINT_MODULES",
+        "KoiosClient",
+        "get_endpoint_functions",
+        "client_method",
+        "get_client",
+        "submit_in_context",
+        "default_client",
+        "response_cache",
+        "rate_limiter",
+        "endpoint_pool",
+        "single_flight",
+        "RequestEvent",
+        "on_request",
+        "on_response",
+        "on_retry",
+        "on_error",
+        "remove_hook",
+        "call_hooks",
+        "get_cache_ttl",
+        "is_past_epoch",
+        "get_error_message",
+        "koios_request",
+        "cached_request",
+        "get_retry_after",
+        "get_retry_delay",
+        "send_request",
+        "format_filter_value",
+        "format_filter",
+        "query_params",
+        "koios_get_request",
+        "koios_post_request",
+        "koios_post_bulk",
+        "BatchDispatcher",
+        "koios_post_batched",
+        "iter_pages",
+        "iter_keyset_pages",
+        "get_keyset_columns",
+        "keyset_params",
+        "format_rows",
+        "format_pages",
+        "koios_get_pages",
+        "koios_post_pages",
+        "join_pages",
+        "iter_results",
+    ],
+    "metrics": [
+        "LATENCY_BUCKETS",
+        "PayloadStats",
+        "Metrics",
+        "payload_stats",
+        "request_metrics",
+    ],
+    "network": [
+        "get_tip",
+        "get_genesis",
+        "get_totals",
+        "get_param_updates",
+        "get_reserve_withdrawals",
+        "iter_reserve_withdrawals",
+        "get_treasury_withdrawals",
+        "iter_treasury_withdrawals",
+    ],
+    "ogmios": ["get_ogmios"],
+    "pool": [
+        "get_pool_list",
+        "iter_pool_list",
+        "get_pool_info",
+        "get_pool_stake_snapshot",
+        "get_pool_delegators",
+        "iter_pool_delegators",
+        "get_pool_delegators_history",
+        "iter_pool_delegators_history",
+        "get_pool_blocks",
+        "iter_pool_blocks",
+        "get_pool_history",
+        "get_pool_updates",
+        "iter_pool_updates",
+        "get_pool_registrations",
+        "iter_pool_registrations",
+        "get_pool_retirements",
+        "iter_pool_retirements",
+        "get_pool_relays",
+        "iter_pool_relays",
+        "get_pool_metadata",
+        "get_retiring_pools",
+    ],
+    "schema": [
+        "INTERNED_FIELDS",
+        "AMOUNT_FIELDS",
+        "Record",
+        "get_record_type",
+        "make_record",
+        "to_records",
+        "parse_amounts",
+        "DictColumn",
+        "make_column",
+        "concat_columns",
+        "Columns",
+        "to_columns",
+    ],
+    "script": [
+        "get_script_info",
+        "get_native_script_list",
+        "iter_native_script_list",
+        "get_plutus_script_list",
+        "iter_plutus_script_list",
+        "get_script_redeemers",
+        "get_script_utxos",
+        "iter_script_utxos",
+        "get_datum_info",
+    ],
+    "store": [
+        "CLOSED_EPOCH_DEPTH",
+        "TIP_REFRESH_TIME",
+        "ChainStore",
+        "get_chain_store",
+        "get_stored_tip",
+        "is_closed_epoch",
+        "koios_post_stored",
+        "confirmed_rows",
+        "confirmed_txs",
+        "found_rows",
+        "koios_get_stored_epoch",
+    ],
+    "transactions": [
+        "get_utxo_info",
+        "get_tx_info",
+        "get_tx_metadata",
+        "get_tx_metalabels",
+        "iter_tx_metalabels",
+        "submit_tx",
+        "get_tx_status",
+    ],
+}
+_modules = {name: module for module, names in _exports.items() for name in names}
+__all__ = list(_modules)
+
+
+def __getattr__(name: str):
+    """
+    Import the module defining a public name of the package on first access
+    :param name: The name
+    :return: The value of the name
+    """
+    module = _modules.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """
+    List the names of the package, including the ones not imported yet
+    :return: The list of names
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -1,42 +1,61 @@
 """Account section functions"""
-from typing import Union
+from typing import Iterator, Union
 
 from .library import *
 
 
-def get_account_list(offset: int = 0, limit: int = 0) -> list:
+def get_account_list(
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#get-/account_list
     Get a list of all stake addresses that have at least 1 transaction
     :param offset: (optional) The offset to start from
     :param limit: (optional) The maximum number of accounts to return
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"script_hash": ("not.is", None)}, default: all rows
     :returns: The list of account (stake address) IDs
     """
+    return join_pages(iter_account_list(offset, limit, fields, filters, pages=True))
+
+
+def iter_account_list(
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/account_list
+    Iterate over the results of get_account_list as each page is received
+    :param offset: (optional) The offset to start from
+    :param limit: (optional) The maximum number of accounts to return
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"script_hash": ("not.is", None)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of account (stake address) IDs
+    """
     url = API_BASE_URL + "/account_list"
     parameters = {}
-    account_list = []
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        account_list += resp
-        if len(resp) < API_RESP_COUNT:
-            if 0 < limit <= len(account_list):
-                account_list = account_list[0:limit]
-            break
-        else:
-            offset += len(resp)
-        if 0 < limit <= len(account_list):
-            account_list = account_list[0:limit]
-            break
-    return account_list
-
-
-def get_account_info(addr: Union[str, list]) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters), offset, limit),
+        pages,
+    )
+
+
+def get_account_info(
+    addr: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/account_info
     Get the account information for given stake addresses (accounts)
     :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"status": "registered"}, default: all rows
     :returns: The list of account information
     """
     url = API_BASE_URL + "/account_info"
@@ -45,15 +64,28 @@ def get_account_info(addr: Union[str, list]) -> list:
         parameters["_stake_addresses"] = addr
     else:
         parameters["_stake_addresses"] = [addr]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_batched(
+            url,
+            query_params({}, fields, filters),
+            parameters,
+            "_stake_addresses",
+            "stake_address",
+        ),
+    )
 
 
-def get_account_info_cached(addr: Union[str, list]) -> list:
+def get_account_info_cached(
+    addr: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/account_info_cached
     Get the cached account information for given stake addresses
     (effective for performance query against registered accounts)
     :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"status": "registered"}, default: all rows
     :returns: The list of account information
     """
     url = API_BASE_URL + "/account_info_cached"
@@ -62,11 +94,18 @@ def get_account_info_cached(addr: Union[str, list]) -> list:
         parameters["_stake_addresses"] = addr
     else:
         parameters["_stake_addresses"] = [addr]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
 
 
 def get_account_utxos(
-    addr: Union[str, list], extended: bool = False, offset: int = 0, limit: int = 0
+    addr: Union[str, list],
+    extended: bool = False,
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
 ) -> list:
     """
     https://api.koios.rest/#get-/account_utxos
@@ -74,66 +113,108 @@ def get_account_utxos(
     :param extended: (optional) Include certain optional fields are populated as a part of the call
     :param offset: (optional) The offset to start from
     :param limit: (optional) The maximum number of UTxOs to return
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
     :return: The list of all UTxOs for a given stake address (account)
     """
+    return join_pages(
+        iter_account_utxos(addr, extended, offset, limit, fields, filters, pages=True)
+    )
+
+
+def iter_account_utxos(
+    addr: Union[str, list],
+    extended: bool = False,
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/account_utxos
+    Iterate over the results of get_account_utxos as each page is received
+    :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
+    :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param offset: (optional) The offset to start from
+    :param limit: (optional) The maximum number of UTxOs to return
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of all UTxOs for a given stake address (account)
+    """
     url = API_BASE_URL + "/account_utxos"
     parameters = {}
-    qs_parameters = {"limit": API_RESP_COUNT}
     if isinstance(addr, list):
         parameters["_stake_addresses"] = addr
     else:
         parameters["_stake_addresses"] = [addr]
     parameters["_extended"] = str(extended).lower()
-    utxos = []
-    while True:
-        if offset > 0:
-            qs_parameters["offset"] = offset
-        resp = koios_post_request(url, qs_parameters, parameters)
-        utxos += resp
-        if len(resp) < API_RESP_COUNT:
-            if 0 < limit <= len(utxos):
-                utxos = utxos[0:limit]
-            break
-        else:
-            offset += len(resp)
-        if 0 < limit <= len(utxos):
-            utxos = utxos[0:limit]
-            break
-    return utxos
-
-
-def get_account_txs(addr: str, block_height: int = 0) -> list:
+    return iter_results(
+        koios_post_pages(
+            url, query_params({}, fields, filters), parameters, offset, limit
+        ),
+        pages,
+    )
+
+
+def get_account_txs(
+    addr: str,
+    block_height: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#get-/account_txs
     Get a list of all Txs for a given stake address (account)
     :param addr: Stake address
     :param block_height: (optional) Return only the transactions after this block height
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of transactions associated with stake address (account)
     """
+    return join_pages(iter_account_txs(addr, block_height, fields, filters, pages=True))
+
+
+def iter_account_txs(
+    addr: str,
+    block_height: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/account_txs
+    Iterate over the results of get_account_txs as each page is received
+    :param addr: Stake address
+    :param block_height: (optional) Return only the transactions after this block height
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of transactions associated with stake address (account)
+    """
     url = API_BASE_URL + "/account_txs"
     parameters = {"_stake_address": addr}
     if block_height > 0:
         parameters["_after_block_height"] = block_height
-    txs = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        txs += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return txs
-
-
-def get_account_rewards(addr: Union[str, list], epoch: int = 0) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_account_rewards(
+    addr: Union[str, list],
+    epoch: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/account_rewards
     Get the full rewards history (including MIR) for given stake addresses (accounts)
     :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
     :param epoch: (optional) Epoch, default: current epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of reward history information
     """
     url = API_BASE_URL + "/account_rewards"
@@ -144,15 +225,20 @@ def get_account_rewards(addr: Union[str, list], epoch: int = 0) -> list:
         parameters["_stake_addresses"] = [addr]
     if isinstance(epoch, int) and epoch > 0:
         parameters["_epoch_no"] = epoch
-    resp = koios_post_request(url, {}, parameters)
-    return resp
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
 
 
-def get_account_updates(addr: Union[str, list]) -> list:
+def get_account_updates(
+    addr: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/account_updates
     Get the account updates (registration, deregistration, delegation and withdrawals) for given stake addresses
     :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of account updates information
     """
     url = API_BASE_URL + "/account_updates"
@@ -161,11 +247,17 @@ def get_account_updates(addr: Union[str, list]) -> list:
         parameters["_stake_addresses"] = addr
     else:
         parameters["_stake_addresses"] = [addr]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
 
 
 def get_account_addresses(
-    addr: Union[str, list], first_only: bool = False, empty: bool = True
+    addr: Union[str, list],
+    first_only: bool = False,
+    empty: bool = True,
+    fields: Union[str, list] = None,
+    filters: dict = None,
 ) -> list:
     """
     https://api.koios.rest/#post-/account_addresses
@@ -173,6 +265,8 @@ def get_account_addresses(
     :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
     :param first_only: Return only the first address if True
     :param empty: Return also addresses with 0 balance if True
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of payment addresses
     """
     url = API_BASE_URL + "/account_addresses"
@@ -183,43 +277,64 @@ def get_account_addresses(
         parameters["_stake_addresses"] = [addr]
     parameters["_first_only"] = str(first_only).lower()
     parameters["_empty"] = str(empty).lower()
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
 
 
-def get_account_assets(addr: Union[str, list]) -> list:
+def get_account_assets(
+    addr: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/account_assets
     Get the native asset balance of given accounts
     :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"quantity": ("gt", 1)}, default: all rows
     :returns: The list of assets owned by account
     """
+    return join_pages(iter_account_assets(addr, fields, filters, pages=True))
+
+
+def iter_account_assets(
+    addr: Union[str, list],
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#post-/account_assets
+    Iterate over the results of get_account_assets as each page is received
+    :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"quantity": ("gt", 1)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of assets owned by account
+    """
     url = API_BASE_URL + "/account_assets"
     parameters = {}
-    qs_parameters = {"limit": API_RESP_COUNT}
     if isinstance(addr, list):
         parameters["_stake_addresses"] = addr
     else:
         parameters["_stake_addresses"] = [addr]
-    assets = []
-    offset = 0
-    while True:
-        if offset > 0:
-            qs_parameters["offset"] = offset
-        resp = koios_post_request(url, qs_parameters, parameters)
-        assets += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return assets
-
-
-def get_account_history(addr: Union[str, list], epoch: int = 0) -> list:
+    return iter_results(
+        koios_post_pages(url, query_params({}, fields, filters), parameters), pages
+    )
+
+
+def get_account_history(
+    addr: Union[str, list],
+    epoch: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/account_history
     Get the staking history of given stake addresses (accounts)
     :param addr: Stake address(es), as a string (for one address) or a list (for multiple addresses)
     :param epoch: (optional) Epoch to fetch information for, default: all epochs
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of active stake values per epoch
     """
     url = API_BASE_URL + "/account_history"
@@ -230,4 +345,6 @@ def get_account_history(addr: Union[str, list], epoch: int = 0) -> list:
         parameters["_stake_addresses"] = [addr]
     if epoch:
         parameters["_epoch_no"] = epoch
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
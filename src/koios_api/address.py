@@ -1,14 +1,18 @@
 """Address section functions"""
-from typing import Union
+from typing import Iterator, Union
 
 from .library import *
 
 
-def get_address_info(addr: Union[str, list]) -> list:
+def get_address_info(
+    addr: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/address_info
     Get address info - balance, associated stake address (if any) and UTxO set for given addresses
     :param addr: Payment address(es) as string (for one address) or list (for multiple addresses)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"stake_address": ("is", None)}, default: all rows
     :returns: The list of address information
     """
     url = API_BASE_URL + "/address_info"
@@ -17,107 +21,172 @@ def get_address_info(addr: Union[str, list]) -> list:
         parameters["_addresses"] = addr
     else:
         parameters["_addresses"] = [addr]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_batched(
+            url, query_params({}, fields, filters), parameters, "_addresses", "address"
+        ),
+    )
 
 
-def get_address_utxos(addr: Union[str, list], extended: bool = False) -> list:
+def get_address_utxos(
+    addr: Union[str, list],
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/address_utxos
     Get UTxO set for given addresses
     :param addr: Aaddress as string (for one address) or list (for multiple addresses)
     :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
     :returns: The list of address UTXOs
     """
+    return join_pages(iter_address_utxos(addr, extended, fields, filters, pages=True))
+
+
+def iter_address_utxos(
+    addr: Union[str, list],
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#post-/address_utxos
+    Iterate over the results of get_address_utxos as each page is received
+    :param addr: Aaddress as string (for one address) or list (for multiple addresses)
+    :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of address UTXOs
+    """
     url = API_BASE_URL + "/address_utxos"
     parameters = {}
-    qs_parameters = {"limit": API_RESP_COUNT}
     if isinstance(addr, list):
         parameters["_addresses"] = addr
     else:
         parameters["_addresses"] = [addr]
     parameters["_extended"] = str(extended).lower()
-    utxos = []
-    offset = 0
-    while True:
-        if offset > 0:
-            qs_parameters["offset"] = offset
-        resp = koios_post_request(url, qs_parameters, parameters)
-        utxos += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return utxos
-
-
-def get_credential_utxos(cred: Union[str, list], extended: bool = False) -> list:
+    return iter_results(
+        koios_post_pages(url, query_params({}, fields, filters), parameters), pages
+    )
+
+
+def get_credential_utxos(
+    cred: Union[str, list],
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/credential_utxos
     Get a list of UTxO against input payment credential array including their balances
     :param cred: Payment credential in hex format as string (for one credential) or list (for multiple credentials)
     :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
     :returns: The list of input payment credentials maps
     """
+    return join_pages(
+        iter_credential_utxos(cred, extended, fields, filters, pages=True)
+    )
+
+
+def iter_credential_utxos(
+    cred: Union[str, list],
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#post-/credential_utxos
+    Iterate over the results of get_credential_utxos as each page is received
+    :param cred: Payment credential in hex format as string (for one credential) or list (for multiple credentials)
+    :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of input payment credentials maps
+    """
     url = API_BASE_URL + "/credential_utxos"
     parameters = {}
-    qs_parameters = {"limit": API_RESP_COUNT}
     if isinstance(cred, list):
         parameters["_payment_credentials"] = cred
     else:
         parameters["_payment_credentials"] = [cred]
     parameters["_extended"] = str(extended).lower()
-    utxos = []
-    offset = 0
-    while True:
-        if offset > 0:
-            qs_parameters["offset"] = offset
-        resp = koios_post_request(url, qs_parameters, parameters)
-        utxos += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return utxos
-
-
-def get_address_txs(addr: Union[str, list], block_height: int = 0) -> list:
+    return iter_results(
+        koios_post_pages(url, query_params({}, fields, filters), parameters), pages
+    )
+
+
+def get_address_txs(
+    addr: Union[str, list],
+    block_height: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/address_txs
     Get the transaction hash list of input address array, optionally filtering after specified block height (inclusive)
     :param addr: Payment address(es) as string (for one address) or list (for multiple addresses)
     :param block_height: (optional) Return only the transactions after this block height
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of transaction hashes
     """
+    return join_pages(iter_address_txs(addr, block_height, fields, filters, pages=True))
+
+
+def iter_address_txs(
+    addr: Union[str, list],
+    block_height: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#post-/address_txs
+    Iterate over the results of get_address_txs as each page is received
+    :param addr: Payment address(es) as string (for one address) or list (for multiple addresses)
+    :param block_height: (optional) Return only the transactions after this block height
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of transaction hashes
+    """
     url = API_BASE_URL + "/address_txs"
     parameters = {}
-    qs_parameters = {"limit": API_RESP_COUNT}
     if isinstance(addr, list):
         parameters["_addresses"] = addr
     else:
         parameters["_addresses"] = [addr]
     if block_height > 0:
         parameters["_after_block_height"] = block_height
-    txs = []
-    offset = 0
-    while True:
-        if offset > 0:
-            qs_parameters["offset"] = offset
-        resp = koios_post_request(url, qs_parameters, parameters)
-        txs += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return txs
-
-
-def get_credential_txs(cred: Union[str, list], block_height: int = 0) -> list:
+    return iter_results(
+        koios_post_pages(url, query_params({}, fields, filters), parameters), pages
+    )
+
+
+def get_credential_txs(
+    cred: Union[str, list],
+    block_height: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/credential_txs
     Get the transaction hash list of input payment credential array,
     optionally filtering after specified block height (inclusive)
     :param cred: Credential(s) as string (for one credential) or list (for multiple credentials)
     :param block_height: (optional) Only fetch information after specific block height
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of transaction hashes
     """
     url = API_BASE_URL + "/credential_txs"
@@ -128,32 +197,46 @@ def get_credential_txs(cred: Union[str, list], block_height: int = 0) -> list:
         parameters["_payment_credentials"] = [cred]
     if block_height:
         parameters["_after_block_height"] = block_height
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
 
 
-def get_address_assets(addr: Union[str, list]) -> list:
+def get_address_assets(
+    addr: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/address_assets
     Get the list of all the assets (policy, name and quantity) for given addresses
     :param addr: Payment address(es) as string (for one address) or list (for multiple addresses)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"quantity": ("gt", 1)}, default: all rows
     :returns: The list of address-owned assets
     """
+    return join_pages(iter_address_assets(addr, fields, filters, pages=True))
+
+
+def iter_address_assets(
+    addr: Union[str, list],
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#post-/address_assets
+    Iterate over the results of get_address_assets as each page is received
+    :param addr: Payment address(es) as string (for one address) or list (for multiple addresses)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"quantity": ("gt", 1)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of address-owned assets
+    """
     url = API_BASE_URL + "/address_assets"
     parameters = {}
-    qs_parameters = {"limit": API_RESP_COUNT}
     if isinstance(addr, list):
         parameters["_addresses"] = addr
     else:
         parameters["_addresses"] = [addr]
-    assets = []
-    offset = 0
-    while True:
-        if offset > 0:
-            qs_parameters["offset"] = offset
-        resp = koios_post_request(url, qs_parameters, parameters)
-        assets += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return assets
+    return iter_results(
+        koios_post_pages(url, query_params({}, fields, filters), parameters), pages
+    )
@@ -1,101 +1,158 @@
 """Asset section functions"""
-from typing import Union
+from typing import Iterator, Union
 
 from .library import *
 
 
-def get_asset_list(policy: str = "", offset: int = 0, limit: int = 0) -> list:
+def get_asset_list(
+    policy: str = "",
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#get-/asset_list
     Get the list of all native assets (paginated)
     :param policy: Asset Policy (optional), default: all policies
     :param offset: The offset to start from (optional)
     :param limit: The maximum number of accounts to return (optional)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"asset_name_ascii": ("ilike", "*token*")}, default: all rows
     :returns: The list of policy IDs and asset names
     """
+    return join_pages(
+        iter_asset_list(policy, offset, limit, fields, filters, pages=True)
+    )
+
+
+def iter_asset_list(
+    policy: str = "",
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/asset_list
+    Iterate over the results of get_asset_list as each page is received
+    :param policy: Asset Policy (optional), default: all policies
+    :param offset: The offset to start from (optional)
+    :param limit: The maximum number of accounts to return (optional)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"asset_name_ascii": ("ilike", "*token*")}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of policy IDs and asset names
+    """
     url = API_BASE_URL + "/asset_list"
     parameters = {}
-    assets_names_hex = []
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        if isinstance(policy, str) and policy != "":
-            parameters["policy_id"] = "eq." + policy
-        resp = koios_get_request(url, parameters)
-        assets_names_hex += resp
-        if len(resp) < API_RESP_COUNT:
-            if 0 < limit <= len(assets_names_hex):
-                assets_names_hex = assets_names_hex[0:limit]
-            break
-        else:
-            offset += len(resp)
-        if 0 < limit <= len(assets_names_hex):
-            assets_names_hex = assets_names_hex[0:limit]
-            break
-    return assets_names_hex
+    if isinstance(policy, str) and policy != "":
+        parameters["policy_id"] = "eq." + policy
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters), offset, limit),
+        pages,
+    )
 
 
-def get_policy_asset_list(policy: str, offset: int = 0, limit: int = 0) -> list:
+def get_policy_asset_list(
+    policy: str,
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#get-/policy_asset_list
     Get the list of asset under the given policy (including balances)
     :param policy: Asset Policy
     :param offset: The offset to start from (optional)
     :param limit: The maximum number of accounts to return (optional)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"total_supply": ("gt", 1)}, default: all rows
     :returns: The list of detailed information of assets under the same policy
     """
+    return join_pages(
+        iter_policy_asset_list(policy, offset, limit, fields, filters, pages=True)
+    )
+
+
+def iter_policy_asset_list(
+    policy: str,
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/policy_asset_list
+    Iterate over the results of get_policy_asset_list as each page is received
+    :param policy: Asset Policy
+    :param offset: The offset to start from (optional)
+    :param limit: The maximum number of accounts to return (optional)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"total_supply": ("gt", 1)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of detailed information of assets under the same policy
+    """
     url = API_BASE_URL + "/policy_asset_info"
     parameters = {"_asset_policy": policy}
-    assets = []
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        assets += resp
-        if len(resp) < API_RESP_COUNT:
-            if 0 < limit <= len(assets):
-                assets = assets[0:limit]
-            break
-        else:
-            offset += len(resp)
-        if 0 < limit <= len(assets):
-            assets = assets[0:limit]
-            break
-    return assets
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters), offset, limit),
+        pages,
+    )
 
 
-def get_asset_token_registry(logo: bool = True) -> list:
+def get_asset_token_registry(
+    logo: bool = True, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/asset_token_registry
     Get a list of assets registered via token registry on github
     :param logo: Include the logo in the response if True, otherwise skip it
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"ticker": ("in", ["HOSKY", "MIN"])}, default: all rows
     :returns: The list of token registry information for each asset
     """
+    return join_pages(iter_asset_token_registry(logo, fields, filters, pages=True))
+
+
+def iter_asset_token_registry(
+    logo: bool = True,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/asset_token_registry
+    Iterate over the results of get_asset_token_registry as each page is received
+    :param logo: Include the logo in the response if True, otherwise skip it
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"ticker": ("in", ["HOSKY", "MIN"])}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of token registry information for each asset
+    """
     url = API_BASE_URL + "/asset_token_registry"
     parameters = {"order": "policy_id.asc,asset_name.asc"}
-    assets_token_registry = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        if not logo:
-            parameters[
-                "select"
-            ] = "policy_id,asset_name,asset_name_ascii,ticker,description,url,decimals"
-        resp = koios_get_request(url, parameters)
-        assets_token_registry += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return assets_token_registry
+    if not logo:
+        parameters[
+            "select"
+        ] = "policy_id,asset_name,asset_name_ascii,ticker,description,url,decimals"
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
-def get_asset_info(assets: Union[str, list]) -> list:
+def get_asset_info(
+    assets: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/asset_info
     Get the information of a list of assets including first minting & token registry metadata
     :param assets: Asset list in the format [policy.name_hex]
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"total_supply": ("gt", 1)}, default: all rows
     :returns: List of detailed asset information
     """
     url = API_BASE_URL + "/asset_info"
@@ -107,20 +164,51 @@ def get_asset_info(assets: Union[str, list]) -> list:
     for asset in asset_list:
         asset_split = asset.split(".")
         parameters["_asset_list"].append([asset_split[0], asset_split[1]])
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_bulk(
+            url, query_params({}, fields, filters), parameters, "_asset_list"
+        ),
+    )
 
 
-def get_asset_utxos(assets: Union[str, list], extended: bool = False) -> list:
+def get_asset_utxos(
+    assets: Union[str, list],
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/asset_utxos
     Get the UTXO information of a list of assets
     :param assets: Assets as string (for one asset) or list (for multiple assets)
     :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
     :returns: The list UTXOs for given asset list
     """
+    return join_pages(iter_asset_utxos(assets, extended, fields, filters, pages=True))
+
+
+def iter_asset_utxos(
+    assets: Union[str, list],
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#post-/asset_utxos
+    Iterate over the results of get_asset_utxos as each page is received
+    :param assets: Assets as string (for one asset) or list (for multiple assets)
+    :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of UTXOs for given asset list
+    """
     url = API_BASE_URL + "/asset_utxos"
     parameters = {"_asset_list": []}
-    qs_parameters = {"limit": API_RESP_COUNT}
     if isinstance(assets, str):
         asset_list = [assets]
     else:
@@ -129,169 +217,256 @@ def get_asset_utxos(assets: Union[str, list], extended: bool = False) -> list:
         asset_split = asset.split(".")
         parameters["_asset_list"].append([asset_split[0], asset_split[1]])
     parameters["_extended"] = str(extended).lower()
-    utxos = []
-    offset = 0
-    while True:
-        if offset > 0:
-            qs_parameters["offset"] = offset
-        resp = koios_post_request(url, qs_parameters, parameters)
-        utxos += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return utxos
+    return iter_results(
+        koios_post_pages(url, query_params({}, fields, filters), parameters), pages
+    )
 
 
-def get_asset_history(policy: str, name: str = "") -> list:
+def get_asset_history(
+    policy: str, name: str = "", fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/asset_history
     Get the mint/burn history of an asset
     :param policy: Asset Policy
     :param name: Asset Name in hexadecimal format (optional), default: all policy assets
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of asset mint/burn history
     """
+    return join_pages(iter_asset_history(policy, name, fields, filters, pages=True))
+
+
+def iter_asset_history(
+    policy: str,
+    name: str = "",
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/asset_history
+    Iterate over the results of get_asset_history as each page is received
+    :param policy: Asset Policy
+    :param name: Asset Name in hexadecimal format (optional), default: all policy assets
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of asset mint/burn history
+    """
     url = API_BASE_URL + "/asset_history"
     parameters = {"_asset_policy": policy}
     if isinstance(name, str) and name != "":
         parameters["_asset_name"] = name
-    assets = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        assets += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return assets
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
-def get_asset_addresses(policy: str, name: str = "") -> list:
+def get_asset_addresses(
+    policy: str, name: str = "", fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/asset_addresses
     Get the list of all addresses holding a given asset
     :param policy: Asset Policy
     :param name: Asset Name in hexadecimal format (optional), default: all policy assets
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"quantity": ("gt", 10**6)}, default: all rows
     :returns: The list of payment addresses holding the given token (including balances)
     """
+    return join_pages(iter_asset_addresses(policy, name, fields, filters, pages=True))
+
+
+def iter_asset_addresses(
+    policy: str,
+    name: str = "",
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/asset_addresses
+    Iterate over the results of get_asset_addresses as each page is received
+    :param policy: Asset Policy
+    :param name: Asset Name in hexadecimal format (optional), default: all policy assets
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"quantity": ("gt", 10**6)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of payment addresses holding the given token (including balances)
+    """
     url = API_BASE_URL + "/asset_addresses"
     parameters = {"_asset_policy": policy}
     if isinstance(name, str) and name != "":
         parameters["_asset_name"] = name
-    wallets = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        wallets += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return wallets
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
-def get_asset_nft_address(policy: str, name: str = "") -> list:
+def get_asset_nft_address(
+    policy: str, name: str = "", fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/asset_nft_address
     Get the address where specified NFT currently reside on
     :param policy: Asset Policy
     :param name: Asset Name in hexadecimal format
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of payment addresses currently holding the given NFT
     """
+    return join_pages(iter_asset_nft_address(policy, name, fields, filters, pages=True))
+
+
+def iter_asset_nft_address(
+    policy: str,
+    name: str = "",
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/asset_nft_address
+    Iterate over the results of get_asset_nft_address as each page is received
+    :param policy: Asset Policy
+    :param name: Asset Name in hexadecimal format
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of payment addresses currently holding the given NFT
+    """
     url = API_BASE_URL + "/asset_nft_address"
     parameters = {"_asset_policy": policy, "_asset_name": name}
-    wallets = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        wallets += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return wallets
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
-def get_policy_asset_addresses(policy: str, offset: int = 0, limit: int = 0) -> list:
+def get_policy_asset_addresses(
+    policy: str,
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#get-/policy_asset_addresses
     Get the list of addresses with quantity for each asset on the given policy
     :param policy: Asset Policy
     :param offset: The offset to start from (optional)
     :param limit: The maximum number of accounts to return (optional)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"quantity": ("gt", 10**6)}, default: all rows
     :returns: The list of asset names and payment addresses for the given policy (including balances)
     """
+    return join_pages(
+        iter_policy_asset_addresses(policy, offset, limit, fields, filters, pages=True)
+    )
+
+
+def iter_policy_asset_addresses(
+    policy: str,
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/policy_asset_addresses
+    Iterate over the results of get_policy_asset_addresses as each page is received
+    :param policy: Asset Policy
+    :param offset: The offset to start from (optional)
+    :param limit: The maximum number of accounts to return (optional)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"quantity": ("gt", 10**6)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of asset names and payment addresses for the given policy (including balances)
+    """
     url = API_BASE_URL + "/policy_asset_addresses"
     parameters = {"_asset_policy": policy}
-    asset_addresses = []
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        asset_addresses += resp
-        if len(resp) < API_RESP_COUNT:
-            if 0 < limit <= len(asset_addresses):
-                asset_addresses = asset_addresses[0:limit]
-            break
-        else:
-            offset += len(resp)
-        if 0 < limit <= len(asset_addresses):
-            asset_addresses = asset_addresses[0:limit]
-            break
-    return asset_addresses
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters), offset, limit),
+        pages,
+    )
 
 
-def get_policy_asset_info(policy: str, offset: int = 0, limit: int = 0) -> list:
+def get_policy_asset_info(
+    policy: str,
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#get-/policy_asset_info
     Get the information for all assets under the same policy
     :param policy: Asset Policy
     :param offset: The offset to start from (optional)
     :param limit: The maximum number of accounts to return (optional)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"total_supply": ("gt", 1)}, default: all rows
     :returns: The list of detailed information of assets under the same policy
     """
+    return join_pages(
+        iter_policy_asset_info(policy, offset, limit, fields, filters, pages=True)
+    )
+
+
+def iter_policy_asset_info(
+    policy: str,
+    offset: int = 0,
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/policy_asset_info
+    Iterate over the results of get_policy_asset_info as each page is received
+    :param policy: Asset Policy
+    :param offset: The offset to start from (optional)
+    :param limit: The maximum number of accounts to return (optional)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"total_supply": ("gt", 1)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of detailed information of assets under the same policy
+    """
     url = API_BASE_URL + "/policy_asset_info"
     parameters = {"_asset_policy": policy}
-    assets = []
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        assets += resp
-        if len(resp) < API_RESP_COUNT:
-            if 0 < limit <= len(assets):
-                assets = assets[0:limit]
-            break
-        else:
-            offset += len(resp)
-        if 0 < limit <= len(assets):
-            assets = assets[0:limit]
-            break
-    return assets
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters), offset, limit),
+        pages,
+    )
 
 
-def get_asset_summary(policy: str, name: str = "") -> list:
+def get_asset_summary(
+    policy: str, name: str = "", fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     Get the summary of an asset (total transactions exclude minting/total wallets
     include only wallets with asset balance)
     :param policy: Asset Policy
     :param name: Asset Name in hexadecimal format (optional), default: all policy assets
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of asset summary information
     """
     url = API_BASE_URL + "/asset_summary"
     parameters = {"_asset_policy": policy, "_asset_name": name}
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
 
 
 def get_asset_txs(
-    policy: str, name: str = "", block_height: int = 0, history: bool = False
+    policy: str,
+    name: str = "",
+    block_height: int = 0,
+    history: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
 ) -> list:
     """
     Get the list of all asset transaction hashes (the newest first)
@@ -299,8 +474,35 @@ def get_asset_txs(
     :param name: Asset Name in hexadecimal format (optional), default: all policy assets
     :param block: (optional) Return only the transactions after this block
     :param history: (optional) Include all historical transactions, setting to false includes only the non-empty ones
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of Tx hashes that included the given asset (latest first)
     """
+    return join_pages(
+        iter_asset_txs(policy, name, block_height, history, fields, filters, pages=True)
+    )
+
+
+def iter_asset_txs(
+    policy: str,
+    name: str = "",
+    block_height: int = 0,
+    history: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    Iterate over the results of get_asset_txs as each page is received
+    :param policy: Asset Policy
+    :param name: Asset Name in hexadecimal format (optional), default: all policy assets
+    :param block: (optional) Return only the transactions after this block
+    :param history: (optional) Include all historical transactions, setting to false includes only the non-empty ones
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of Tx hashes that included the given asset (latest first)
+    """
     url = API_BASE_URL + "/asset_txs"
     parameters = {
         "_asset_policy": policy,
@@ -308,18 +510,9 @@ def get_asset_txs(
         "_after_block_height": block_height,
         "_history": str(history).lower(),
     }
-    assets_txs = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        assets_txs += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return assets_txs
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
 def get_asset_address_list(policy: str, name: str = "") -> list:
@@ -331,7 +524,8 @@ def get_asset_address_list(policy: str, name: str = "") -> list:
     :param name: Asset Name in hexadecimal format (optional), default: all policy assets
     :returns: List of maps with the wallets holding the asset and the amount of assets per wallet
     """
-    url = API_BASE_URL + f"/asset_address_list?_asset_policy={policy}"
+    client = get_client()
+    url = client.API_BASE_URL + f"/asset_address_list?_asset_policy={policy}"
     if isinstance(name, str) and name != "":
         url += f"&_asset_name={name}"
     wallets = []
@@ -340,20 +534,20 @@ def get_asset_address_list(policy: str, name: str = "") -> list:
         paginated_url = url + f"&offset={offset}"
         while True:
             try:
-                response = requests.get(paginated_url, timeout=REQUEST_TIMEOUT)
+                response = client.get_session(url).get(
+                    paginated_url, timeout=client.REQUEST_TIMEOUT
+                )
                 if response.status_code == 200:
-                    resp = json.loads(response.text)
+                    resp = decode_json(response.content)
                     break
                 else:
                     logger.warning(f"status code: {response.status_code}, retrying...")
             except Exception as exc:
-                logger.exception(
-                    f"Exception in {inspect.getframeinfo(inspect.currentframe()).function}: {exc}"
-                )
-                sleep(SLEEP_TIME)
+                logger.exception(f"Exception in get_asset_address_list: {exc}")
+                sleep(client.SLEEP_TIME)
                 logger.warning(f"offset: {offset}, retrying...")
         wallets += resp
-        if len(resp) < API_RESP_COUNT:
+        if len(resp) < client.API_RESP_COUNT:
             break
         else:
             offset += len(resp)
@@ -368,27 +562,28 @@ def get_asset_policy_info(policy: str) -> list:
     :param policy: Asset Policy
     :returns: List of maps with the policy assets
     """
-    url = API_BASE_URL + f"/asset_policy_info?_asset_policy={policy}"
+    client = get_client()
+    url = client.API_BASE_URL + f"/asset_policy_info?_asset_policy={policy}"
     assets = []
     offset = 0
     while True:
         paginated_url = url + f"&offset={offset}"
         while True:
             try:
-                response = requests.get(paginated_url, timeout=REQUEST_TIMEOUT)
+                response = client.get_session(url).get(
+                    paginated_url, timeout=client.REQUEST_TIMEOUT
+                )
                 if response.status_code == 200:
-                    resp = json.loads(response.text)
+                    resp = decode_json(response.content)
                     break
                 else:
                     logger.warning(f"status code: {response.status_code}, retrying...")
             except Exception as exc:
-                logger.exception(
-                    f"Exception in {inspect.getframeinfo(inspect.currentframe()).function}: {exc}"
-                )
-                sleep(SLEEP_TIME)
+                logger.exception(f"Exception in get_asset_policy_info: {exc}")
+                sleep(client.SLEEP_TIME)
                 logger.warning(f"offset: {offset}, retrying...")
         assets += resp
-        if len(resp) < API_RESP_COUNT:
+        if len(resp) < client.API_RESP_COUNT:
             break
         else:
             offset += len(resp)
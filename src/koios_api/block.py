@@ -1,43 +1,60 @@
 """Block section functions"""
-from typing import Union
+from typing import Iterator, Union
 
 from .library import *
+from .store import *
 
 
-def get_blocks(limit: int = 0) -> list:
+def get_blocks(
+    limit: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/blocks
     Get summarised details about all blocks (paginated - latest first)
     :param limit: the limit of the returned blocks number
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": 400}, default: all rows
     :returns: The list of block information (the newest first)
     """
+    return join_pages(iter_blocks(limit, fields, filters, pages=True))
+
+
+def iter_blocks(
+    limit: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/blocks
+    Iterate over the results of get_blocks as each page is received
+    :param limit: the limit of the returned blocks number
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": 400}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of block information (the newest first)
+    """
     url = API_BASE_URL + "/blocks"
     parameters = {}
-    blocks = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        if isinstance(limit, int) and limit > 0:
-            parameters["limit"] = limit
-        resp = koios_get_request(url, parameters)
-        blocks += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-        if isinstance(limit, int) and len(blocks) > limit:
-            break
     if isinstance(limit, int) and limit > 0:
-        blocks = blocks[0:limit]
-    return blocks
+        parameters["limit"] = limit
+    else:
+        limit = get_client().API_RESP_COUNT
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters), limit=limit),
+        pages,
+    )
 
 
-def get_block_info(block: Union[str, list]) -> list:
+def get_block_info(
+    block: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/block_info
     Get detailed information about a specific block
     :param block: Block hash as string (for one block) or list of block hashes (for multiple blocks)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"tx_count": ("gt", 0)}, default: all rows
     :returns: The list of detailed block information
     """
     url = API_BASE_URL + "/block_info"
@@ -46,14 +63,28 @@ def get_block_info(block: Union[str, list]) -> list:
         parameters["_block_hashes"] = block
     else:
         parameters["_block_hashes"] = [block]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_stored(
+            url,
+            query_params({}, fields, filters),
+            parameters,
+            "_block_hashes",
+            lambda row: row["hash"],
+            confirmed_rows("hash"),
+        ),
+    )
 
 
-def get_block_txs(block: Union[str, list]) -> list:
+def get_block_txs(
+    block: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/block_txs
     Get a list of all transactions included in provided blocks
     :param block: Block hash as string (for one block) or list of block hashes (for multiple blocks)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of transactions hashes
     """
     url = API_BASE_URL + "/block_txs"
@@ -62,4 +93,14 @@ def get_block_txs(block: Union[str, list]) -> list:
         parameters["_block_hashes"] = block
     else:
         parameters["_block_hashes"] = [block]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_stored(
+            url,
+            query_params({}, fields, filters),
+            parameters,
+            "_block_hashes",
+            lambda row: row["block_hash"],
+            confirmed_rows("block_hash"),
+        ),
+    )
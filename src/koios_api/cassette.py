@@ -0,0 +1,208 @@
+"""Record/replay transport"""
+import base64
+import json
+import os
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable
+from urllib.parse import urlsplit
+
+
+class CassetteError(LookupError):
+    """
+    No response was recorded for a request replayed from a cassette
+    """
+
+
+def request_key(method: str, url: str, params: dict, data=None) -> str:
+    """
+    Get the key identifying a request in a cassette: the method, the path of the URL
+    (so that the responses recorded from one Koios instance can be replayed for another one),
+    the query string parameters and the body
+    :param method: HTTP method ("GET" or "POST")
+    :param url: URL
+    :param params: Parameters of the query string
+    :param data: (optional) Body of the request
+    :return: The key
+    """
+    if isinstance(data, bytes):
+        data = data.decode("latin-1")
+    return json.dumps(
+        [
+            method,
+            urlsplit(url).path,
+            sorted(
+                (
+                    key,
+                    [str(item) for item in value]
+                    if isinstance(value, list)
+                    else str(value),
+                )
+                for key, value in params.items()
+            ),
+            data,
+        ]
+    )
+
+
+class CassetteResponse:
+    """
+    Response replayed from a cassette, with the attributes of a requests.Response
+    used by the request layer
+    """
+
+    def __init__(self, interaction: dict, url: str):
+        from requests.structures import CaseInsensitiveDict
+
+        self.url = url
+        self.status_code = interaction["status"]
+        self.reason = interaction.get("reason", "")
+        self.headers = CaseInsensitiveDict(interaction.get("headers", {}))
+        if "body_base64" in interaction:
+            self.content = base64.b64decode(interaction["body_base64"])
+        else:
+            self.content = interaction["body"].encode()
+        self.elapsed = interaction.get("elapsed", 0.0)
+        self.raw = _RecordedBody(interaction.get("wire_bytes", len(self.content)))
+
+    @property
+    def text(self) -> str:
+        """
+        The body of the response as a string
+        """
+        return self.content.decode("utf-8", "replace")
+
+
+class _RecordedBody:
+    """
+    Stand-in for the raw body of a replayed response, giving its recorded size on the wire
+    """
+
+    def __init__(self, wire_bytes: int):
+        self.wire_bytes = wire_bytes
+
+    def tell(self) -> int:
+        return self.wire_bytes
+
+
+class Cassette:
+    """
+    Transport recording the responses of Koios API to a cassette file (JSON Lines, one request
+    and its response per line) or replaying them from it, without sending any request.
+    In record mode, the requests are sent by the wrapped transport. In replay mode,
+    the responses recorded for the same request are returned in recorded order (the last one
+    is repeated), after waiting for their recorded latency if replay_timing is True.
+    The "auto" mode replays the cassette if the file exists, and records it otherwise
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "auto",
+        transport: Callable = None,
+        replay_timing: bool = False,
+    ):
+        if mode == "auto":
+            mode = "replay" if os.path.exists(path) else "record"
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        if mode == "record" and transport is None:
+            raise ValueError("Recording a cassette needs a transport")
+        self.path = path
+        self.mode = mode
+        self.transport = transport
+        self.replay_timing = replay_timing
+        self._interactions = {}
+        self._replayed = {}
+        self._lock = Lock()
+        self._file = None
+        if mode == "replay":
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self._interactions.setdefault(interaction["key"], []).append(
+                            interaction
+                        )
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+
+    def __call__(
+        self, method: str, url: str, params: dict, data=None, headers: dict = None
+    ):
+        """
+        Send (and record) or replay a request
+        :param method: HTTP method ("GET" or "POST")
+        :param url: URL
+        :param params: Parameters to include in the query string
+        :param data: (optional) Body of the request
+        :param headers: (optional) Headers to include in the request
+        :return: The response
+        :raises CassetteError: If no response was recorded for the request in replay mode
+        """
+        key = request_key(method, url, params, data)
+        if self.mode == "replay":
+            return self.replay(key, url)
+        start = monotonic()
+        response = self.transport(method, url, params, data, headers)
+        self.record(key, response, monotonic() - start)
+        return response
+
+    def record(self, key: str, response, elapsed: float) -> None:
+        """
+        Append a response to the cassette file
+        :param key: The key of the request
+        :param response: The response
+        :param elapsed: The latency of the response, in seconds
+        """
+        interaction = {
+            "key": key,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in ("content-encoding", "content-length")
+            },
+            "elapsed": round(elapsed, 6),
+        }
+        try:
+            interaction["wire_bytes"] = response.raw.tell()
+        except (AttributeError, OSError, ValueError):
+            interaction["wire_bytes"] = len(response.content)
+        try:
+            interaction["body"] = response.content.decode()
+        except UnicodeDecodeError:
+            interaction["body_base64"] = base64.b64encode(response.content).decode()
+        line = json.dumps(interaction, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def replay(self, key: str, url: str) -> CassetteResponse:
+        """
+        Get the next recorded response for a request
+        :param key: The key of the request
+        :param url: URL
+        :return: The response
+        :raises CassetteError: If no response was recorded for the request
+        """
+        interactions = self._interactions.get(key)
+        if not interactions:
+            raise CassetteError(f"No response recorded in {self.path} for {key}")
+        with self._lock:
+            index = self._replayed.get(key, 0)
+            self._replayed[key] = index + 1
+        interaction = interactions[min(index, len(interactions) - 1)]
+        if self.replay_timing:
+            sleep(interaction.get("elapsed", 0.0))
+        return CassetteResponse(interaction, url)
+
+    def close(self) -> None:
+        """
+        Close the cassette file
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -1,14 +1,24 @@
 """Epoch section functions"""
+from typing import Union
+
 from .library import *
+from .store import *
 
 
-def get_epoch_info(epoch: int = 0, include_next_epoch: bool = False) -> list:
+def get_epoch_info(
+    epoch: int = 0,
+    include_next_epoch: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#get-/epoch_info
     Get the epoch information, all epochs if no epoch specified
     :param epoch: (optional) Epoch
     :param include_next_epoch: (optional) Include information about nearing but not yet started epoch,
     to get access to active stake snapshot information if available
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"blk_count": ("gt", 21000)}, default: all rows
     :returns: The list of detailed summary for each epoch
     """
     url = API_BASE_URL + "/epoch_info"
@@ -17,32 +27,48 @@ def get_epoch_info(epoch: int = 0, include_next_epoch: bool = False) -> list:
         parameters["_epoch_no"] = epoch
     if isinstance(include_next_epoch, bool):
         parameters["_include_next_epoch"] = str(include_next_epoch).lower()
-    return koios_get_request(url, parameters)
+    return format_rows(
+        url,
+        koios_get_stored_epoch(url, query_params(parameters, fields, filters), epoch),
+    )
 
 
-def get_epoch_params(epoch: int = 0) -> list:
+def get_epoch_params(
+    epoch: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/epoch_params
     Get the protocol parameters for specific epoch, returns information about all epochs if no epoch specified
     :param epoch: (optional) Epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"protocol_major": ("gte", 9)}, default: all rows
     :returns: The list of protocol parameters for each epoch
     """
     url = API_BASE_URL + "/epoch_params"
     parameters = {}
     if isinstance(epoch, int) and epoch > 0:
         parameters["_epoch_no"] = epoch
-    return koios_get_request(url, parameters)
+    return format_rows(
+        url,
+        koios_get_stored_epoch(url, query_params(parameters, fields, filters), epoch),
+    )
 
 
-def get_epoch_block_protocols(epoch: int = 0) -> list:
+def get_epoch_block_protocols(
+    epoch: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/epoch_block_protocols
     Get the information about block protocol distribution in epoch
     :param epoch: (optional) Epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"proto_major": ("gte", 9)}, default: all rows
     :returns: The list of distinct block protocol versions counts in epoch
     """
     url = API_BASE_URL + "/epoch_block_protocols"
     parameters = {}
     if isinstance(epoch, int) and epoch > 0:
         parameters["_epoch_no"] = epoch
-    return koios_get_request(url, parameters)
+    return format_rows(
+        url, koios_get_request(url, query_params(parameters, fields, filters))
+    )
@@ -1,14 +1,881 @@
 """Library functions"""
-import inspect
+import importlib
 import json
-from time import sleep
-
-import requests
+import random
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import update_wrapper
+from threading import Condition, Event, Lock
+from time import monotonic, sleep
+from typing import Callable, Iterable, Iterator, Optional, Union
+from urllib.parse import urlsplit
 
 from .__config__ import *
+from .cassette import *
+from .metrics import *
+from .schema import *
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of inputs sent per request by koios_post_bulk, for each bulk endpoint
+BULK_BATCH_SIZES = {
+    "account_info": 500,
+    "address_info": 500,
+    "asset_info": 500,
+    "block_info": 500,
+    "datum_info": 500,
+    "script_info": 500,
+    "tx_info": 100,
+    "utxo_info": 500,
+}
+
+# Time to live (in seconds) of the cached responses, for the endpoints not using CACHE_TTL
+CACHE_TTLS = {
+    "tip": 5,
+    "genesis": 86400,
+    "param_updates": 3600,
+}
+# Endpoints returning data that does not change anymore for past epochs
+CLOSED_EPOCH_ENDPOINTS = ["epoch_params", "epoch_block_protocols"]
+CLOSED_EPOCH_CACHE_TTL = 86400
+# Status codes (besides the 5xx ones) after which the request is retried
+RETRYABLE_STATUS_CODES = [408, 425, 429]
+# Endpoints whose responses are never cached
+UNCACHED_ENDPOINTS = ["submittx", "ogmios"]
+# Columns identifying the rows of the endpoints ordered by block height, used by keyset pagination
+KEYSET_COLUMNS = {
+    "account_txs": ["block_height", "tx_hash"],
+    "account_utxos": ["block_height", "tx_hash", "tx_index"],
+    "address_txs": ["block_height", "tx_hash"],
+    "address_utxos": ["block_height", "tx_hash", "tx_index"],
+    "asset_txs": ["block_height", "tx_hash"],
+    "asset_utxos": ["block_height", "tx_hash", "tx_index"],
+    "blocks": ["block_height"],
+    "credential_txs": ["block_height", "tx_hash"],
+    "credential_utxos": ["block_height", "tx_hash", "tx_index"],
+    "pool_blocks": ["block_height"],
+    "pool_registrations": ["block_height", "tx_hash"],
+    "pool_retirements": ["block_height", "tx_hash"],
+    "script_utxos": ["block_height", "tx_hash", "tx_index"],
+}
+# PostgREST operators supported in the filters of the endpoint functions (with an optional "not." prefix)
+FILTER_OPERATORS = ["eq", "neq", "gt", "gte", "lt", "lte", "in", "like", "ilike", "is"]
+LOGICAL_OPERATORS = ["and", "or", "not.and", "not.or"]
+
+_json_decoder = json.loads
+_active_client = ContextVar("koios_api_client", default=None)
+_endpoint_functions = {}
+_request_hooks = []
+_response_hooks = []
+_retry_hooks = []
+_error_hooks = []
+
+
+def set_json_decoder(decoder) -> None:
+    """
+    Set the function used to decode the JSON responses
+    :param decoder: A function taking the body of a response as bytes and returning the decoded object,
+    or the name of a supported decoder: "json" (standard library), "orjson",
+    or "auto" (orjson if it is installed, otherwise the standard library)
+    """
+    global _json_decoder
+    if decoder == "auto":
+        decoder = "orjson" if orjson is not None else "json"
+    if decoder == "json":
+        decoder = json.loads
+    elif decoder == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        decoder = orjson.loads
+    _json_decoder = decoder
+
+
+def decode_json(content: bytes):
+    """
+    Decode a JSON response body, without decoding it to a string first
+    :param content: The body of the response
+    :return: The decoded object
+    """
+    return _json_decoder(content)
+
+
+set_json_decoder(JSON_DECODER)
+
+
+def get_accept_encoding(accept_encoding: str = None) -> str:
+    """
+    Get the value of the Accept-Encoding header sent with the requests, from ACCEPT_ENCODING:
+    "auto" for all the encodings that can be decoded (gzip and deflate, br if brotli is installed
+    and zstd if zstandard is installed), "identity" for no compression,
+    or a comma-separated list of encodings (the ones that cannot be decoded are ignored)
+    :param accept_encoding: (optional) The setting to use, default: ACCEPT_ENCODING of the current client
+    :return: The Accept-Encoding header value
+    """
+    from urllib3.util.request import ACCEPT_ENCODING as DECODABLE_ENCODINGS
+
+    if accept_encoding is None:
+        accept_encoding = get_client().ACCEPT_ENCODING
+    decodable = DECODABLE_ENCODINGS.split(",")
+    if accept_encoding == "auto":
+        return ", ".join(decodable)
+    encodings = []
+    for encoding in accept_encoding.split(","):
+        encoding = encoding.strip()
+        if encoding in decodable or encoding == "identity":
+            encodings.append(encoding)
+        elif encoding:
+            logger.warning(f"Accept-Encoding: no decoder available for {encoding}")
+    return ", ".join(encodings) or "identity"
+
+
+def get_session(url: str) -> "requests.Session":
+    """
+    Get the session of the current client for the base URL (scheme and host) of the given URL
+    (see KoiosClient.get_session)
+    :param url: URL
+    :return: The session to use for requests to the URL
+    """
+    return get_client().get_session(url)
+
+
+def close_sessions() -> None:
+    """
+    Close the sessions of the current client and their pooled connections
+    (new sessions are created on the next request)
+    """
+    get_client().close_sessions()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of response bodies, where each entry expires after its own time to live,
+    limited to max_entries entries and max_bytes bytes in total
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        """
+        Get a response body from the cache
+        :param key: The key of the request
+        :return: The response body, or None if it is not in the cache or has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: tuple, content: bytes, ttl: float) -> None:
+        """
+        Add a response body to the cache, evicting the least recently used entries if needed
+        :param key: The key of the request
+        :param content: The response body
+        :param ttl: The time to live of the entry, in seconds
+        """
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (monotonic() + ttl, content)
+            self._size += len(content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """
+        Remove all the entries from the cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: tuple) -> None:
+        self._size -= len(self._entries.pop(key)[1])
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all threads, allowing bursts of up to burst requests
+    and on average rate requests per second (no limit if rate is 0)
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """
+        Take a token from the bucket, waiting until it is available
+        """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Empty the bucket so that no request is sent by any thread for the given time
+        :param seconds: The time to wait before the next request
+        """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+def get_wire_size(response: "requests.Response") -> int:
+    """
+    Get the number of bytes of the response body read from the connection,
+    before decompression (after the body has been read)
+    :param response: The response
+    :return: The size of the body on the wire
+    """
+    try:
+        return response.raw.tell()
+    except (AttributeError, OSError, ValueError):
+        return len(response.content)
+
+
+class EndpointPool:
+    """
+    Base URLs of the Koios instances to use, with their health: the average latency
+    of the recent requests, and a circuit breaker that stops sending requests to an instance
+    for cooldown seconds after failure_threshold consecutive failures
+    """
+
+    def __init__(self, base_urls: list, failure_threshold: int, cooldown: float):
+        self.base_urls = list(base_urls)
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._health = {
+            base_url: {"latency": 0.0, "failures": 0, "open_until": 0.0}
+            for base_url in self.base_urls
+        }
+        self._lock = Lock()
+
+    def choose(self, exclude: Iterable = ()) -> str:
+        """
+        Choose the instance with the lowest recent latency among the ones whose circuit is closed
+        (the instances not used yet are tried first). If all circuits are open,
+        choose the instance whose circuit closes first
+        :param exclude: (optional) Instances to avoid if there are other ones available
+        :return: The base URL of the instance
+        """
+        now = monotonic()
+        with self._lock:
+            candidates = [
+                base_url for base_url in self.base_urls if base_url not in exclude
+            ] or self.base_urls
+            available = [
+                base_url
+                for base_url in candidates
+                if self._health[base_url]["open_until"] <= now
+            ]
+            if not available:
+                return min(
+                    candidates,
+                    key=lambda base_url: self._health[base_url]["open_until"],
+                )
+            return min(
+                available, key=lambda base_url: self._health[base_url]["latency"]
+            )
+
+    def record_success(self, base_url: str, latency: float) -> None:
+        """
+        Record a successful request to an instance
+        :param base_url: The base URL of the instance
+        :param latency: The duration of the request, in seconds
+        """
+        with self._lock:
+            health = self._health[base_url]
+            if health["latency"]:
+                health["latency"] = 0.8 * health["latency"] + 0.2 * latency
+            else:
+                health["latency"] = latency
+            health["failures"] = 0
+            health["open_until"] = 0.0
+
+    def record_failure(self, base_url: str) -> None:
+        """
+        Record a failed request to an instance, opening its circuit after too many failures
+        :param base_url: The base URL of the instance
+        """
+        with self._lock:
+            health = self._health[base_url]
+            health["failures"] += 1
+            if health["failures"] >= self.failure_threshold:
+                health["open_until"] = monotonic() + self.cooldown
+                logger.warning(
+                    f"{base_url} failed {health['failures']} times in a row, "
+                    f"not used for {self.cooldown} second(s)"
+                )
+
+    def status(self) -> dict:
+        """
+        Get the health of the instances
+        :return: A dictionary with the latency, consecutive failures and circuit state of each instance
+        """
+        now = monotonic()
+        with self._lock:
+            return {
+                base_url: {
+                    "latency": health["latency"],
+                    "failures": health["failures"],
+                    "open": health["open_until"] > now,
+                }
+                for base_url, health in self._health.items()
+            }
+
+
+class SingleFlight:
+    """
+    Coalescing of identical calls: while a call is in progress, the threads making
+    the same call wait for it and get its result instead of making their own
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = Lock()
+
+    def do(self, key: tuple, function: Callable):
+        """
+        Call the function, unless a call with the same key is already in progress,
+        in which case wait for it and return its result (or raise its exception)
+        :param key: The key identifying the call
+        :param function: The function to call
+        :return: The result of the function
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": Event(), "result": None, "error": None}
+                self._calls[key] = call
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+        try:
+            call["result"] = function()
+        except BaseException as exc:
+            call["error"] = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+        return call["result"]
+
+
+# Settings of KoiosClient, named after the configuration variables giving their default values
+CLIENT_SETTINGS = [
+    "KOIOS_API_TOKEN",
+    "SLEEP_TIME",
+    "API_RESP_COUNT",
+    "REQUEST_TIMEOUT",
+    "POOL_SIZE",
+    "KEEP_ALIVE",
+    "ACCEPT_ENCODING",
+    "PARALLEL_PAGES",
+    "KEYSET_PAGINATION",
+    "BULK_WORKERS",
+    "ROW_FORMAT",
+    "NUMERIC_AMOUNTS",
+    "RESPONSE_CACHE",
+    "CACHE_TTL",
+    "CACHE_MAX_ENTRIES",
+    "CACHE_MAX_BYTES",
+    "SINGLE_FLIGHT",
+    "MICRO_BATCH_WINDOW",
+    "MICRO_BATCH_SIZE",
+    "CHAIN_STORE",
+    "CONFIRMATION_DEPTH",
+    "RETRY_ATTEMPTS",
+    "RETRY_DEADLINE",
+    "RETRY_MAX_SLEEP",
+    "RATE_LIMIT",
+    "RATE_BURST",
+    "CIRCUIT_BREAKER_THRESHOLD",
+    "CIRCUIT_BREAKER_COOLDOWN",
+    "CASSETTE",
+    "CASSETTE_MODE",
+    "REPLAY_TIMING",
+    "API_BASE_URL",
+]
+# Modules whose get_*, iter_* and submit_* functions are available as KoiosClient methods
+ENDPOINT_MODULES = [
+    "account",
+    "address",
+    "asset",
+    "block",
+    "epoch",
+    "network",
+    "ogmios",
+    "pool",
+    "script",
+    "transactions",
+]
+
+
+class KoiosClient:
+    """
+    Client for Koios API with its own settings, sessions (connection pools), response cache,
+    rate limiter, instance health, micro-batching and chain store, so that several clients
+    (e.g. one per API token) can be used in the same process without sharing any of them.
+    The settings are passed as keyword arguments named after the configuration variables
+    (CLIENT_SETTINGS), the other ones are taken from the environment variables.
+    The endpoint functions of the package are available as methods (client.get_tip()...),
+    and the module-level functions use the default client, or the client activated with use().
+    The requests are sent by the transport attribute, a function with the arguments
+    of http_request returning a response, which records them to the CASSETTE file
+    or replays them from it if CASSETTE is set
+    """
+
+    def __init__(self, **settings):
+        unknown = [name for name in settings if name not in CLIENT_SETTINGS]
+        if unknown:
+            raise TypeError(f"Unknown KoiosClient setting(s): {', '.join(unknown)}")
+        for name in CLIENT_SETTINGS:
+            setattr(self, name, settings.get(name, globals()[name]))
+        if "API_BASE_URL" not in settings:
+            base_urls = API_BASE_URLS
+        elif isinstance(self.API_BASE_URL, str):
+            base_urls = self.API_BASE_URL.split(",")
+        else:
+            base_urls = self.API_BASE_URL
+        self.API_BASE_URLS = [url.strip() for url in base_urls if url.strip()]
+        if not self.API_BASE_URLS:
+            raise ValueError("KoiosClient needs at least one API_BASE_URL")
+        self.API_BASE_URL = self.API_BASE_URLS[0]
+        self.response_cache = ResponseCache(
+            self.CACHE_MAX_ENTRIES, self.CACHE_MAX_BYTES
+        )
+        self.rate_limiter = RateLimiter(self.RATE_LIMIT, self.RATE_BURST)
+        self.endpoint_pool = EndpointPool(
+            self.API_BASE_URLS,
+            self.CIRCUIT_BREAKER_THRESHOLD,
+            self.CIRCUIT_BREAKER_COOLDOWN,
+        )
+        self.single_flight = SingleFlight()
+        self.tip_epoch = 0
+        self.chain_store = None
+        self.stored_tip = None
+        self.tip_lock = Lock()
+        self.dispatchers = {}
+        self.lock = Lock()
+        self._sessions = {}
+        self._sessions_lock = Lock()
+        self.transport = self.http_request
+        if self.CASSETTE:
+            self.transport = Cassette(
+                self.CASSETTE, self.CASSETTE_MODE, self.http_request, self.REPLAY_TIMING
+            )
+
+    def __repr__(self) -> str:
+        return f"KoiosClient(API_BASE_URL={self.API_BASE_URL!r})"
+
+    def __enter__(self) -> "KoiosClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getattr__(self, name: str):
+        function = None
+        if name.startswith(("get_", "iter_", "submit_")):
+            function = get_endpoint_functions().get(name)
+        if function is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        method = client_method(function)
+        setattr(KoiosClient, name, method)
+        return getattr(self, name)
+
+    def __dir__(self) -> list:
+        return sorted(set(super().__dir__()) | set(get_endpoint_functions()))
+
+    def get_session(self, url: str) -> "requests.Session":
+        """
+        Get the session shared by all threads for the base URL (scheme and host) of the given URL.
+        The session keeps a pool of up to POOL_SIZE keep-alive connections to the host,
+        so that consecutive requests (e.g. the pages of a paginated call) reuse the TCP+TLS connection.
+        requests is only imported when the first session is created, to keep the package import fast
+        :param url: URL
+        :return: The session to use for requests to the URL
+        """
+        base_url = "{0.scheme}://{0.netloc}".format(urlsplit(url))
+        session = self._sessions.get(base_url)
+        if session is None:
+            with self._sessions_lock:
+                session = self._sessions.get(base_url)
+                if session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=1, pool_maxsize=self.POOL_SIZE
+                    )
+                    session.mount(base_url, adapter)
+                    if not self.KEEP_ALIVE:
+                        session.headers["Connection"] = "close"
+                    session.headers["Accept-Encoding"] = get_accept_encoding(
+                        self.ACCEPT_ENCODING
+                    )
+                    self._sessions[base_url] = session
+        return session
+
+    def close_sessions(self) -> None:
+        """
+        Close all the sessions of the client and their pooled connections
+        (new sessions are created on the next request)
+        """
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def http_request(
+        self, method: str, url: str, params: dict, data=None, headers: dict = None
+    ) -> "requests.Response":
+        """
+        Send a request with the session of the client for the URL, with REQUEST_TIMEOUT
+        :param method: HTTP method ("GET" or "POST")
+        :param url: URL
+        :param params: Parameters to include in the query string
+        :param data: (optional) Body of the request
+        :param headers: (optional) Headers to include in the request
+        :return: The response
+        """
+        return self.get_session(url).request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            data=data,
+            timeout=self.REQUEST_TIMEOUT,
+        )
+
+    def close(self) -> None:
+        """
+        Close the sessions, the cassette and the chain store of the client
+        """
+        self.close_sessions()
+        if isinstance(self.transport, Cassette):
+            self.transport.close()
+        with self.lock:
+            if self.chain_store is not None:
+                self.chain_store.close()
+                self.chain_store = None
+
+    @contextmanager
+    def use(self) -> Iterator["KoiosClient"]:
+        """
+        Use the client for the module-level functions called in the with block
+        (in the current thread or asyncio task, and in the worker threads they start)
+        :return: A context manager returning the client
+        """
+        token = _active_client.set(self)
+        try:
+            yield self
+        finally:
+            _active_client.reset(token)
+
+    def iterate(self, iterator: Iterator) -> Iterator:
+        """
+        Iterate over a generator of the package using the client, so that the pages
+        requested while iterating outside of a use() block are sent by the client
+        :param iterator: The generator (e.g. returned by an iter_* function)
+        :return: A generator of the same items
+        """
+        try:
+            while True:
+                with self.use():
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                with self.use():
+                    close()
+
+
+def get_endpoint_functions() -> dict:
+    """
+    Get the endpoint functions of the package (importing their modules on first call)
+    :return: A dictionary with the get_*, iter_* and submit_* functions of ENDPOINT_MODULES by name
+    """
+    if not _endpoint_functions:
+        functions = {}
+        for module_name in ENDPOINT_MODULES:
+            module = importlib.import_module("." + module_name, __package__)
+            for name, function in vars(module).items():
+                if (
+                    name.startswith(("get_", "iter_", "submit_"))
+                    and callable(function)
+                    and getattr(function, "__module__", None) == module.__name__
+                ):
+                    functions[name] = function
+        _endpoint_functions.update(functions)
+    return _endpoint_functions
 
 
-def get_error_message(response: requests.Response) -> str:
+def client_method(function: Callable) -> Callable:
+    """
+    Get a KoiosClient method calling an endpoint function with the client
+    (and iterating with the client over the generators returned by the iter_* functions)
+    :param function: The endpoint function
+    :return: The method
+    """
+
+    def method(self, *args, **kwargs):
+        with self.use():
+            result = function(*args, **kwargs)
+        if isinstance(result, Iterator):
+            return self.iterate(result)
+        return result
+
+    return update_wrapper(method, function)
+
+
+def get_client() -> KoiosClient:
+    """
+    Get the client used by the module-level functions: the client activated with
+    KoiosClient.use() in the current context, or the default client
+    (configured by the environment variables)
+    :return: The client
+    """
+    client = _active_client.get()
+    if client is None:
+        return default_client
+    return client
+
+
+def submit_in_context(executor: Executor, function: Callable, *args) -> Future:
+    """
+    Submit a call to an executor, to run in a copy of the current context
+    (so that the worker thread uses the client of the caller)
+    :param executor: The executor
+    :param function: The function to call
+    :param args: The arguments of the function
+    :return: The future of the call
+    """
+    return executor.submit(copy_context().run, function, *args)
+
+
+default_client = KoiosClient()
+# Shared objects of the default client, kept for the code using them directly
+response_cache = default_client.response_cache
+rate_limiter = default_client.rate_limiter
+endpoint_pool = default_client.endpoint_pool
+single_flight = default_client.single_flight
+
+
+class RequestEvent:
+    """
+    Event passed to the hooks registered with on_request, on_response, on_retry and on_error.
+    The attributes not relevant for an event are None
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "params",
+        "attempt",
+        "status_code",
+        "latency",
+        "response",
+        "error",
+        "delay",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        attempt: int,
+        status_code: int = None,
+        latency: float = None,
+        response: "requests.Response" = None,
+        error: Exception = None,
+        delay: float = None,
+    ):
+        self.method = method
+        self.url = url
+        self.params = params
+        self.attempt = attempt
+        self.status_code = status_code
+        self.latency = latency
+        self.response = response
+        self.error = error
+        self.delay = delay
+
+    def __repr__(self) -> str:
+        return (
+            "RequestEvent("
+            + ", ".join(
+                f"{name}={getattr(self, name)!r}"
+                for name in self.__slots__
+                if getattr(self, name) is not None
+            )
+            + ")"
+        )
+
+
+def on_request(hook: Callable[[RequestEvent], None]) -> Callable:
+    """
+    Register a function called before each attempt of a request to Koios API,
+    with the method, URL (of the instance the request is sent to), query string parameters
+    and attempt number (starting at 1). It can be used as a decorator
+    :param hook: The function
+    :return: The function
+    """
+    _request_hooks.append(hook)
+    return hook
+
+
+def on_response(hook: Callable[[RequestEvent], None]) -> Callable:
+    """
+    Register a function called after each response received from Koios API (including
+    error responses), with the status code, the latency in seconds and the response.
+    It can be used as a decorator
+    :param hook: The function
+    :return: The function
+    """
+    _response_hooks.append(hook)
+    return hook
+
+
+def on_retry(hook: Callable[[RequestEvent], None]) -> Callable:
+    """
+    Register a function called when a request is going to be retried,
+    with the error and the delay in seconds before the next attempt.
+    It can be used as a decorator
+    :param hook: The function
+    :return: The function
+    """
+    _retry_hooks.append(hook)
+    return hook
+
+
+def on_error(hook: Callable[[RequestEvent], None]) -> Callable:
+    """
+    Register a function called when a request fails (error not retried, or attempts exhausted),
+    with the error raised. It can be used as a decorator
+    :param hook: The function
+    :return: The function
+    """
+    _error_hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook: Callable[[RequestEvent], None]) -> None:
+    """
+    Unregister a function registered with on_request, on_response, on_retry or on_error
+    :param hook: The function
+    """
+    for hooks in (_request_hooks, _response_hooks, _retry_hooks, _error_hooks):
+        while hook in hooks:
+            hooks.remove(hook)
+
+
+def call_hooks(hooks: list, event: RequestEvent) -> None:
+    """
+    Call the registered hooks with an event, logging (and ignoring) their exceptions
+    :param hooks: The list of hooks
+    :param event: The event
+    """
+    for hook in list(hooks):
+        try:
+            hook(event)
+        except Exception as exc:
+            logger.warning(f"Exception in hook {hook!r}: {exc}")
+
+
+def get_cache_ttl(url: str, params: dict) -> float:
+    """
+    Get the time to live of the cached response for a request
+    :param url: URL
+    :param params: Parameters included in the query string
+    :return: The time to live in seconds (0 if the response should not be cached)
+    """
+    client = get_client()
+    endpoint = url.rsplit("/", 1)[-1]
+    if endpoint in UNCACHED_ENDPOINTS:
+        return 0
+    if (
+        endpoint in CLOSED_EPOCH_ENDPOINTS
+        and "_epoch_no" in params
+        and is_past_epoch(int(params["_epoch_no"]))
+    ):
+        return CLOSED_EPOCH_CACHE_TTL
+    return CACHE_TTLS.get(endpoint, client.CACHE_TTL)
+
+
+def is_past_epoch(epoch: int) -> bool:
+    """
+    Check if an epoch has ended, from the epoch of the tip last seen by the current client
+    (in a response of /tip, or in the tip of the chain store), requesting the tip
+    if the epoch is not before it
+    :param epoch: The epoch
+    :return: True if the epoch is before the epoch of the tip (False if the tip cannot be requested)
+    """
+    client = get_client()
+    stored_tip = client.stored_tip
+    if stored_tip is not None and stored_tip["epoch_no"] > client.tip_epoch:
+        client.tip_epoch = stored_tip["epoch_no"]
+    if epoch < client.tip_epoch:
+        return True
+    try:
+        tip = koios_get_request(API_BASE_URL + "/tip", {})
+    except Exception as exc:
+        logger.warning(f"Could not get the tip to check if epoch {epoch} ended: {exc}")
+        return False
+    if tip and "epoch_no" in tip[0]:
+        client.tip_epoch = max(client.tip_epoch, tip[0]["epoch_no"])
+    return epoch < client.tip_epoch
+
+
+def get_error_message(response: "requests.Response") -> str:
     """
     Get the error message from the response
     :param response: The response to the request
@@ -16,7 +883,7 @@ def get_error_message(response: requests.Response) -> str:
     """
     try:
         error_message = json.loads(response.text)["message"]
-    except json.decoder.JSONDecodeError:
+    except (ValueError, KeyError, TypeError):
         error_message = response.text
         if not error_message:
             error_message = response.reason
@@ -25,6 +892,306 @@ def get_error_message(response: requests.Response) -> str:
     return error_message
 
 
+def koios_request(
+    method: str, url: str, params: dict, data=None, headers: dict = None
+) -> list:
+    """
+    Send a request to Koios API, or get its response from the cache if RESPONSE_CACHE is enabled,
+    and return the decoded body of the response.
+    If SINGLE_FLIGHT is enabled, the threads making the same request at the same time
+    share one request and its decoded response, which format_rows converts without modifying it
+    (the "dict" rows returned to the threads are still shared, and should then not be modified)
+    :param method: HTTP method ("GET" or "POST")
+    :param url: URL
+    :param params: Parameters to include in the query string
+    :param data: (optional) Body of the request
+    :param headers: (optional) Headers to include in the request
+    :return: A list with the body of the response
+    """
+    client = get_client()
+    if not client.RESPONSE_CACHE and not client.SINGLE_FLIGHT:
+        resp = decode_json(send_request(method, url, params, data, headers))
+    else:
+        key = (method, url, tuple(sorted((k, str(v)) for k, v in params.items())), data)
+        if client.SINGLE_FLIGHT:
+            resp = client.single_flight.do(
+                key, lambda: cached_request(key, method, url, params, data, headers)
+            )
+        else:
+            resp = cached_request(key, method, url, params, data, headers)
+    if isinstance(resp, list):
+        request_metrics.record_rows(url.rsplit("/", 1)[-1], len(resp))
+    return resp
+
+
+def cached_request(
+    key: tuple, method: str, url: str, params: dict, data=None, headers: dict = None
+) -> list:
+    """
+    Get the response of a request from the cache if RESPONSE_CACHE is enabled, otherwise
+    send it to Koios API (and add the response to the cache), and return the decoded body
+    :param key: The key of the request in the cache
+    :param method: HTTP method ("GET" or "POST")
+    :param url: URL
+    :param params: Parameters to include in the query string
+    :param data: (optional) Body of the request
+    :param headers: (optional) Headers to include in the request
+    :return: A list with the body of the response
+    """
+    client = get_client()
+    if not client.RESPONSE_CACHE:
+        return decode_json(send_request(method, url, params, data, headers))
+    content = client.response_cache.get(key)
+    if content is None:
+        content = send_request(method, url, params, data, headers)
+        client.response_cache.set(key, content, get_cache_ttl(url, params))
+    resp = decode_json(content)
+    if url.endswith("/tip") and resp and "epoch_no" in resp[0]:
+        client.tip_epoch = resp[0]["epoch_no"]
+    return resp
+
+
+def get_retry_after(response: "requests.Response") -> Optional[float]:
+    """
+    Get the time to wait before retrying the request, from the Retry-After header of the response
+    :param response: The response to the request
+    :return: The number of seconds to wait, or None if the response has no valid Retry-After header
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Get the time to wait before the next attempt of a request: the time requested by the server
+    if any, otherwise an exponential backoff from SLEEP_TIME with full jitter,
+    capped at RETRY_MAX_SLEEP in both cases
+    :param attempt: The number of attempts already made
+    :param retry_after: (optional) The time to wait requested by the server
+    :return: The number of seconds to wait
+    """
+    client = get_client()
+    if retry_after is not None:
+        return min(retry_after, client.RETRY_MAX_SLEEP)
+    return random.uniform(
+        0, min(client.RETRY_MAX_SLEEP, client.SLEEP_TIME * 2 ** (attempt - 1))
+    )
+
+
+def send_request(
+    method: str, url: str, params: dict, data=None, headers: dict = None
+) -> bytes:
+    """
+    Send a request to Koios API using the transport of the current client (the session
+    for the URL, or the cassette), after waiting for the rate limiter if RATE_LIMIT is set.
+    The requests to API_BASE_URL are sent to the healthiest instance of the API_BASE_URLS
+    of the client,
+    and retried on another instance if there are several ones.
+    Connection errors, timeouts, 5xx responses and 408/425/429 responses are retried
+    after get_retry_delay seconds (immediately if there is an instance not tried yet),
+    up to RETRY_ATTEMPTS attempts and RETRY_DEADLINE seconds in total (no limit if 0),
+    other error responses are not retried
+    :param method: HTTP method ("GET" or "POST")
+    :param url: URL
+    :param params: Parameters to include in the query string
+    :param data: (optional) Body of the request
+    :param headers: (optional) Headers to include in the request
+    :return: The body of the response
+    :raises requests.HTTPError: If the response is an error that is not retried,
+    or the last response when the attempts are exhausted
+    :raises requests.RequestException: The last exception when the attempts are exhausted
+    """
+    import requests
+
+    client = get_client()
+    endpoint_pool = client.endpoint_pool
+    if url.startswith(API_BASE_URL):
+        path = url[len(API_BASE_URL) :]
+    else:
+        path = None
+    endpoint = url.rsplit("/", 1)[-1]
+    tried = set()
+    start = monotonic()
+    attempt = 0
+    while True:
+        retry_after = None
+        if path is None:
+            base_url = None
+            request_url = url
+        else:
+            base_url = endpoint_pool.choose(tried)
+            request_url = base_url + path
+            tried.add(base_url)
+        client.rate_limiter.acquire()
+        if _request_hooks:
+            call_hooks(
+                _request_hooks, RequestEvent(method, request_url, params, attempt + 1)
+            )
+        request_start = monotonic()
+        try:
+            response = client.transport(method, request_url, params, data, headers)
+        except requests.RequestException as exc:
+            error = exc
+            request_metrics.record_request(
+                endpoint, "error", monotonic() - request_start
+            )
+            logger.warning(f"Exception in {method} {request_url}: {exc}")
+        else:
+            latency = monotonic() - request_start
+            request_metrics.record_request(endpoint, response.status_code, latency)
+            if _response_hooks:
+                call_hooks(
+                    _response_hooks,
+                    RequestEvent(
+                        method,
+                        request_url,
+                        params,
+                        attempt + 1,
+                        status_code=response.status_code,
+                        latency=latency,
+                        response=response,
+                    ),
+                )
+            if response.status_code == 200:
+                if base_url:
+                    endpoint_pool.record_success(base_url, latency)
+                payload_stats.record(
+                    endpoint, get_wire_size(response), len(response.content)
+                )
+                return response.content
+            error = requests.HTTPError(
+                f"status code: {response.status_code} ({get_error_message(response)})",
+                response=response,
+            )
+            if (
+                response.status_code < 500
+                and response.status_code not in RETRYABLE_STATUS_CODES
+            ):
+                if _error_hooks:
+                    call_hooks(
+                        _error_hooks,
+                        RequestEvent(
+                            method, request_url, params, attempt + 1, error=error
+                        ),
+                    )
+                raise error
+            logger.warning(str(error))
+            retry_after = get_retry_after(response)
+        if base_url:
+            endpoint_pool.record_failure(base_url)
+        attempt += 1
+        if path is not None and len(tried) < len(endpoint_pool.base_urls):
+            delay = 0
+        else:
+            delay = get_retry_delay(attempt, retry_after)
+            tried.clear()
+        if error.response is not None and error.response.status_code == 429:
+            client.rate_limiter.pause(delay)
+        if (0 < client.RETRY_ATTEMPTS <= attempt) or (
+            0 < client.RETRY_DEADLINE < monotonic() - start + delay
+        ):
+            logger.error(f"{method} {url} failed after {attempt} attempt(s)")
+            if _error_hooks:
+                call_hooks(
+                    _error_hooks,
+                    RequestEvent(method, request_url, params, attempt, error=error),
+                )
+            raise error
+        request_metrics.record_retry(endpoint)
+        if _retry_hooks:
+            call_hooks(
+                _retry_hooks,
+                RequestEvent(
+                    method, request_url, params, attempt, error=error, delay=delay
+                ),
+            )
+        offset = params.get("offset", 0)
+        logger.warning(f"offset: {offset}, retrying in {delay:.2f} second(s)...")
+        sleep(delay)
+
+
+def format_filter_value(value, nested: bool = False) -> str:
+    """
+    Format a value of a filter condition in PostgREST syntax
+    :param value: The value (None, a boolean, a number or a string)
+    :param nested: True inside a list or an "and"/"or" group, where the reserved characters are quoted
+    :return: The formatted value
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return str(value).lower()
+    value = str(value)
+    if nested and any(char in value for char in ',()"'):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return value
+
+
+def format_filter(column: str, condition, nested: bool = False) -> str:
+    """
+    Format a filter condition in PostgREST syntax
+    :param column: The column name, or "and"/"or" (or "not.and"/"not.or") for a group of conditions
+    :param condition: An (operator, value) tuple, e.g. ("gt", 10**12) or ("in", ["a", "b"]),
+    a value to compare with eq, or for a group a dictionary (or a list of dictionaries) of conditions
+    :param nested: True inside an "and"/"or" group
+    :return: The condition, as the value of the column parameter (or as an element of a group if nested)
+    """
+    if column in LOGICAL_OPERATORS:
+        groups = condition if isinstance(condition, list) else [condition]
+        conditions = ",".join(
+            format_filter(key, value, True)
+            for group in groups
+            for key, value in group.items()
+        )
+        return f"{column}({conditions})" if nested else f"({conditions})"
+    if not isinstance(condition, tuple):
+        condition = ("eq", condition)
+    operator, value = condition
+    name = operator[4:] if operator.startswith("not.") else operator
+    if name not in FILTER_OPERATORS:
+        raise ValueError(f"Unsupported filter operator for {column}: {operator}")
+    if name == "in":
+        value = "(" + ",".join(format_filter_value(item, True) for item in value) + ")"
+    else:
+        value = format_filter_value(value, nested)
+    if nested:
+        return f"{column}.{operator}.{value}"
+    return f"{operator}.{value}"
+
+
+def query_params(
+    params: dict, fields: Union[str, list] = None, filters: dict = None
+) -> dict:
+    """
+    Add the PostgREST options of an endpoint function to its query string parameters
+    :param params: Parameters to include in the query string
+    :param fields: (optional) Fields (columns) to return (select=), as a comma-separated string or a list
+    :param filters: (optional) Row filters, as a dictionary of conditions (see format_filter)
+    :return: The query string parameters
+    """
+    if fields:
+        params["select"] = fields if isinstance(fields, str) else ",".join(fields)
+    for column, condition in (filters or {}).items():
+        value = format_filter(column, condition)
+        if column not in params:
+            params[column] = value
+        elif isinstance(params[column], list):
+            params[column].append(value)
+        else:
+            params[column] = [params[column], value]
+    return params
+
+
 def koios_get_request(url: str, parameters: dict) -> list:
     """
     Create a GET request to Koios API using the "requests" library and return the text of the response as a list
@@ -33,8 +1200,9 @@ def koios_get_request(url: str, parameters: dict) -> list:
     :return: A list with the body of the response
     """
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
-    if KOIOS_API_TOKEN:
-        headers["Authorization"] = "Bearer " + KOIOS_API_TOKEN
+    token = get_client().KOIOS_API_TOKEN
+    if token:
+        headers["Authorization"] = "Bearer " + token
 
     ordered_requests = [
         "blocks",
@@ -45,34 +1213,9 @@ def koios_get_request(url: str, parameters: dict) -> list:
         "pool_retirements",
         "script_utxos",
     ]
-    if any(req in url for req in ordered_requests):
+    if any(req in url for req in ordered_requests) and "order" not in parameters:
         parameters["order"] = "block_height.asc"
-    while True:
-        try:
-            response = requests.get(
-                url, headers=headers, params=parameters, timeout=REQUEST_TIMEOUT
-            )
-            if response.status_code == 200:
-                resp = json.loads(response.text)
-                break
-            else:
-                error_message = get_error_message(response)
-                logger.warning(
-                    f"status code: {response.status_code} ({error_message}), retrying..."
-                )
-                logger.error(inspect.stack()[-1])
-                sleep(SLEEP_TIME)
-        except Exception as exc:
-            logger.exception(
-                f"Exception in {inspect.getframeinfo(inspect.currentframe()).function}: {exc}"
-            )
-            if "offset" in parameters:
-                offset = {parameters["offset"]}
-            else:
-                offset = 0
-            logger.warning(f"offset: {offset}, retrying in {SLEEP_TIME} second(s)...")
-            sleep(SLEEP_TIME)
-    return resp
+    return koios_request("GET", url, parameters, headers=headers)
 
 
 def koios_post_request(url: str, params: dict, parameters: dict, headers=None) -> list:
@@ -88,8 +1231,9 @@ def koios_post_request(url: str, params: dict, parameters: dict, headers=None) -
         headers = {}
     if not headers:
         headers = {"Accept": "application/json", "Content-Type": "application/json"}
-    if KOIOS_API_TOKEN:
-        headers["Authorization"] = "Bearer " + KOIOS_API_TOKEN
+    token = get_client().KOIOS_API_TOKEN
+    if token:
+        headers["Authorization"] = "Bearer " + token
     ordered_requests = [
         "utxo_info",
         "tx_info",
@@ -100,35 +1244,414 @@ def koios_post_request(url: str, params: dict, parameters: dict, headers=None) -
         "credential_txs",
         "asset_utxos",
     ]
-    if any(req in url for req in ordered_requests):
+    if any(req in url for req in ordered_requests) and "order" not in params:
         params["order"] = "block_height.asc"
-    while True:
+    data = json.dumps(parameters, sort_keys=True, separators=(",", ":"))
+    return koios_request("POST", url, params, data=data, headers=headers)
+
+
+def koios_post_bulk(url: str, params: dict, parameters: dict, key: str) -> list:
+    """
+    Create POST requests to Koios API for the input list parameters[key] split in batches
+    of the size set for the endpoint in BULK_BATCH_SIZES (API_RESP_COUNT for other endpoints),
+    send up to BULK_WORKERS of them at once, and return the results of the batches in input order
+    :param url: URL
+    :param params: Parameters to include in the query string
+    :param parameters: Parameters to include as data in the POST requests
+    :param key: The name of the parameter holding the input list
+    :return: A list with the bodies of the responses
+    """
+    client = get_client()
+    items = parameters[key]
+    batch_size = BULK_BATCH_SIZES.get(url.rsplit("/", 1)[-1], client.API_RESP_COUNT)
+    if len(items) <= batch_size:
+        return koios_post_request(url, params, parameters)
+    batches = []
+    for i in range(0, len(items), batch_size):
+        batch_parameters = dict(parameters)
+        batch_parameters[key] = items[i : i + batch_size]
+        batches.append(batch_parameters)
+    with ThreadPoolExecutor(
+        max_workers=min(client.BULK_WORKERS, len(batches))
+    ) as executor:
+        futures = [
+            submit_in_context(executor, koios_post_request, url, dict(params), batch)
+            for batch in batches
+        ]
+        return join_pages(future.result() for future in futures)
+
+
+class BatchDispatcher:
+    """
+    Micro-batching of single-item requests to a bulk endpoint: the items requested by
+    different threads during window seconds (or until max_items items are collected)
+    are sent as one bulk request by the send function, and each caller gets back
+    the rows of its own item (the rows whose row_key field is the item)
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list], list],
+        row_key: str,
+        window: float,
+        max_items: int,
+    ):
+        self.send = send
+        self.row_key = row_key
+        self.window = window
+        self.max_items = max_items
+        self._batch = []
+        self._condition = Condition()
+
+    def submit(self, item) -> list:
+        """
+        Add an item to the current batch and wait for the response of the bulk request
+        :param item: The item (e.g. a stake address)
+        :return: The list of rows returned for the item
+        """
+        call = {"done": Event(), "rows": [], "error": None}
+        with self._condition:
+            batch = self._batch
+            batch.append((item, call))
+            leader = len(batch) == 1
+            if len(batch) >= self.max_items:
+                self._batch = []
+                self._condition.notify_all()
+            if leader:
+                deadline = monotonic() + self.window
+                remaining = self.window
+                while self._batch is batch and remaining > 0:
+                    self._condition.wait(remaining)
+                    remaining = deadline - monotonic()
+                if self._batch is batch:
+                    self._batch = []
+        if leader:
+            self._send(batch)
+        call["done"].wait()
+        if call["error"] is not None:
+            raise call["error"]
+        return call["rows"]
+
+    def _send(self, batch: list) -> None:
+        items = list(dict.fromkeys(item for item, _ in batch))
         try:
-            response = requests.post(
-                url,
-                headers=headers,
-                params=params,
-                data=json.dumps(parameters),
-                timeout=REQUEST_TIMEOUT,
-            )
-            if response.status_code == 200:
-                resp = json.loads(response.text)
-                break
-            else:
-                error_message = get_error_message(response)
-                logger.warning(
-                    f"status code: {response.status_code} ({error_message}), retrying..."
-                )
-                logger.error(inspect.stack()[-1])
-                sleep(SLEEP_TIME)
+            rows = self.send(items)
         except Exception as exc:
-            logger.exception(
-                f"Exception in {inspect.getframeinfo(inspect.currentframe()).function}: {exc}"
-            )
-            if "offset" in parameters:
-                offset = {parameters["offset"]}
-            else:
-                offset = 0
-            logger.warning(f"offset: {offset}, retrying in {SLEEP_TIME} second(s)...")
-            sleep(SLEEP_TIME)
-    return resp
+            for _, call in batch:
+                call["error"] = exc
+                call["done"].set()
+            return
+        item_rows = {}
+        for row in rows:
+            item_rows.setdefault(row[self.row_key], []).append(row)
+        for item, call in batch:
+            call["rows"] = item_rows.get(item, [])
+            call["done"].set()
+
+
+def koios_post_batched(
+    url: str, params: dict, parameters: dict, key: str, row_key: str
+) -> list:
+    """
+    Create a POST request to a bulk endpoint of Koios API. If MICRO_BATCH_WINDOW is set,
+    a request for a single item is sent in a bulk request together with the single items
+    requested by other threads during MICRO_BATCH_WINDOW milliseconds (up to MICRO_BATCH_SIZE)
+    :param url: URL
+    :param params: Parameters to include in the query string (requests with a query string
+    are not batched, as the rows may not include row_key)
+    :param parameters: Parameters to include as data in the POST request
+    :param key: The name of the parameter holding the input list
+    :param row_key: The field of the returned rows holding the input item
+    :return: A list with the body of the response
+    """
+    client = get_client()
+    if (
+        client.MICRO_BATCH_WINDOW <= 0
+        or params
+        or len(parameters) != 1
+        or len(parameters[key]) != 1
+    ):
+        return koios_post_bulk(url, params, parameters, key)
+    dispatcher = client.dispatchers.get(url)
+    if dispatcher is None:
+        with client.lock:
+            dispatcher = client.dispatchers.get(url)
+            if dispatcher is None:
+                dispatcher = BatchDispatcher(
+                    lambda items: koios_post_bulk(url, {}, {key: items}, key),
+                    row_key,
+                    client.MICRO_BATCH_WINDOW / 1000,
+                    client.MICRO_BATCH_SIZE,
+                )
+                client.dispatchers[url] = dispatcher
+    return dispatcher.submit(parameters[key][0])
+
+
+def iter_pages(
+    fetch_page: Callable[[int], list],
+    offset: int = 0,
+    limit: int = 0,
+    parallel: int = 0,
+) -> Iterator[list]:
+    """
+    Iterate over the pages of a paginated request, in order, until a page shorter than
+    API_RESP_COUNT is received or limit rows were returned.
+    With parallel > 1, once the first page is full the next parallel pages are requested at once
+    (and the window is refilled as pages are returned), stopping at the first short page
+    :param fetch_page: Function returning the page starting at the offset passed as argument
+    :param offset: (optional) The offset to start from
+    :param limit: (optional) The maximum number of rows to return
+    :param parallel: (optional) The number of pages to request concurrently, default: PARALLEL_PAGES
+    :return: A generator of pages (lists of rows)
+    """
+    client = get_client()
+    page_size = client.API_RESP_COUNT
+    if not parallel:
+        parallel = client.PARALLEL_PAGES
+    start = offset
+    returned = 0
+    page = fetch_page(offset)
+    while True:
+        if 0 < limit <= returned + len(page):
+            yield page[0 : limit - returned]
+            return
+        yield page
+        returned += len(page)
+        if len(page) < page_size:
+            return
+        offset += len(page)
+        if parallel > 1:
+            break
+        page = fetch_page(offset)
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < parallel and (
+                    limit <= 0 or offset < start + limit
+                ):
+                    pending.append(submit_in_context(executor, fetch_page, offset))
+                    offset += page_size
+                page = pending.popleft().result()
+                if 0 < limit <= returned + len(page):
+                    yield page[0 : limit - returned]
+                    return
+                yield page
+                returned += len(page)
+                if len(page) < page_size:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def iter_keyset_pages(
+    fetch_page: Callable[[Optional[dict]], list], limit: int = 0
+) -> Iterator[list]:
+    """
+    Iterate over the pages of a paginated request ordered by a unique key (keyset pagination),
+    until a page shorter than API_RESP_COUNT is received or limit rows were returned.
+    Each page starts after the last row of the previous one instead of at an offset,
+    so deep pages are not slower and no row is skipped or repeated when rows are added meanwhile
+    :param fetch_page: Function returning the page starting after the row passed as argument
+    (the first page if None)
+    :param limit: (optional) The maximum number of rows to return
+    :return: A generator of pages (lists of rows)
+    """
+    page_size = get_client().API_RESP_COUNT
+    returned = 0
+    page = fetch_page(None)
+    while True:
+        if 0 < limit <= returned + len(page):
+            yield page[0 : limit - returned]
+            return
+        yield page
+        returned += len(page)
+        if len(page) < page_size:
+            return
+        page = fetch_page(page[-1])
+
+
+def get_keyset_columns(url: str, params: dict) -> Optional[list]:
+    """
+    Get the columns to use for keyset pagination of a request
+    :param url: URL
+    :param params: Parameters of the query string
+    :return: The key columns, or None if KEYSET_PAGINATION is not set, if the endpoint is not
+    ordered by block height, or if the query string already uses "or" or "order"
+    or does not select the key columns
+    """
+    columns = KEYSET_COLUMNS.get(url.rsplit("/", 1)[-1])
+    if (
+        not get_client().KEYSET_PAGINATION
+        or columns is None
+        or "or" in params
+        or "order" in params
+    ):
+        return None
+    if "select" in params:
+        selected = [field.strip() for field in params["select"].split(",")]
+        if "*" not in selected and not all(column in selected for column in columns):
+            return None
+    return columns
+
+
+def keyset_params(params: dict, columns: list, row: Optional[dict]) -> dict:
+    """
+    Get the query string parameters of a page for keyset pagination
+    :param params: Parameters of the query string
+    :param columns: The key columns
+    :param row: The last row of the previous page (None for the first page)
+    :return: The parameters ordering by the key columns and selecting the rows after the given row
+    """
+    page_params = dict(params, order=",".join(column + ".asc" for column in columns))
+    if row is None:
+        return page_params
+    if len(columns) == 1:
+        return query_params(page_params, filters={columns[0]: ("gt", row[columns[0]])})
+    conditions = []
+    for i, column in enumerate(columns):
+        condition = {key: row[key] for key in columns[:i]}
+        condition[column] = ("gt", row[column])
+        conditions.append({"and": condition} if i > 0 else condition)
+    return query_params(page_params, filters={"or": conditions})
+
+
+def format_rows(url: str, rows: list):
+    """
+    Convert the rows returned by an endpoint to the ROW_FORMAT of the current client:
+    "dict" (the decoded rows), "records" (Record objects, see to_records)
+    or "columns" (Columns, see to_columns), after converting the amounts to integers
+    if NUMERIC_AMOUNTS is set (see parse_amounts; the columns always store them as integers)
+    :param url: URL
+    :param rows: The decoded rows
+    :return: The rows in the output format
+    """
+    if not isinstance(rows, list):
+        return rows
+    client = get_client()
+    endpoint = url.rsplit("/", 1)[-1]
+    row_format = client.ROW_FORMAT
+    if row_format == "columns":
+        return to_columns(rows, endpoint)
+    if client.NUMERIC_AMOUNTS:
+        rows = parse_amounts(endpoint, rows)
+    if row_format == "dict":
+        return rows
+    if row_format == "records":
+        return to_records(endpoint, rows)
+    raise ValueError(f"Unsupported ROW_FORMAT: {row_format}")
+
+
+def format_pages(url: str, pages: Iterator[list]) -> Iterator:
+    """
+    Convert each page of a paginated request to the ROW_FORMAT of the current client
+    as it is received, so that the decoded rows of only one page are kept at a time
+    :param url: URL
+    :param pages: The pages (lists of decoded rows)
+    :return: A generator of pages in the output format
+    """
+    for page in pages:
+        yield format_rows(url, page)
+
+
+def koios_get_pages(
+    url: str, parameters: dict, offset: int = 0, limit: int = 0
+) -> Iterator[list]:
+    """
+    Iterate over the pages of a paginated GET request to Koios API
+    (with keyset pagination after the first page if KEYSET_PAGINATION is set),
+    in the ROW_FORMAT of the current client
+    :param url: URL
+    :param parameters: Parameters to include as data in the GET requests
+    :param offset: (optional) The offset to start from
+    :param limit: (optional) The maximum number of rows to return
+    :return: A generator of pages (lists of rows)
+    """
+    columns = get_keyset_columns(url, parameters)
+    if columns is not None:
+
+        def fetch_page_after(row: Optional[dict]) -> list:
+            page_parameters = {
+                "limit": get_client().API_RESP_COUNT,
+                **keyset_params(parameters, columns, row),
+            }
+            if row is None and offset > 0:
+                page_parameters["offset"] = offset
+            return koios_get_request(url, page_parameters)
+
+        return format_pages(url, iter_keyset_pages(fetch_page_after, limit))
+
+    def fetch_page(page_offset: int) -> list:
+        page_parameters = {"limit": get_client().API_RESP_COUNT, **parameters}
+        if page_offset > 0:
+            page_parameters["offset"] = page_offset
+        return koios_get_request(url, page_parameters)
+
+    return format_pages(url, iter_pages(fetch_page, offset, limit))
+
+
+def koios_post_pages(
+    url: str, params: dict, parameters: dict, offset: int = 0, limit: int = 0
+) -> Iterator[list]:
+    """
+    Iterate over the pages of a paginated POST request to Koios API
+    (with keyset pagination after the first page if KEYSET_PAGINATION is set),
+    in the ROW_FORMAT of the current client
+    :param url: URL
+    :param params: Parameters to include in the query string
+    :param parameters: Parameters to include as data in the POST requests
+    :param offset: (optional) The offset to start from
+    :param limit: (optional) The maximum number of rows to return
+    :return: A generator of pages (lists of rows)
+    """
+    columns = get_keyset_columns(url, params)
+    if columns is not None:
+
+        def fetch_page_after(row: Optional[dict]) -> list:
+            page_params = {
+                "limit": get_client().API_RESP_COUNT,
+                **keyset_params(params, columns, row),
+            }
+            if row is None and offset > 0:
+                page_params["offset"] = offset
+            return koios_post_request(url, page_params, parameters)
+
+        return format_pages(url, iter_keyset_pages(fetch_page_after, limit))
+
+    def fetch_page(page_offset: int) -> list:
+        page_params = {"limit": get_client().API_RESP_COUNT, **params}
+        if page_offset > 0:
+            page_params["offset"] = page_offset
+        return koios_post_request(url, page_params, parameters)
+
+    return format_pages(url, iter_pages(fetch_page, offset, limit))
+
+
+def join_pages(pages: Iterator[list]) -> Union[list, Columns]:
+    """
+    Join the pages of a paginated request into one list (or Columns, with ROW_FORMAT "columns")
+    :param pages: The pages (lists of rows, or Columns)
+    :return: The list of all rows (or the Columns of all rows)
+    """
+    rows = []
+    for page in pages:
+        if isinstance(rows, Columns):
+            rows.extend(page)
+        elif isinstance(page, Columns) and not rows:
+            rows = page
+        else:
+            rows += page
+    return rows
+
+
+def iter_results(pages: Iterator[list], yield_pages: bool = False) -> Iterator:
+    """
+    Iterate over the results of a paginated request
+    :param pages: The pages (lists of rows)
+    :param yield_pages: (optional) Yield each page instead of each row if True
+    :return: A generator of rows, or of pages if yield_pages is True
+    """
+    if yield_pages:
+        return pages
+    return (row for page in pages for row in page)
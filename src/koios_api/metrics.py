@@ -0,0 +1,222 @@
+"""Request metrics"""
+from threading import Lock
+
+# Upper bounds (in seconds) of the buckets of the request latency histograms
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+
+class PayloadStats:
+    """
+    Thread-safe count of the successful responses received from each endpoint,
+    with their total size on the wire (compressed) and after decompression
+    """
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = Lock()
+
+    def record(self, endpoint: str, wire_bytes: int, decoded_bytes: int) -> None:
+        """
+        Add a response to the statistics of an endpoint
+        :param endpoint: The endpoint name
+        :param wire_bytes: The size of the response body as received
+        :param decoded_bytes: The size of the response body after decompression
+        """
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, [0, 0, 0])
+            stats[0] += 1
+            stats[1] += wire_bytes
+            stats[2] += decoded_bytes
+
+    def snapshot(self) -> dict:
+        """
+        Get the statistics of all the endpoints
+        :return: A dictionary with the number of responses, the wire bytes
+        and the decoded bytes for each endpoint
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "responses": stats[0],
+                    "wire_bytes": stats[1],
+                    "decoded_bytes": stats[2],
+                }
+                for endpoint, stats in self._endpoints.items()
+            }
+
+    def clear(self) -> None:
+        """
+        Reset the statistics
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+
+class Metrics:
+    """
+    Thread-safe metrics of the requests sent to each endpoint: number of requests per status code
+    ("error" for connection errors and timeouts), latency histogram, retries,
+    number of rows returned, and the response bytes (on the wire and decompressed)
+    counted by its PayloadStats
+    """
+
+    def __init__(self, buckets: list = None, payload_stats: PayloadStats = None):
+        self.buckets = sorted(buckets if buckets is not None else LATENCY_BUCKETS)
+        self.payload_stats = (
+            payload_stats if payload_stats is not None else PayloadStats()
+        )
+        self._endpoints = {}
+        self._lock = Lock()
+
+    def _endpoint(self, endpoint: str) -> dict:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = {
+                "requests": 0,
+                "status_codes": {},
+                "retries": 0,
+                "latency": {
+                    "buckets": [0] * len(self.buckets),
+                    "sum": 0.0,
+                    "count": 0,
+                },
+                "rows": 0,
+            }
+            self._endpoints[endpoint] = stats
+        return stats
+
+    def record_request(self, endpoint: str, status, latency: float) -> None:
+        """
+        Add a request (one attempt) to the metrics of an endpoint
+        :param endpoint: The endpoint name
+        :param status: The status code of the response, or "error" if no response was received
+        :param latency: The time between sending the request and receiving the response, in seconds
+        """
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats["requests"] += 1
+            status = str(status)
+            stats["status_codes"][status] = stats["status_codes"].get(status, 0) + 1
+            latency_stats = stats["latency"]
+            for i, bound in enumerate(self.buckets):
+                if latency <= bound:
+                    latency_stats["buckets"][i] += 1
+                    break
+            latency_stats["sum"] += latency
+            latency_stats["count"] += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        """
+        Add a retry to the metrics of an endpoint
+        :param endpoint: The endpoint name
+        """
+        with self._lock:
+            self._endpoint(endpoint)["retries"] += 1
+
+    def record_rows(self, endpoint: str, rows: int) -> None:
+        """
+        Add the rows returned for a request to the metrics of an endpoint
+        :param endpoint: The endpoint name
+        :param rows: The number of rows
+        """
+        with self._lock:
+            self._endpoint(endpoint)["rows"] += rows
+
+    def snapshot(self) -> dict:
+        """
+        Get the metrics of all the endpoints
+        :return: A dictionary with the metrics of each endpoint, where the latency histogram
+        has the cumulative number of requests for each bucket upper bound
+        """
+        payloads = self.payload_stats.snapshot()
+        with self._lock:
+            snapshot = {}
+            for endpoint, stats in self._endpoints.items():
+                snapshot[endpoint] = dict(
+                    stats,
+                    status_codes=dict(stats["status_codes"]),
+                    latency={
+                        "buckets": self._cumulative(stats["latency"]["buckets"]),
+                        "sum": stats["latency"]["sum"],
+                        "count": stats["latency"]["count"],
+                    },
+                    wire_bytes=payloads.get(endpoint, {}).get("wire_bytes", 0),
+                    decoded_bytes=payloads.get(endpoint, {}).get("decoded_bytes", 0),
+                )
+            return snapshot
+
+    def prometheus(self) -> str:
+        """
+        Get the metrics of all the endpoints in the Prometheus text exposition format
+        :return: The metrics
+        """
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP koios_requests_total Requests sent to Koios API.",
+            "# TYPE koios_requests_total counter",
+        ]
+        for endpoint, stats in snapshot.items():
+            for status, count in sorted(stats["status_codes"].items()):
+                lines.append(
+                    f'koios_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}'
+                )
+        lines += [
+            "# HELP koios_request_duration_seconds Latency of the requests sent to Koios API.",
+            "# TYPE koios_request_duration_seconds histogram",
+        ]
+        for endpoint, stats in snapshot.items():
+            latency = stats["latency"]
+            for bound, count in latency["buckets"].items():
+                lines.append(
+                    f"koios_request_duration_seconds_bucket"
+                    f'{{endpoint="{endpoint}",le="{bound}"}} {count}'
+                )
+            lines.append(
+                f"koios_request_duration_seconds_bucket"
+                f'{{endpoint="{endpoint}",le="+Inf"}} {latency["count"]}'
+            )
+            lines.append(
+                f'koios_request_duration_seconds_sum{{endpoint="{endpoint}"}} {latency["sum"]}'
+            )
+            lines.append(
+                f'koios_request_duration_seconds_count{{endpoint="{endpoint}"}} {latency["count"]}'
+            )
+        counters = [
+            ("retries", "koios_retries_total", "Retried requests to Koios API."),
+            (
+                "wire_bytes",
+                "koios_response_wire_bytes_total",
+                "Bytes of the responses received from Koios API (compressed).",
+            ),
+            (
+                "decoded_bytes",
+                "koios_response_decoded_bytes_total",
+                "Bytes of the responses received from Koios API (decompressed).",
+            ),
+            ("rows", "koios_rows_total", "Rows returned by Koios API."),
+        ]
+        for key, name, description in counters:
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+            for endpoint, stats in snapshot.items():
+                lines.append(f'{name}{{endpoint="{endpoint}"}} {stats[key]}')
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """
+        Reset the metrics (including the PayloadStats)
+        """
+        self.payload_stats.clear()
+        with self._lock:
+            self._endpoints.clear()
+
+    def _cumulative(self, counts: list) -> dict:
+        buckets = {}
+        total = 0
+        for bound, count in zip(self.buckets, counts):
+            total += count
+            buckets[bound] = total
+        return buckets
+
+
+payload_stats = PayloadStats()
+request_metrics = Metrics(payload_stats=payload_stats)
@@ -1,91 +1,125 @@
 """Network section functions"""
+from typing import Iterator, Union
+
 from .library import *
+from .store import *
 
 
-def get_tip() -> list:
+def get_tip(fields: Union[str, list] = None, filters: dict = None) -> list:
     """
     https://api.koios.rest/#get-/tip
     Get the tip info about the latest block seen by chain
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of block summary (limit+paginated)
     """
     url = API_BASE_URL + "/tip"
-    return koios_get_request(url, {})
+    return format_rows(url, koios_get_request(url, query_params({}, fields, filters)))
 
 
-def get_genesis() -> list:
+def get_genesis(fields: Union[str, list] = None, filters: dict = None) -> list:
     """
     https://api.koios.rest/#get-/genesis
     Get the Genesis parameters used to start specific era on chain
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of genesis parameters used to start each era on chain
     """
     url = API_BASE_URL + "/genesis"
-    return koios_get_request(url, {})
+    return format_rows(url, koios_get_request(url, query_params({}, fields, filters)))
 
 
-def get_totals(epoch: int = 0) -> list:
+def get_totals(
+    epoch: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/totals
     Get the circulating utxo, treasury, rewards, supply and reserves in lovelace
     for specified epoch, all epochs if empty
     :param epoch: (Optional) The epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of supply/reserves/utxo/fees/treasury stats
     """
     url = API_BASE_URL + "/totals"
     parameters = {}
     if isinstance(epoch, int) and epoch > 0:
         parameters["_epoch_no"] = epoch
-    return koios_get_request(url, parameters)
+    return format_rows(
+        url,
+        koios_get_stored_epoch(url, query_params(parameters, fields, filters), epoch),
+    )
 
 
-def get_param_updates() -> list:
+def get_param_updates(fields: Union[str, list] = None, filters: dict = None) -> list:
     """
     https://api.koios.rest/#get-/param_updates
     Get all parameter update proposals submitted to the chain starting Shelley era
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of unique param update proposals submitted on chain
     """
     url = API_BASE_URL + "/param_updates"
-    return koios_get_request(url, {})
+    return format_rows(url, koios_get_request(url, query_params({}, fields, filters)))
 
 
-def get_reserve_withdrawals() -> list:
+def get_reserve_withdrawals(
+    fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/reserve_withdrawals
     List of all withdrawals from reserves against stake accounts
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"amount": ("gt", 10**12)}, default: all rows
     :returns: The list of withdrawals from reserves against stake accounts
     """
+    return join_pages(iter_reserve_withdrawals(fields, filters, pages=True))
+
+
+def iter_reserve_withdrawals(
+    fields: Union[str, list] = None, filters: dict = None, pages: bool = False
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/reserve_withdrawals
+    Iterate over the results of get_reserve_withdrawals as each page is received
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"amount": ("gt", 10**12)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of withdrawals from reserves against stake accounts
+    """
     url = API_BASE_URL + "/reserve_withdrawals"
     parameters = {}
-    withdrawals = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        withdrawals += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return withdrawals
-
-
-def get_treasury_withdrawals() -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_treasury_withdrawals(
+    fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/treasury_withdrawals
     List of all withdrawals from treasury against stake accounts
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"amount": ("gt", 10**12)}, default: all rows
     :returns: The list of withdrawals from treasury against stake accounts
     """
+    return join_pages(iter_treasury_withdrawals(fields, filters, pages=True))
+
+
+def iter_treasury_withdrawals(
+    fields: Union[str, list] = None, filters: dict = None, pages: bool = False
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/treasury_withdrawals
+    Iterate over the results of get_treasury_withdrawals as each page is received
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"amount": ("gt", 10**12)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of withdrawals from treasury against stake accounts
+    """
     url = API_BASE_URL + "/treasury_withdrawals"
     parameters = {}
-    withdrawals = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        withdrawals += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return withdrawals
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
@@ -1,37 +1,48 @@
 """Pool section functions"""
-from typing import Union
+from typing import Iterator, Union
 
 from .library import *
 
 
-def get_pool_list() -> list:
+def get_pool_list(fields: Union[str, list] = None, filters: dict = None) -> list:
     """
     https://api.koios.rest/#get-/pool_list
     List of brief info for all pools
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"active_stake": ("gt", 10**12)}, default: all rows
     :returns: The list of pool IDs and tickers
     """
+    return join_pages(iter_pool_list(fields, filters, pages=True))
+
+
+def iter_pool_list(
+    fields: Union[str, list] = None, filters: dict = None, pages: bool = False
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/pool_list
+    Iterate over the results of get_pool_list as each page is received
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"active_stake": ("gt", 10**12)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of pool IDs and tickers
+    """
     url = API_BASE_URL + "/pool_list"
     parameters = {}
-    pools_list = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        pools_list += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return pools_list
-
-
-def get_pool_info(pool_id: Union[str, list]) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_pool_info(
+    pool_id: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/pool_info
     Current pool statuses and details for a specified list of pool ids
     :param pool_id: Stake pool bech32 ID as string (for one stake pool)
     or list of stake pool bech32 IDs (for multiple stake pools)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"pool_status": "registered"}, default: all rows
     :returns: The list of pool information
     """
     url = API_BASE_URL + "/pool_info"
@@ -40,215 +51,324 @@ def get_pool_info(pool_id: Union[str, list]) -> list:
         parameters["_pool_bech32_ids"] = pool_id
     else:
         parameters["_pool_bech32_ids"] = [pool_id]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
 
 
-def get_pool_stake_snapshot(pool_id: str) -> list:
+def get_pool_stake_snapshot(
+    pool_id: str, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/pool_stake_snapshot
     Returns Mark, Set and Go stake snapshots for the selected pool, useful for leaderlog calculation
     :param pool_id: stake pool bech32 id
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"snapshot": "Mark"}, default: all rows
     :returns: The list of pool stake information for 3 snapshots
     """
     url = API_BASE_URL + "/pool_stake_snapshot"
     parameters = {"_pool_bech32": pool_id}
-    return koios_get_request(url, parameters)
+    return format_rows(
+        url, koios_get_request(url, query_params(parameters, fields, filters))
+    )
 
 
-def get_pool_delegators(pool_id: str) -> list:
+def get_pool_delegators(
+    pool_id: str, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/pool_delegators
     Return information about live delegators for a given pool
     :param pool_id: stake pool bech32 id
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"amount": ("gt", 10**12)}, default: all rows
     :returns: The list of pool delegator information
     """
+    return join_pages(iter_pool_delegators(pool_id, fields, filters, pages=True))
+
+
+def iter_pool_delegators(
+    pool_id: str,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/pool_delegators
+    Iterate over the results of get_pool_delegators as each page is received
+    :param pool_id: stake pool bech32 id
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"amount": ("gt", 10**12)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of pool delegator information
+    """
     url = API_BASE_URL + "/pool_delegators"
     parameters = {"_pool_bech32": pool_id}
-    delegators = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        delegators += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return delegators
-
-
-def get_pool_delegators_history(pool_id: str, epoch: int = 0) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_pool_delegators_history(
+    pool_id: str, epoch: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/pool_delegators_history
     Return information about active delegators (incl. history) for a given pool and epoch number
     (all epochs if not specified)
     :param pool_id: stake pool bech32 id
     :param epoch: (optional) epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"amount": ("gt", 10**12)}, default: all rows
     :returns: The list of pool delegator information
     """
+    return join_pages(
+        iter_pool_delegators_history(pool_id, epoch, fields, filters, pages=True)
+    )
+
+
+def iter_pool_delegators_history(
+    pool_id: str,
+    epoch: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/pool_delegators_history
+    Iterate over the results of get_pool_delegators_history as each page is received
+    :param pool_id: stake pool bech32 id
+    :param epoch: (optional) epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"amount": ("gt", 10**12)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of pool delegator information
+    """
     url = API_BASE_URL + "/pool_delegators_history"
     parameters = {"_pool_bech32": pool_id}
     if isinstance(epoch, int) and epoch > 0:
         parameters["_epoch_no"] = epoch
-    delegators = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        delegators += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return delegators
-
-
-def get_pool_blocks(pool_id: str, epoch: int = 0) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_pool_blocks(
+    pool_id: str, epoch: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/pool_blocks
     Return information about blocks minted by a given pool for all epochs (or _epoch_no if provided)
     :param pool_id: stake pool bech32 id
     :param epoch: (optional) epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of blocks created by pool
     """
+    return join_pages(iter_pool_blocks(pool_id, epoch, fields, filters, pages=True))
+
+
+def iter_pool_blocks(
+    pool_id: str,
+    epoch: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/pool_blocks
+    Iterate over the results of get_pool_blocks as each page is received
+    :param pool_id: stake pool bech32 id
+    :param epoch: (optional) epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of blocks created by pool
+    """
     url = API_BASE_URL + "/pool_blocks"
     parameters = {"_pool_bech32": pool_id}
     if isinstance(epoch, int) and epoch > 0:
         parameters["_epoch_no"] = epoch
-    blocks = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        blocks += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return blocks
-
-
-def get_pool_history(pool_id: str, epoch: int = 0) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_pool_history(
+    pool_id: str, epoch: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/pool_history
     Return information about pool stake, block and reward history in a given epoch _epoch_no
     (or all epochs that pool existed for, in descending order if no _epoch_no was provided)
     :param pool_id: stake pool bech32 id
     :param epoch: (optional) epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of pool history information
     """
     url = API_BASE_URL + "/pool_history"
     parameters = {"_pool_bech32": pool_id}
     if isinstance(epoch, int) and epoch > 0:
         parameters["_epoch_no"] = epoch
-    return koios_get_request(url, parameters)
+    return format_rows(
+        url, koios_get_request(url, query_params(parameters, fields, filters))
+    )
 
 
-def get_pool_updates(pool_id: str = "") -> list:
+def get_pool_updates(
+    pool_id: str = "", fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/pool_updates
     Return all pool updates for all pools or only updates for specific pool if specified
     :param pool_id: stake pool bech32 id
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"active_epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of historical pool updates
     """
+    return join_pages(iter_pool_updates(pool_id, fields, filters, pages=True))
+
+
+def iter_pool_updates(
+    pool_id: str = "",
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/pool_updates
+    Iterate over the results of get_pool_updates as each page is received
+    :param pool_id: stake pool bech32 id
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"active_epoch_no": ("gte", 400)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of historical pool updates
+    """
     url = API_BASE_URL + "/pool_updates"
     parameters = {}
-    pool_updates = []
-    offset = 0
     if pool_id:
         parameters["_pool_bech32"] = pool_id
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        pool_updates += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return pool_updates
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
-def get_pool_registrations(epoch: int = 0) -> list:
+def get_pool_registrations(
+    epoch: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/pool_registrations
     Return all pool registrations initiated in the requested epoch
     :param epoch: The epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"active_epoch_no": ("gte", 400)}, default: all rows
     :returns: The list of pool registrations
     """
+    return join_pages(iter_pool_registrations(epoch, fields, filters, pages=True))
+
+
+def iter_pool_registrations(
+    epoch: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/pool_registrations
+    Iterate over the results of get_pool_registrations as each page is received
+    :param epoch: The epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"active_epoch_no": ("gte", 400)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of pool registrations
+    """
     url = API_BASE_URL + "/pool_registrations"
     parameters = {}
-    registrations = []
-    offset = 0
     if epoch:
         parameters["_epoch_no"] = epoch
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        registrations += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return registrations
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
-def get_pool_retirements(epoch: int = 0) -> list:
+def get_pool_retirements(
+    epoch: int = 0, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/pool_retirements
     Return all pool retirements initiated in the requested epoch
     :param epoch: The epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"retiring_epoch": ("gte", 400)}, default: all rows
     :returns: The list of pool retirements
     """
+    return join_pages(iter_pool_retirements(epoch, fields, filters, pages=True))
+
+
+def iter_pool_retirements(
+    epoch: int = 0,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/pool_retirements
+    Iterate over the results of get_pool_retirements as each page is received
+    :param epoch: The epoch
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"retiring_epoch": ("gte", 400)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of pool retirements
+    """
     url = API_BASE_URL + "/pool_retirements"
     parameters = {}
-    retirements = []
-    offset = 0
     if epoch:
         parameters["_epoch_no"] = epoch
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        retirements += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return retirements
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
-def get_pool_relays() -> list:
+def get_pool_relays(fields: Union[str, list] = None, filters: dict = None) -> list:
     """
     https://api.koios.rest/#get-/pool_relays
     A list of registered relays for all currently registered/retiring (not retired) pools
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of pool relay information
     """
+    return join_pages(iter_pool_relays(fields, filters, pages=True))
+
+
+def iter_pool_relays(
+    fields: Union[str, list] = None, filters: dict = None, pages: bool = False
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/pool_relays
+    Iterate over the results of get_pool_relays as each page is received
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of pool relay information
+    """
     url = API_BASE_URL + "/pool_relays"
     parameters = {}
-    relays = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        relays += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return relays
-
-
-def get_pool_metadata(pool_id: str) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_pool_metadata(
+    pool_id: str, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/pool_metadata
     A list of registered relays for all currently registered/retiring (not retired) pools
     :param pool_id: stake pool bech32 id
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"meta_json": ("not.is", None)}, default: all rows
     :returns: The list of pool metadata maps
     """
     url = API_BASE_URL + "/pool_metadata"
@@ -257,14 +377,20 @@ def get_pool_metadata(pool_id: str) -> list:
         parameters["_pool_bech32_ids"] = pool_id
     else:
         parameters["_pool_bech32_ids"] = [pool_id]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url, koios_post_request(url, query_params({}, fields, filters), parameters)
+    )
 
 
-def get_retiring_pools() -> list:
+def get_retiring_pools(fields: Union[str, list] = None, filters: dict = None) -> list:
     """
     Get the retiring stake pools list
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"active_stake": ("gt", 10**12)}, default: all rows
     :returns: The list of retiring pools maps
     """
     url = API_BASE_URL + "/pool_list"
     parameters = {"pool_status": "eq.retiring"}
-    return koios_get_request(url, parameters)
+    return format_rows(
+        url, koios_get_request(url, query_params(parameters, fields, filters))
+    )
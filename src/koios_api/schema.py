@@ -0,0 +1,559 @@
+"""Row schemas and output formats"""
+import keyword
+import sys
+from array import array
+from collections.abc import Mapping
+from threading import Lock
+from typing import Optional, Union
+
+# Fields whose string values repeat across rows (and endpoints), interned in the records
+INTERNED_FIELDS = [
+    "address",
+    "asset_name",
+    "delegated_pool",
+    "fingerprint",
+    "payment_address",
+    "payment_cred",
+    "policy_id",
+    "pool_id",
+    "pool_id_bech32",
+    "pool_status",
+    "script_hash",
+    "stake_address",
+    "status",
+    "ticker",
+    "type",
+]
+
+# Fields of each endpoint holding amounts (lovelace or token quantities) returned as strings,
+# with the path of the fields of nested objects and arrays separated by dots
+AMOUNT_FIELDS = {
+    "account_assets": ["quantity"],
+    "account_history": ["history.active_stake"],
+    "account_info": [
+        "total_balance",
+        "utxo",
+        "rewards",
+        "withdrawals",
+        "rewards_available",
+        "deposit",
+        "reserves",
+        "treasury",
+        "proposal_refund",
+    ],
+    "account_info_cached": [
+        "total_balance",
+        "utxo",
+        "rewards",
+        "withdrawals",
+        "rewards_available",
+        "deposit",
+        "reserves",
+        "treasury",
+        "proposal_refund",
+    ],
+    "account_rewards": ["rewards.amount"],
+    "account_utxos": ["value", "asset_list.quantity"],
+    "address_assets": ["quantity"],
+    "address_info": ["balance", "utxo_set.value", "utxo_set.asset_list.quantity"],
+    "address_utxos": ["value", "asset_list.quantity"],
+    "asset_addresses": ["quantity"],
+    "asset_history": ["minting_txs.quantity"],
+    "asset_info": ["total_supply"],
+    "asset_utxos": ["value", "asset_list.quantity"],
+    "block_info": ["total_output", "total_fees"],
+    "credential_utxos": ["value", "asset_list.quantity"],
+    "epoch_info": [
+        "out_sum",
+        "fees",
+        "active_stake",
+        "total_rewards",
+        "avg_blk_reward",
+    ],
+    "epoch_params": [
+        "key_deposit",
+        "pool_deposit",
+        "min_utxo_value",
+        "min_pool_cost",
+        "coins_per_utxo_size",
+        "gov_action_deposit",
+        "drep_deposit",
+    ],
+    "genesis": ["maxlovelacesupply"],
+    "policy_asset_addresses": ["quantity"],
+    "policy_asset_info": ["total_supply"],
+    "pool_delegators": ["amount"],
+    "pool_delegators_history": ["amount"],
+    "pool_history": [
+        "active_stake",
+        "fixed_cost",
+        "pool_fees",
+        "deleg_rewards",
+        "member_rewards",
+    ],
+    "pool_info": [
+        "fixed_cost",
+        "pledge",
+        "deposit",
+        "active_stake",
+        "live_pledge",
+        "live_stake",
+    ],
+    "pool_list": ["fixed_cost", "pledge", "deposit", "active_stake"],
+    "pool_stake_snapshot": ["pool_stake", "active_stake"],
+    "pool_updates": ["fixed_cost", "pledge", "deposit"],
+    "reserve_withdrawals": ["amount"],
+    "script_utxos": ["value", "asset_list.quantity"],
+    "totals": [
+        "circulation",
+        "treasury",
+        "reward",
+        "supply",
+        "reserves",
+        "fees",
+        "deposits_stake",
+        "deposits_drep",
+        "deposits_proposal",
+    ],
+    "treasury_withdrawals": ["amount"],
+    "tx_info": [
+        "total_output",
+        "fee",
+        "deposit",
+        "treasury_donation",
+        "inputs.value",
+        "inputs.asset_list.quantity",
+        "outputs.value",
+        "outputs.asset_list.quantity",
+        "collateral_inputs.value",
+        "collateral_inputs.asset_list.quantity",
+        "collateral_output.value",
+        "collateral_output.asset_list.quantity",
+        "reference_inputs.value",
+        "reference_inputs.asset_list.quantity",
+        "withdrawals.amount",
+        "assets_minted.quantity",
+    ],
+    "utxo_info": ["value", "asset_list.quantity"],
+}
+
+_interned = frozenset(INTERNED_FIELDS)
+_amount_paths = {}
+_record_types = {}
+_record_types_lock = Lock()
+
+
+class Record(Mapping):
+    """
+    Base class of the record types: compact rows storing their fields in __slots__
+    instead of a dictionary. The fields can be read as attributes (row.quantity)
+    or as keys (row["quantity"], row.get("quantity")), and dict(row) converts a record to a dictionary
+    """
+
+    __slots__ = ()
+    _endpoint = ""
+    _fields = ()
+
+    def __init__(self, *values):
+        for field, value in zip(self._fields, values):
+            setattr(self, field, value)
+
+    def __getitem__(self, field: str):
+        if field not in self._fields:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._fields
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> tuple:
+        return make_record, (
+            self._endpoint,
+            self._fields,
+            tuple(getattr(self, field) for field in self._fields),
+        )
+
+    def _asdict(self) -> dict:
+        """
+        Convert the record to a dictionary
+        :return: The dictionary
+        """
+        return {field: getattr(self, field) for field in self._fields}
+
+
+def get_record_type(endpoint: str, fields: tuple) -> Optional[type]:
+    """
+    Get the record type of the rows of an endpoint with the given fields
+    (the fields returned by an endpoint are fixed, unless only some of them are selected)
+    :param endpoint: The endpoint name
+    :param fields: The field names, in order
+    :return: The Record subclass, or None if a field name cannot be an attribute
+    """
+    key = (endpoint, fields)
+    record_type = _record_types.get(key)
+    if record_type is None:
+        with _record_types_lock:
+            record_type = _record_types.get(key)
+            if record_type is None:
+                if not all(
+                    field.isidentifier()
+                    and not keyword.iskeyword(field)
+                    and not hasattr(Record, field)
+                    for field in fields
+                ):
+                    return None
+                name = "".join(part.capitalize() for part in endpoint.split("_"))
+                record_type = type(
+                    name + "Record",
+                    (Record,),
+                    {"__slots__": fields, "_endpoint": endpoint, "_fields": fields},
+                )
+                _record_types[key] = record_type
+    return record_type
+
+
+def make_record(endpoint: str, fields: tuple, values: tuple) -> Record:
+    """
+    Create a record (used to unpickle the records)
+    :param endpoint: The endpoint name
+    :param fields: The field names, in order
+    :param values: The values of the fields
+    :return: The record
+    """
+    return get_record_type(endpoint, fields)(*values)
+
+
+def to_records(endpoint: str, rows: list) -> list:
+    """
+    Convert the rows returned by an endpoint to records, interning the strings of INTERNED_FIELDS
+    :param endpoint: The endpoint name
+    :param rows: The rows (dictionaries)
+    :return: The list of records (the rows with field names that cannot be attributes
+    are kept as dictionaries)
+    """
+    records = []
+    record_type = None
+    fields = None
+    interned = []
+    for row in rows:
+        if not isinstance(row, dict):
+            records.append(row)
+            continue
+        row_fields = tuple(row)
+        if row_fields != fields:
+            fields = row_fields
+            record_type = get_record_type(endpoint, fields)
+            interned = [i for i, field in enumerate(fields) if field in _interned]
+        if record_type is None:
+            records.append(row)
+            continue
+        values = list(row.values())
+        for i in interned:
+            if type(values[i]) is str:
+                values[i] = sys.intern(values[i])
+        records.append(record_type(*values))
+    return records
+
+
+def parse_amounts(endpoint: str, rows: list) -> list:
+    """
+    Convert the amounts of the rows returned by an endpoint (the AMOUNT_FIELDS given as strings)
+    to integers (the values that are not integers are kept)
+    :param endpoint: The endpoint name
+    :param rows: The rows (dictionaries), which are not modified
+    :return: The rows with the converted amounts (the rows, and their nested objects and arrays,
+    that contain an amount are copied, the others are shared with the given rows)
+    """
+    paths = _amount_paths.get(endpoint)
+    if paths is None:
+        paths = _amount_paths[endpoint] = [
+            tuple(field.split(".")) for field in AMOUNT_FIELDS.get(endpoint, [])
+        ]
+    for path in paths:
+        rows = _parse_path(rows, path)
+    return rows
+
+
+def _parse_path(rows: list, path: tuple) -> list:
+    """
+    Convert the string amounts of a field of the rows to integers, copying the rows changed
+    :param rows: The rows (dictionaries)
+    :param path: The path of the field
+    :return: The rows, or a copy of them if an amount was converted
+    """
+    field = path[0]
+    parsed = None
+    for i, row in enumerate(rows):
+        if type(row) is not dict:
+            continue
+        value = row.get(field)
+        if len(path) == 1:
+            if type(value) is not str:
+                continue
+            try:
+                new_value = int(value)
+            except ValueError:
+                continue
+        elif type(value) is list:
+            new_value = _parse_path(value, path[1:])
+        elif type(value) is dict:
+            new_value = _parse_path([value], path[1:])[0]
+        else:
+            continue
+        if new_value is value:
+            continue
+        if parsed is None:
+            parsed = list(rows)
+        parsed[i] = dict(row)
+        parsed[i][field] = new_value
+    return rows if parsed is None else parsed
+
+
+class DictColumn:
+    """
+    Dictionary-encoded column of strings: each distinct string is stored once in values,
+    and the rows store its index in codes (-1 for None)
+    """
+
+    __slots__ = ("codes", "values", "_index")
+
+    def __init__(self, strings: list = ()):
+        self.codes = array("i")
+        self.values = []
+        self._index = {}
+        self.extend(strings)
+
+    def extend(self, strings) -> None:
+        """
+        Append strings (or None) to the column
+        :param strings: The strings
+        """
+        if isinstance(strings, DictColumn):
+            index = self._index
+            values = self.values
+            remap = []
+            for value in strings.values:
+                code = index.get(value)
+                if code is None:
+                    code = index[value] = len(values)
+                    values.append(value)
+                remap.append(code)
+            self.codes.extend(
+                array("i", (remap[code] if code >= 0 else -1 for code in strings.codes))
+            )
+            return
+        index = self._index
+        values = self.values
+        codes = []
+        for value in strings:
+            if value is None:
+                codes.append(-1)
+                continue
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(values)
+                values.append(value)
+            codes.append(code)
+        self.codes.extend(array("i", codes))
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        code = self.codes[row]
+        return self.values[code] if code >= 0 else None
+
+    def __iter__(self):
+        values = self.values
+        return (values[code] if code >= 0 else None for code in self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __repr__(self) -> str:
+        return f"DictColumn(rows={len(self.codes)}, values={len(self.values)})"
+
+
+def make_column(values: list) -> Union[array, DictColumn, list]:
+    """
+    Store the values of a field in the most compact column: array("q") for integers,
+    array("d") for numbers, DictColumn for strings and a list otherwise
+    (e.g. for integers mixed with None, booleans, objects and arrays)
+    :param values: The values of the field
+    :return: The column
+    """
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if types == {int, float} or types == {float}:
+        return array("d", values)
+    if str in types and types <= {str, type(None)}:
+        return DictColumn(values)
+    return values
+
+
+def concat_columns(first, second):
+    """
+    Concatenate two columns of a field, extending the first one in place: a column
+    that cannot store the values of the second one is converted once (integers to floats,
+    or anything else to a list), so that joining pages stays linear in the number of rows
+    :param first: The first column
+    :param second: The second column
+    :return: The concatenated column (the first column, or the column it was converted to)
+    """
+    if isinstance(first, list):
+        first.extend(second)
+        return first
+    if isinstance(first, array) and isinstance(second, array):
+        if first.typecode == second.typecode:
+            first.extend(second)
+            return first
+        if first.typecode == "q":
+            first = array("d", first)
+        first.extend(second.tolist())
+        return first
+    if isinstance(first, DictColumn) and (
+        isinstance(second, DictColumn)
+        or all(value is None or type(value) is str for value in second)
+    ):
+        first.extend(second)
+        return first
+    first = list(first)
+    first.extend(second)
+    return first
+
+
+class Columns:
+    """
+    Rows stored by column, with one column per field (see make_column).
+    columns[field] is the column of a field, columns[row] is a row as a dictionary,
+    and iterating over the columns yields the rows as dictionaries
+    """
+
+    def __init__(self, columns: dict = None, length: int = 0):
+        self.columns = columns if columns is not None else {}
+        self.length = length
+
+    @property
+    def fields(self) -> tuple:
+        """
+        The field names
+        """
+        return tuple(self.columns)
+
+    def __getitem__(self, key: Union[str, int]):
+        if isinstance(key, str):
+            return self.columns[key]
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("row index out of range")
+        return {field: column[key] for field, column in self.columns.items()}
+
+    def __iter__(self):
+        columns = list(self.columns.values())
+        fields = self.fields
+        return (dict(zip(fields, row)) for row in zip(*columns))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return f"Columns(rows={self.length}, fields={list(self.columns)})"
+
+    def extend(self, other: "Columns") -> None:
+        """
+        Append the rows of other columns (the fields missing on either side are None)
+        :param other: The columns
+        """
+        for field, column in other.columns.items():
+            if field not in self.columns:
+                self.columns[field] = [None] * self.length
+            self.columns[field] = concat_columns(self.columns[field], column)
+        for field, column in self.columns.items():
+            if field not in other.columns:
+                self.columns[field] = concat_columns(column, [None] * other.length)
+        self.length += other.length
+
+    def to_dict(self) -> dict:
+        """
+        Convert the columns to a dictionary of lists
+        :return: The dictionary (field: list of values)
+        """
+        return {field: list(column) for field, column in self.columns.items()}
+
+    def to_numpy(self) -> dict:
+        """
+        Convert the columns to NumPy arrays (the array columns are shared, not copied,
+        the strings and the other columns are object arrays). Requires numpy
+        :return: The dictionary (field: NumPy array)
+        """
+        return {field: _to_numpy(column) for field, column in self.columns.items()}
+
+    def to_pandas(self):
+        """
+        Convert the columns to a pandas DataFrame (the strings are categorical). Requires pandas
+        :return: The DataFrame
+        """
+        import numpy
+        import pandas
+
+        data = {}
+        for field, column in self.columns.items():
+            if isinstance(column, DictColumn):
+                data[field] = pandas.Categorical.from_codes(
+                    numpy.frombuffer(column.codes, numpy.int32), column.values
+                )
+            else:
+                data[field] = _to_numpy(column)
+        return pandas.DataFrame(data)
+
+
+def _to_numpy(column):
+    """
+    Convert a column to a NumPy array
+    :param column: The column
+    :return: The NumPy array
+    """
+    import numpy
+
+    if isinstance(column, array):
+        return numpy.frombuffer(
+            column, numpy.int64 if column.typecode == "q" else numpy.float64
+        )
+    if isinstance(column, DictColumn):
+        values = numpy.empty(len(column.values) + 1, object)
+        values[:-1] = column.values
+        return values[numpy.frombuffer(column.codes, numpy.int32)]
+    values = numpy.empty(len(column), object)
+    for row, value in enumerate(column):
+        values[row] = value
+    return values
+
+
+def to_columns(rows: list, endpoint: str = "") -> Union[Columns, list]:
+    """
+    Convert rows to columns
+    :param rows: The rows (dictionaries)
+    :param endpoint: (optional) The endpoint name, to store its AMOUNT_FIELDS
+    (returned as strings) in integer columns, default: no conversion
+    :return: The columns (the rows are returned unchanged if they are not all dictionaries)
+    """
+    if not all(isinstance(row, dict) for row in rows):
+        return rows
+    if endpoint:
+        rows = parse_amounts(endpoint, rows)
+    fields = dict.fromkeys(field for row in rows for field in row)
+    return Columns(
+        {field: make_column([row.get(field) for row in rows]) for field in fields},
+        len(rows),
+    )
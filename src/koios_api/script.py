@@ -1,14 +1,21 @@
 """Script section functions"""
-from typing import Union
+from typing import Iterator, Union
 
 from .library import *
+from .store import *
 
 
-def get_script_info(script_hashes: Union[str, list]) -> list:
+def get_script_info(
+    script_hashes: Union[str, list],
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/script_info
     List of datum information for given datum hashes
     :param script_hashes: Script hash as string (for one script hash) or list (for a list of script hashes)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"type": "plutusV2"}, default: all rows
     :returns resp: The list of script information for given script hashes
     """
     url = API_BASE_URL + "/script_info"
@@ -17,97 +24,155 @@ def get_script_info(script_hashes: Union[str, list]) -> list:
         parameters["_script_hashes"] = script_hashes
     else:
         parameters["_script_hashes"] = [script_hashes]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_stored(
+            url,
+            query_params({}, fields, filters),
+            parameters,
+            "_script_hashes",
+            lambda row: row["script_hash"],
+            found_rows("script_hash"),
+        ),
+    )
 
 
-def get_native_script_list() -> list:
+def get_native_script_list(
+    fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/native_script_list
     List of all existing native script hashes along with their creation transaction hashes
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"type": "multisig"}, default: all rows
     :returns: The list of all native scripts maps
     """
+    return join_pages(iter_native_script_list(fields, filters, pages=True))
+
+
+def iter_native_script_list(
+    fields: Union[str, list] = None, filters: dict = None, pages: bool = False
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/native_script_list
+    Iterate over the results of get_native_script_list as each page is received
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"type": "multisig"}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of all native scripts maps
+    """
     url = API_BASE_URL + "/native_script_list"
     parameters = {}
-    scripts_list = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        scripts_list += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return scripts_list
-
-
-def get_plutus_script_list() -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_plutus_script_list(
+    fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/plutus_script_list
     List of all existing native script hashes along with their creation transaction hashes
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"type": "plutusV2"}, default: all rows
     :returns: The list of all plutus scripts maps
     """
+    return join_pages(iter_plutus_script_list(fields, filters, pages=True))
+
+
+def iter_plutus_script_list(
+    fields: Union[str, list] = None, filters: dict = None, pages: bool = False
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/plutus_script_list
+    Iterate over the results of get_plutus_script_list as each page is received
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"type": "plutusV2"}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of all plutus scripts maps
+    """
     url = API_BASE_URL + "/plutus_script_list"
     parameters = {}
-    scripts_list = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        scripts_list += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return scripts_list
-
-
-def get_script_redeemers(script: str) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_script_redeemers(
+    script: str, fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#get-/script_redeemers
     List of all redeemers for a given script hash
     :param script: script hash
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns resp: redeemers list as map
     """
     url = API_BASE_URL + "/script_redeemers"
     parameters = {"_script_hash": script}
-    return koios_get_request(url, parameters)
+    return format_rows(
+        url, koios_get_request(url, query_params(parameters, fields, filters))
+    )
 
 
-def get_script_utxos(script_hash: str, extended: bool = False) -> list:
+def get_script_utxos(
+    script_hash: str,
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/asset_utxos
     Get the UTXO information of a list of assets including
     :param script_hash: Script hash
     :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
     :returns: The list UTXOs for given asset list
     """
+    return join_pages(
+        iter_script_utxos(script_hash, extended, fields, filters, pages=True)
+    )
+
+
+def iter_script_utxos(
+    script_hash: str,
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+    pages: bool = False,
+) -> Iterator:
+    """
+    https://api.koios.rest/#post-/asset_utxos
+    Iterate over the results of get_script_utxos as each page is received
+    :param script_hash: Script hash
+    :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of UTXOs for given asset list
+    """
     url = API_BASE_URL + "/script_utxos"
     parameters = {
         "_script_hash": script_hash.split(".")[0],
         "_extended": str(extended).lower(),
     }
-    utxos = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        utxos += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return utxos
-
-
-def get_datum_info(datum: Union[str, list]) -> list:
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
+
+
+def get_datum_info(
+    datum: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/datum_info
     List of datum information for given datum hashes
     :param datum: datum hash as string (for one datum hash) or list (for a list of datum hashes)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns resp: datum information as list of maps
     """
     url = API_BASE_URL + "/datum_info"
@@ -116,4 +181,14 @@ def get_datum_info(datum: Union[str, list]) -> list:
         parameters["_datum_hashes"] = datum
     else:
         parameters["_datum_hashes"] = [datum]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_stored(
+            url,
+            query_params({}, fields, filters),
+            parameters,
+            "_datum_hashes",
+            lambda row: row["datum_hash"],
+            found_rows("datum_hash"),
+        ),
+    )
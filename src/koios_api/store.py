@@ -0,0 +1,247 @@
+"""Persistent store for immutable chain data"""
+import json
+import sqlite3
+from typing import Callable
+
+from .library import *
+
+# Number of epochs after which the epoch data is considered final
+# (the rewards of an epoch are only calculated at the end of the following epoch)
+CLOSED_EPOCH_DEPTH = 2
+# Number of seconds the tip used to decide the immutability of the data is kept
+TIP_REFRESH_TIME = 60
+
+
+class ChainStore:
+    """
+    Key-value store in a SQLite database, where the values are the lists of rows
+    returned by Koios API for an input (block hash, transaction hash, epoch...) of an endpoint.
+    The rows are scoped by network (the base URL of the API they were returned by),
+    so that a database file can be shared by the clients of several networks
+    """
+
+    def __init__(self, path: str, network: str = ""):
+        self.network = network
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS chain_data ("
+                "network TEXT NOT NULL, endpoint TEXT NOT NULL, key TEXT NOT NULL, "
+                "rows TEXT NOT NULL, PRIMARY KEY (network, endpoint, key)) WITHOUT ROWID"
+            )
+
+    def get_many(self, endpoint: str, keys: list) -> dict:
+        """
+        Get the stored rows for the given keys
+        :param endpoint: The endpoint name
+        :param keys: The list of keys
+        :return: A dictionary with the list of rows for each key found in the store
+        """
+        found = {}
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                batch = keys[i : i + 500]
+                cursor = self._connection.execute(
+                    "SELECT key, rows FROM chain_data "
+                    "WHERE network = ? AND endpoint = ? AND key IN ("
+                    + ",".join("?" * len(batch))
+                    + ")",
+                    [self.network, endpoint, *batch],
+                )
+                for key, rows in cursor:
+                    found[key] = decode_json(rows)
+        return found
+
+    def put_many(self, endpoint: str, items: dict) -> None:
+        """
+        Store the rows for the given keys
+        :param endpoint: The endpoint name
+        :param items: A dictionary with the list of rows for each key
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO chain_data (network, endpoint, key, rows) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (self.network, endpoint, key, json.dumps(rows))
+                    for key, rows in items.items()
+                ],
+            )
+
+    def close(self) -> None:
+        """
+        Close the database
+        """
+        with self._lock:
+            self._connection.close()
+
+
+def get_chain_store():
+    """
+    Get the store opened at the CHAIN_STORE path of the current client,
+    for the network of its API_BASE_URL
+    :return: The store, or None if CHAIN_STORE is not set
+    """
+    client = get_client()
+    if not client.CHAIN_STORE:
+        return None
+    if client.chain_store is None:
+        with client.lock:
+            if client.chain_store is None:
+                client.chain_store = ChainStore(
+                    client.CHAIN_STORE, client.API_BASE_URL.rstrip("/")
+                )
+    return client.chain_store
+
+
+def get_stored_tip() -> dict:
+    """
+    Get the tip used to decide if the data is immutable, refreshed every TIP_REFRESH_TIME seconds
+    :return: A dictionary with the block height and the epoch of the tip
+    """
+    client = get_client()
+    with client.tip_lock:
+        stored_tip = client.stored_tip
+        if stored_tip is None or monotonic() - stored_tip["time"] >= TIP_REFRESH_TIME:
+            tip = koios_get_request(API_BASE_URL + "/tip", {})[0]
+            stored_tip = {
+                "time": monotonic(),
+                "block_height": tip["block_no"],
+                "epoch_no": tip["epoch_no"],
+            }
+            client.stored_tip = stored_tip
+        return dict(stored_tip)
+
+
+def is_closed_epoch(epoch: int) -> bool:
+    """
+    Check if the data of an epoch is final
+    :param epoch: The epoch
+    :return: True if the epoch ended at least CLOSED_EPOCH_DEPTH epochs ago
+    """
+    return epoch + CLOSED_EPOCH_DEPTH <= get_stored_tip()["epoch_no"]
+
+
+def koios_post_stored(
+    url: str,
+    params: dict,
+    parameters: dict,
+    key: str,
+    row_key: Callable[[dict], str],
+    immutable: Callable[[list, list], list],
+) -> list:
+    """
+    Get the rows for the input list parameters[key] from the store, request the missing ones
+    from Koios API and store the rows of the inputs that are immutable
+    :param url: URL
+    :param params: Parameters to include in the query string (requests with a query string
+    bypass the store, as only the full rows are stored)
+    :param parameters: Parameters to include as data in the POST request
+    :param key: The name of the parameter holding the input list
+    :param row_key: Function returning the input a row belongs to
+    :param immutable: Function returning the inputs (from the list of requested inputs)
+    that will not change anymore, given the list of requested inputs and the returned rows
+    :return: The list of rows, in input order
+    """
+    store = get_chain_store()
+    if store is None or params:
+        return koios_post_bulk(url, params, parameters, key)
+    endpoint = url.rsplit("/", 1)[-1]
+    inputs = parameters[key]
+    found = store.get_many(endpoint, list(dict.fromkeys(inputs)))
+    missing = [item for item in dict.fromkeys(inputs) if item not in found]
+    if missing:
+        resp = koios_post_bulk(url, {}, dict(parameters, **{key: missing}), key)
+        fetched = {item: [] for item in missing}
+        for row in resp:
+            fetched.setdefault(row_key(row), []).append(row)
+        store.put_many(
+            endpoint, {item: fetched[item] for item in immutable(missing, resp)}
+        )
+        found.update(fetched)
+    rows = []
+    for item in dict.fromkeys(inputs):
+        rows += found.get(item, [])
+    return rows
+
+
+def confirmed_rows(key_field: str) -> Callable[[list, list], list]:
+    """
+    Get a function returning the inputs whose rows are in blocks deep enough to be immutable
+    :param key_field: The field of the rows holding the input
+    :return: The function to use as immutable parameter of koios_post_stored
+    """
+
+    def immutable(inputs: list, rows: list) -> list:
+        max_height = get_stored_tip()["block_height"] - get_client().CONFIRMATION_DEPTH
+        return list(
+            dict.fromkeys(
+                row[key_field]
+                for row in rows
+                if row.get("block_height") is not None
+                and row["block_height"] <= max_height
+            )
+        )
+
+    return immutable
+
+
+def confirmed_txs(inputs: list, rows: list) -> list:
+    """
+    Get the transactions with at least CONFIRMATION_DEPTH confirmations
+    :param inputs: The list of transaction hashes
+    :param rows: The rows returned for the transactions
+    :return: The list of immutable transaction hashes
+    """
+    tx_status = koios_post_bulk(
+        API_BASE_URL + "/tx_status", {}, {"_tx_hashes": inputs}, "_tx_hashes"
+    )
+    confirmation_depth = get_client().CONFIRMATION_DEPTH
+    return [
+        tx["tx_hash"]
+        for tx in tx_status
+        if (tx["num_confirmations"] or 0) >= confirmation_depth
+    ]
+
+
+def found_rows(key_field: str) -> Callable[[list, list], list]:
+    """
+    Get a function returning the inputs found on chain, for content-addressed data
+    (datums, scripts) that never changes once it exists
+    :param key_field: The field of the rows holding the input
+    :return: The function to use as immutable parameter of koios_post_stored
+    """
+
+    def immutable(inputs: list, rows: list) -> list:
+        return list(dict.fromkeys(row[key_field] for row in rows))
+
+    return immutable
+
+
+def koios_get_stored_epoch(url: str, parameters: dict, epoch: int) -> list:
+    """
+    Get the rows of an epoch from the store, or request them from Koios API
+    and store them if the epoch is closed
+    :param url: URL
+    :param parameters: Parameters to include as data in the GET request
+    :param epoch: The epoch (0 for all epochs, which is never stored)
+    :return: A list with the body of the response
+    """
+    store = get_chain_store()
+    if (
+        store is None
+        or any(not key.startswith("_") for key in parameters)
+        or not isinstance(epoch, int)
+        or epoch <= 0
+    ):
+        return koios_get_request(url, parameters)
+    endpoint = url.rsplit("/", 1)[-1]
+    found = store.get_many(endpoint, [str(epoch)])
+    if str(epoch) in found:
+        return found[str(epoch)]
+    resp = koios_get_request(url, parameters)
+    if resp and is_closed_epoch(epoch):
+        store.put_many(endpoint, {str(epoch): resp})
+    return resp
@@ -1,15 +1,23 @@
 """Transactions section functions"""
-from typing import Union
+from typing import Iterator, Union
 
 from .library import *
+from .store import *
 
 
-def get_utxo_info(utxos: Union[str, list], extended: bool = False) -> list:
+def get_utxo_info(
+    utxos: Union[str, list],
+    extended: bool = False,
+    fields: Union[str, list] = None,
+    filters: dict = None,
+) -> list:
     """
     https://api.koios.rest/#post-/utxo_info
     Get UTxO set for requested UTxO references
     :param utxos: utxos as a string (for one utxo) or list (for multiple utxos)
     :param extended: (optional) Include certain optional fields are populated as a part of the call
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"value": ("gt", 10**9)}, default: all rows
     :returns: The list of UTXO details
     """
     url = API_BASE_URL + "/utxo_info"
@@ -20,14 +28,23 @@ def get_utxo_info(utxos: Union[str, list], extended: bool = False) -> list:
         parameters["_utxo_refs"] = [utxos]
     if isinstance(extended, bool):
         parameters["_extended"] = str(extended).lower()
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_bulk(
+            url, query_params({}, fields, filters), parameters, "_utxo_refs"
+        ),
+    )
 
 
-def get_tx_info(txs: Union[str, list]) -> list:
+def get_tx_info(
+    txs: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/tx_info
     Get detailed information about transaction(s)
     :param txs: transaction hash as a string (for one transaction) or list (for multiple transactions)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"fee": ("gt", 10**6)}, default: all rows
     :returns: The list of detailed information about transaction(s)
     """
     url = API_BASE_URL + "/tx_info"
@@ -36,14 +53,28 @@ def get_tx_info(txs: Union[str, list]) -> list:
         parameters["_tx_hashes"] = txs
     else:
         parameters["_tx_hashes"] = [txs]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_stored(
+            url,
+            query_params({}, fields, filters),
+            parameters,
+            "_tx_hashes",
+            lambda row: row["tx_hash"],
+            confirmed_rows("tx_hash"),
+        ),
+    )
 
 
-def get_tx_metadata(txs: Union[str, list]) -> list:
+def get_tx_metadata(
+    txs: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/tx_metadata
     Get metadata information (if any) for given transaction(s)
     :param txs: transaction hash as a string (for one transaction) or list (for multiple transactions)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of metadata information present in each of the transactions queried
     """
     url = API_BASE_URL + "/tx_metadata"
@@ -52,29 +83,46 @@ def get_tx_metadata(txs: Union[str, list]) -> list:
         parameters["_tx_hashes"] = txs
     else:
         parameters["_tx_hashes"] = [txs]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_stored(
+            url,
+            query_params({}, fields, filters),
+            parameters,
+            "_tx_hashes",
+            lambda row: row["tx_hash"],
+            confirmed_txs,
+        ),
+    )
 
 
-def get_tx_metalabels() -> list:
+def get_tx_metalabels(fields: Union[str, list] = None, filters: dict = None) -> list:
     """
     https://api.koios.rest/#get-/tx_metalabels
     Get a list of all transaction metadata labels
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
     :returns: The list of known metadata labels
     """
+    return join_pages(iter_tx_metalabels(fields, filters, pages=True))
+
+
+def iter_tx_metalabels(
+    fields: Union[str, list] = None, filters: dict = None, pages: bool = False
+) -> Iterator:
+    """
+    https://api.koios.rest/#get-/tx_metalabels
+    Iterate over the results of get_tx_metalabels as each page is received
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), default: all rows
+    :param pages: (optional) Yield each page (list of rows) instead of each row if True
+    :returns: A generator of known metadata labels
+    """
     url = API_BASE_URL + "/tx_metalabels"
     parameters = {}
-    metalabels_list = []
-    offset = 0
-    while True:
-        if offset > 0:
-            parameters["offset"] = offset
-        resp = koios_get_request(url, parameters)
-        metalabels_list += resp
-        if len(resp) < API_RESP_COUNT:
-            break
-        else:
-            offset += len(resp)
-    return metalabels_list
+    return iter_results(
+        koios_get_pages(url, query_params(parameters, fields, filters)), pages
+    )
 
 
 def submit_tx(transaction: str) -> str:
@@ -110,11 +158,15 @@ def submit_tx(transaction: str) -> str:
     return resp
 
 
-def get_tx_status(txs: Union[str, list]) -> list:
+def get_tx_status(
+    txs: Union[str, list], fields: Union[str, list] = None, filters: dict = None
+) -> list:
     """
     https://api.koios.rest/#post-/tx_status
     Get the number of block confirmations for a given transaction hash list
     :param txs: transaction hash as a string (for one transaction) or list (for multiple transactions)
+    :param fields: (optional) Fields (columns) to return, as a comma-separated string or a list, default: all fields
+    :param filters: (optional) Row filters (column: (operator, value)), e.g. {"num_confirmations": ("gte", 10)}, default: all rows
     :returns: The list of transaction confirmation counts
     """
     url = API_BASE_URL + "/tx_status"
@@ -123,4 +175,9 @@ def get_tx_status(txs: Union[str, list]) -> list:
         parameters["_tx_hashes"] = txs
     else:
         parameters["_tx_hashes"] = [txs]
-    return koios_post_request(url, {}, parameters)
+    return format_rows(
+        url,
+        koios_post_batched(
+            url, query_params({}, fields, filters), parameters, "_tx_hashes", "tx_hash"
+        ),
+    )
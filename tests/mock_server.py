@@ -0,0 +1,585 @@
+"""
+Local stand-in for Koios API, serving generated data for the endpoints used by the package,
+with PostgREST-style offset, limit, order, select and filters, configurable latency,
+error injection and dataset size. It only uses the standard library.
+
+Usage:
+    with MockKoiosServer(rows=10000, latency=0.01) as server:
+        client = KoiosClient(API_BASE_URL=server.base_url)
+"""
+import gzip
+import json
+import random
+from collections.abc import Sequence
+from fnmatch import fnmatchcase
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+from typing import Callable
+from urllib.parse import parse_qsl, urlsplit
+
+# Input parameter of the POST endpoints, and the field of the returned rows holding the input
+INPUT_FIELDS = {
+    "_addresses": "address",
+    "_asset_list": "asset",
+    "_block_hashes": "hash",
+    "_datum_hashes": "datum_hash",
+    "_payment_credentials": "payment_cred",
+    "_pool_bech32_ids": "pool_id_bech32",
+    "_script_hashes": "script_hash",
+    "_stake_addresses": "stake_address",
+    "_tx_hashes": "tx_hash",
+    "_utxo_refs": "tx_hash",
+}
+# Input parameter of the GET endpoints, and the field of the returned rows holding the input
+GET_INPUT_FIELDS = {
+    "_address": "address",
+    "_asset_policy": "policy_id",
+    "_pool_bech32": "pool_id_bech32",
+    "_script_hash": "script_hash",
+    "_stake_address": "stake_address",
+}
+# Endpoints whose input field differs from INPUT_FIELDS
+ENDPOINT_INPUT_FIELDS = {"block_txs": "block_hash"}
+# Endpoints returning one row per input (the other POST endpoints spread the table over the inputs)
+BULK_ENDPOINTS = [
+    "account_info",
+    "account_info_cached",
+    "address_info",
+    "asset_info",
+    "block_info",
+    "datum_info",
+    "pool_info",
+    "script_info",
+    "tx_info",
+    "tx_metadata",
+    "tx_status",
+    "utxo_info",
+]
+# Endpoints returning rows with a nested array, and a function returning that array for a row
+NESTED_FIELDS = {
+    "account_rewards": (
+        "rewards",
+        lambda row: [
+            {
+                "earned_epoch": row["epoch_no"],
+                "spendable_epoch": row["epoch_no"] + 2,
+                "amount": row["value"],
+                "type": "member",
+                "pool_id": row["pool_id_bech32"],
+            }
+        ],
+    ),
+}
+# Endpoints returning a single row
+SINGLE_ROW_ENDPOINTS = ["tip", "genesis", "totals"]
+# Columns increasing with the row index, so that ordering by them does not need sorting
+INDEX_COLUMNS = [
+    "block_height",
+    "block_no",
+    "block_time",
+    "abs_slot",
+    "hash",
+    "tx_hash",
+]
+FIRST_BLOCK_TIME = 1506203091
+MAX_PAGE_SIZE = 1000
+
+
+def make_row(index: int, height: int) -> dict:
+    """
+    Generate a row of the dataset
+    :param index: The index of the row
+    :param height: The number of rows of the dataset (the block height of the tip)
+    :return: The row, with the fields common to most endpoints
+    """
+    return {
+        "hash": f"{index:064x}",
+        "block_height": index + 1,
+        "block_no": index + 1,
+        "block_time": FIRST_BLOCK_TIME + 20 * index,
+        "abs_slot": 20 * index,
+        "epoch_no": index // 21600,
+        "tx_hash": f"{index:064x}",
+        "tx_index": 0,
+        "num_confirmations": height - index,
+        "stake_address": f"stake1u{index:052d}",
+        "address": f"addr1q{index:097d}",
+        "pool_id_bech32": f"pool1{index:051d}",
+        "policy_id": f"{index % 1000:056x}",
+        "asset_name": f"{index:08x}",
+        "quantity": str(1000 * (index + 1)),
+        "value": str(1000000 * (index + 1)),
+    }
+
+
+def unquote(value: str) -> str:
+    """
+    Remove the quotes of a quoted value of a filter
+    :param value: The value
+    :return: The unquoted value
+    """
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def split_list(text: str) -> list:
+    """
+    Split a comma-separated list of conditions or values, ignoring the commas
+    inside parentheses and quoted values
+    :param text: The list
+    :return: The list items
+    """
+    items = []
+    depth = 0
+    quoted = False
+    start = 0
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quoted:
+            if char == "\\":
+                i += 1
+            elif char == '"':
+                quoted = False
+        elif char == '"':
+            quoted = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            items.append(text[start:i])
+            start = i + 1
+        i += 1
+    items.append(text[start:])
+    return items
+
+
+def compare(row_value, operator: str, value) -> bool:
+    """
+    Evaluate a filter operator
+    :param row_value: The value of the column in the row
+    :param operator: The PostgREST operator (without "not.")
+    :param value: The value of the condition, as a string (a list of strings for "in")
+    :return: True if the row matches the condition
+    """
+    if operator == "is":
+        return row_value is {"null": None, "true": True, "false": False}[value.lower()]
+    if row_value is None:
+        return False
+    if isinstance(row_value, (int, float)) and not isinstance(row_value, bool):
+        convert = float
+    else:
+        convert = str
+        row_value = str(row_value)
+    if operator == "in":
+        return row_value in [convert(item) for item in value]
+    if operator == "like":
+        return fnmatchcase(row_value, value)
+    if operator == "ilike":
+        return fnmatchcase(row_value.lower(), value.lower())
+    value = convert(value)
+    if operator == "eq":
+        return row_value == value
+    if operator == "neq":
+        return row_value != value
+    if operator == "gt":
+        return row_value > value
+    if operator == "gte":
+        return row_value >= value
+    if operator == "lt":
+        return row_value < value
+    if operator == "lte":
+        return row_value <= value
+    raise ValueError(f"Unsupported operator: {operator}")
+
+
+class Condition:
+    """
+    A parsed PostgREST filter, called with a row to check if the row matches it.
+    A condition is monotone if, once true for a row of the dataset, it is true for all
+    the following rows (e.g. block_height.gt.100, or the conditions of keyset pagination),
+    so that the first matching row can be found by binary search
+    """
+
+    def __init__(
+        self,
+        match: Callable[[dict], bool],
+        column: str = None,
+        operator: str = None,
+        monotone: bool = False,
+    ):
+        self.match = match
+        self.column = column
+        self.operator = operator
+        self.monotone = monotone
+
+    def __call__(self, row: dict) -> bool:
+        return self.match(row)
+
+
+def parse_condition(column: str, expression: str, nested: bool = False) -> Condition:
+    """
+    Parse a PostgREST filter
+    :param column: The column name, or "and"/"or" (optionally prefixed with "not.")
+    :param expression: The filter value, e.g. "gt.10" or "(a.eq.1,b.lt.2)" for a group
+    :param nested: True for the conditions of a group, where the values may be quoted
+    :return: The condition
+    """
+    negate = False
+    logic = column
+    if logic.startswith("not."):
+        negate = True
+        logic = logic[4:]
+    if logic in ("and", "or"):
+        conditions = []
+        for item in split_list(expression[1:-1]):
+            if item.startswith(("and(", "or(", "not.and(", "not.or(")):
+                name, _, rest = item.partition("(")
+                conditions.append(parse_condition(name, "(" + rest, True))
+            else:
+                name, _, rest = item.partition(".")
+                conditions.append(parse_condition(name, rest, True))
+        first = conditions[0]
+        if logic == "and":
+            monotone = all(condition.monotone for condition in conditions)
+            return Condition(
+                lambda row: all(condition(row) for condition in conditions) != negate,
+                first.column if first.operator == "eq" else None,
+                "and",
+                monotone and not negate,
+            )
+        # (a > x) or (a = x and b > y)...: the rows after a row, in lexicographic order
+        monotone = first.monotone and all(
+            condition.operator == "and" and condition.column == first.column
+            for condition in conditions[1:]
+        )
+        return Condition(
+            lambda row: any(condition(row) for condition in conditions) != negate,
+            monotone=monotone and not negate,
+        )
+    if expression.startswith("not."):
+        negate = True
+        expression = expression[4:]
+    operator, _, value = expression.partition(".")
+    if operator == "in":
+        value = [unquote(item) for item in split_list(value[1:-1])]
+    elif nested:
+        value = unquote(value)
+    return Condition(
+        lambda row: compare(row.get(column), operator, value) != negate,
+        column,
+        operator,
+        column in INDEX_COLUMNS and operator in ("gt", "gte") and not negate,
+    )
+
+
+def input_row(row: dict, field: str, item) -> dict:
+    """
+    Get a row returned for an input
+    :param row: The generated row
+    :param field: The field holding the input
+    :param item: The input
+    :return: The row with its input field set
+    """
+    if isinstance(item, list):
+        return dict(row, policy_id=item[0], asset_name=item[1])
+    return dict(row, **{field: item})
+
+
+class InputTable(Sequence):
+    """
+    The rows of the dataset spread over the inputs of a request (row i belongs to input i modulo
+    the number of inputs), built when they are accessed so that a page does not copy the table
+    """
+
+    def __init__(self, rows: list, field: str, inputs: list):
+        self.rows = rows
+        self.field = field
+        self.inputs = inputs
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self.rows)
+        item = self.inputs[index % len(self.inputs)]
+        return input_row(self.rows[index], self.field, item)
+
+
+def first_match(table: Sequence, conditions: list) -> int:
+    """
+    Find the first row matching monotone conditions by binary search
+    :param table: The rows, in dataset order
+    :param conditions: The monotone conditions
+    :return: The position of the first matching row (the number of rows if none match)
+    """
+    low, high = 0, len(table)
+    while low < high:
+        middle = (low + high) // 2
+        row = table[middle]
+        if all(condition(row) for condition in conditions):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+class MockKoiosServer:
+    """
+    Koios API stand-in running in a background thread on a free local port.
+    The GET endpoints return a table of rows rows, the bulk POST endpoints
+    rows_per_input rows for each input, and the other POST endpoints the table
+    with its rows spread over the inputs. Each request waits latency seconds, and fails
+    with error_status with a probability of error_rate (with a Retry-After header
+    if retry_after is set). The responses are gzip-compressed if the client accepts it
+    and compress is True
+    """
+
+    def __init__(
+        self,
+        rows: int = 10000,
+        rows_per_input: int = 1,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: float = None,
+        page_size: int = MAX_PAGE_SIZE,
+        compress: bool = True,
+        seed: int = 0,
+    ):
+        self.rows = rows
+        self.rows_per_input = rows_per_input
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.page_size = page_size
+        self.compress = compress
+        self.requests = 0
+        self.errors = 0
+        self.rows_served = 0
+        self._table = [make_row(index, rows) for index in range(rows)]
+        self._random = random.Random(seed)
+        self._lock = Lock()
+        self._server = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        The URL to use as API_BASE_URL
+        """
+        return f"http://127.0.0.1:{self._server.server_port}/api/v1"
+
+    def start(self) -> "MockKoiosServer":
+        """
+        Start serving in a background thread
+        :return: The server
+        """
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server.handle(self, None)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                server.handle(self, self.rfile.read(length))
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the server
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockKoiosServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        """
+        Reset the request, error and row counters
+        """
+        with self._lock:
+            self.requests = 0
+            self.errors = 0
+            self.rows_served = 0
+
+    def handle(self, handler: BaseHTTPRequestHandler, body: bytes) -> None:
+        """
+        Answer a request
+        :param handler: The request handler
+        :param body: The body of a POST request (None for a GET request)
+        """
+        with self._lock:
+            self.requests += 1
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        if self.latency > 0:
+            sleep(self.latency)
+        if failed:
+            headers = {}
+            if self.retry_after is not None:
+                headers["Retry-After"] = str(self.retry_after)
+            self.send(
+                handler, self.error_status, {"message": "injected error"}, headers
+            )
+            return
+        url = urlsplit(handler.path)
+        endpoint = url.path.rsplit("/", 1)[-1]
+        params = parse_qsl(url.query, keep_blank_values=True)
+        try:
+            parameters = json.loads(body) if body else {}
+            rows, headers = self.query(endpoint, params, parameters)
+        except (ValueError, KeyError, TypeError) as exc:
+            self.send(handler, 400, {"message": str(exc)})
+            return
+        with self._lock:
+            self.rows_served += len(rows) if isinstance(rows, list) else 1
+        self.send(handler, 200, rows, headers)
+
+    def query(self, endpoint: str, params: list, parameters: dict) -> tuple:
+        """
+        Run the query of a request on the dataset
+        :param endpoint: The endpoint name
+        :param params: The query string parameters, as a list of (name, value) pairs
+        :param parameters: The body of a POST request
+        :return: The body of the response and its headers
+        """
+        if endpoint == "submittx":
+            return f"{len(self._table):064x}", {}
+        if endpoint == "ogmios":
+            return {"jsonrpc": "2.0", "method": parameters.get("method")}, {}
+        conditions = []
+        order = None
+        select = None
+        offset = 0
+        limit = self.page_size
+        for name, value in params:
+            if name == "order":
+                order = [column.split(".") for column in value.split(",")]
+            elif name == "select":
+                select = [column.strip() for column in value.split(",")]
+            elif name == "offset":
+                offset = int(value)
+            elif name == "limit":
+                limit = min(int(value), self.page_size)
+            elif name == "_after_block_height":
+                conditions.append(parse_condition("block_height", "gt." + value))
+            elif name in GET_INPUT_FIELDS:
+                parameters = {name: [value]}
+            elif not name.startswith("_"):
+                conditions.append(parse_condition(name, value))
+        table = self.table(endpoint, parameters)
+        positions = range(len(table))
+        in_order = not order or order[0][0] in INDEX_COLUMNS
+        if not in_order:
+            table = list(table)
+            for column, *options in reversed(order):
+                table.sort(
+                    key=lambda row: row.get(column), reverse=options[-1:] == ["desc"]
+                )
+        elif order and order[0][-1] == "desc":
+            positions = positions[::-1]
+        monotone = [condition for condition in conditions if condition.monotone]
+        if in_order and positions.step > 0 and monotone:
+            positions = range(first_match(table, monotone), len(table))
+            conditions = [
+                condition for condition in conditions if not condition.monotone
+            ]
+        if conditions:
+            rows = []
+            skipped = 0
+            for i in positions:
+                row = table[i]
+                if not all(condition(row) for condition in conditions):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                rows.append(row)
+                if len(rows) >= limit:
+                    break
+        else:
+            rows = [table[i] for i in positions[offset : offset + limit]]
+        if endpoint in NESTED_FIELDS:
+            field, nested = NESTED_FIELDS[endpoint]
+            rows = [dict(row, **{field: nested(row)}) for row in rows]
+        if select and "*" not in select:
+            rows = [{column: row.get(column) for column in select} for row in rows]
+        last = offset + len(rows) - 1 if rows else offset
+        return rows, {"Content-Range": f"{offset}-{last}/*"}
+
+    def table(self, endpoint: str, parameters: dict) -> Sequence:
+        """
+        Get the rows of an endpoint for the inputs of a request
+        :param endpoint: The endpoint name
+        :param parameters: The inputs of the request (the body of a POST request)
+        :return: The rows, before filtering and pagination
+        """
+        if endpoint in SINGLE_ROW_ENDPOINTS:
+            return [self._table[-1]] if self._table else []
+        inputs = None
+        for key, value in parameters.items():
+            if isinstance(value, list):
+                inputs = value
+                field = ENDPOINT_INPUT_FIELDS.get(
+                    endpoint, INPUT_FIELDS.get(key, GET_INPUT_FIELDS.get(key, key))
+                )
+                break
+        if inputs is None:
+            return self._table
+        if endpoint in BULK_ENDPOINTS:
+            rows = []
+            for i, item in enumerate(inputs):
+                for j in range(self.rows_per_input):
+                    index = (i * self.rows_per_input + j) % max(1, len(self._table))
+                    rows.append(input_row(self._table[index], field, item))
+            return rows
+        return InputTable(self._table, field, inputs) if inputs else []
+
+    def send(
+        self,
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        body,
+        headers: dict = None,
+    ) -> None:
+        """
+        Send a JSON response
+        :param handler: The request handler
+        :param status: The status code
+        :param body: The object to send as JSON
+        :param headers: (optional) Additional headers
+        """
+        content = json.dumps(body, separators=(",", ":")).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        if self.compress and "gzip" in handler.headers.get("Accept-Encoding", ""):
+            content = gzip.compress(content, compresslevel=1)
+            handler.send_header("Content-Encoding", "gzip")
+        handler.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(content)
@@ -13,6 +13,16 @@ def test_account_list():
     assert len(account_list) == 10
 
 
+def test_iter_account_list():
+    """Ensure the iter_account_list exists and yields the expected results"""
+    assert iter_account_list
+    account_list = list(iter_account_list(limit=10))
+    assert account_list == get_account_list(limit=10)
+    pages = list(iter_account_list(limit=10, pages=True))
+    assert len(pages) == 1
+    assert len(pages[0]) == 10
+
+
 def test_account_info():
     """Ensure the get_account_info exists and returns the expected results"""
     assert get_account_info
@@ -46,6 +46,14 @@ def test_asset_utxos():
     assert get_asset_utxos
 
 
+def test_iter_asset_utxos():
+    """Ensure the iter_asset_utxos exists and yields the expected results"""
+    assert iter_asset_utxos
+    asset_utxos = list(iter_asset_utxos(f"{TEST_NFT_POLICY}.{TEST_ASSET_NAME}"))
+    assert len(asset_utxos) > 0
+    assert asset_utxos[0]["tx_hash"]
+
+
 def test_asset_history():
     """Ensure the get_asset_history exists and returns the expected results"""
     assert get_asset_history
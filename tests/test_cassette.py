@@ -0,0 +1,53 @@
+"""Cassette tests"""
+
+from time import monotonic
+
+import pytest
+
+from src.koios_api.library import *
+
+from .mock_server import MockKoiosServer
+
+
+def test_cassette(tmp_path):
+    """Ensure the responses recorded to a cassette are replayed without sending requests"""
+    assert Cassette
+    path = str(tmp_path / "cassette.jsonl")
+    with MockKoiosServer(rows=2500, latency=0.05) as server:
+        with KoiosClient(API_BASE_URL=server.base_url, CASSETTE=path) as client:
+            assert client.transport.mode == "record"
+            pools = client.get_pool_list()
+            tip = client.get_tip()
+        assert server.requests == 4
+    with KoiosClient(CASSETTE=path, CASSETTE_MODE="replay", RETRY_ATTEMPTS=1) as client:
+        assert client.get_pool_list() == pools
+        start = monotonic()
+        assert client.get_tip() == tip
+        assert monotonic() - start < 0.05
+        with pytest.raises(CassetteError):
+            client.get_totals()
+    with KoiosClient(CASSETTE=path, REPLAY_TIMING=True) as client:
+        assert client.transport.mode == "replay"
+        start = monotonic()
+        assert client.get_tip() == tip
+        assert monotonic() - start >= 0.05
+
+
+def test_cassette_retries(tmp_path):
+    """Ensure the error responses of a request are replayed in recorded order"""
+    path = str(tmp_path / "cassette.jsonl")
+    with MockKoiosServer(rows=10, error_rate=0.5, seed=1) as server:
+        with KoiosClient(
+            API_BASE_URL=server.base_url, CASSETTE=path, SLEEP_TIME=0
+        ) as client:
+            tip = client.get_tip()
+        requests, errors = server.requests, server.errors
+    assert errors > 0
+    statuses = []
+    hook = on_response(lambda event: statuses.append(event.status_code))
+    try:
+        with KoiosClient(CASSETTE=path, SLEEP_TIME=0) as client:
+            assert client.get_tip() == tip
+    finally:
+        remove_hook(hook)
+    assert statuses == [503] * errors + [200] and len(statuses) == requests
@@ -1,10 +1,409 @@
 """Library tests"""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import monotonic, sleep
+
+import pytest
+import requests
+
 from src.koios_api.library import *
 
+from .mock_server import MockKoiosServer
+
 
 def test_library():
     """Ensure the library functions exist"""
     assert get_error_message
+    assert koios_request
     assert koios_get_request
     assert koios_post_request
+
+
+def test_session():
+    """Ensure get_session returns one shared session per API host"""
+    assert get_session
+    session = get_session(API_BASE_URL + "/tip")
+    assert session is get_session(API_BASE_URL + "/pool_list")
+    assert session is not get_session("http://localhost:8053/api/v1/tip")
+    close_sessions()
+    assert session is not get_session(API_BASE_URL + "/tip")
+
+
+def fake_pages(total: int):
+    """Return a fetch_page function for a fake table with total rows"""
+
+    def fetch_page(offset: int) -> list:
+        return list(range(offset, min(offset + API_RESP_COUNT, total)))
+
+    return fetch_page
+
+
+def test_iter_pages():
+    """Ensure iter_pages returns all the rows in order, sequentially and in parallel"""
+    assert iter_pages
+    total = 3 * API_RESP_COUNT + 5
+    for parallel in (1, 4):
+        rows = join_pages(iter_pages(fake_pages(total), parallel=parallel))
+        assert rows == list(range(total))
+        rows = join_pages(iter_pages(fake_pages(total), 10, 1500, parallel=parallel))
+        assert rows == list(range(10, 1510))
+        rows = join_pages(iter_pages(fake_pages(2 * API_RESP_COUNT), parallel=parallel))
+        assert rows == list(range(2 * API_RESP_COUNT))
+
+
+def test_iter_keyset_pages():
+    """Ensure keyset pagination starts each page after the last row of the previous one"""
+    assert iter_keyset_pages
+    # several rows per block height, to check the ties
+    table = [
+        {"block_height": i // 3, "tx_hash": "%04x" % i}
+        for i in range(2 * API_RESP_COUNT + 7)
+    ]
+    columns = KEYSET_COLUMNS["account_txs"]
+
+    def fetch_page(row) -> list:
+        params = keyset_params({}, columns, row)
+        assert params["order"] == "block_height.asc,tx_hash.asc"
+        if row is None:
+            return table[0:API_RESP_COUNT]
+        height, tx_hash = row["block_height"], row["tx_hash"]
+        assert params["or"] == (
+            f"(block_height.gt.{height},"
+            f"and(block_height.eq.{height},tx_hash.gt.{tx_hash}))"
+        )
+        after = [
+            r for r in table if (r["block_height"], r["tx_hash"]) > (height, tx_hash)
+        ]
+        return after[0:API_RESP_COUNT]
+
+    assert join_pages(iter_keyset_pages(fetch_page)) == table
+    assert join_pages(iter_keyset_pages(fetch_page, 1500)) == table[0:1500]
+    params = keyset_params({}, ["block_height"], {"block_height": 10})
+    assert params == {"order": "block_height.asc", "block_height": "gt.10"}
+
+
+def test_iter_results():
+    """Ensure iter_results yields the rows or the pages of a paginated request"""
+    assert iter_results
+    pages = [[1, 2], [3]]
+    assert list(iter_results(iter(pages))) == [1, 2, 3]
+    assert list(iter_results(iter(pages), True)) == pages
+
+
+def test_response_cache():
+    """Ensure ResponseCache expires entries and evicts the least recently used ones"""
+    assert ResponseCache
+    cache = ResponseCache(2, 10)
+    cache.set(("a",), b"1234", 60)
+    cache.set(("b",), b"1234", 60)
+    assert cache.get(("a",)) == b"1234"
+    cache.set(("c",), b"1234", 60)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == b"1234"
+    cache.set(("d",), b"12345678", 60)
+    assert cache.get(("a",)) is None
+    assert cache.get(("c",)) is None
+    cache.set(("e",), b"1", -1)
+    assert cache.get(("e",)) is None
+    assert cache.hits == 2
+
+
+def test_cache_ttl():
+    """Ensure get_cache_ttl returns the time to live set for the endpoint"""
+    assert get_cache_ttl(API_BASE_URL + "/tip", {}) == CACHE_TTLS["tip"]
+    assert get_cache_ttl(API_BASE_URL + "/pool_list", {}) == CACHE_TTL
+    assert get_cache_ttl(API_BASE_URL + "/submittx", {}) == 0
+
+
+def test_cache_ttl_epochs():
+    """Ensure the responses for past epochs get the long time to live without calling get_tip first"""
+    url = API_BASE_URL + "/epoch_params"
+    with MockKoiosServer(rows=21601) as server:
+        with KoiosClient(API_BASE_URL=server.base_url, RESPONSE_CACHE=True) as client:
+            with client.use():
+                assert get_cache_ttl(url, {"_epoch_no": "0"}) == CLOSED_EPOCH_CACHE_TTL
+                assert client.tip_epoch == 1 and server.requests == 1
+                assert get_cache_ttl(url, {"_epoch_no": "0"}) == CLOSED_EPOCH_CACHE_TTL
+                assert get_cache_ttl(url, {"_epoch_no": "1"}) == CACHE_TTL
+                assert server.requests == 1
+        with KoiosClient(API_BASE_URL=server.base_url, RESPONSE_CACHE=True) as client:
+            client.stored_tip = {"time": monotonic(), "block_height": 1, "epoch_no": 5}
+            server.reset_stats()
+            with client.use():
+                assert get_cache_ttl(url, {"_epoch_no": "4"}) == CLOSED_EPOCH_CACHE_TTL
+            assert server.requests == 0
+    with KoiosClient(API_BASE_URL=server.base_url, RETRY_ATTEMPTS=1) as client:
+        with client.use():
+            assert get_cache_ttl(url, {"_epoch_no": "0"}) == CACHE_TTL
+
+
+def test_retry_delay():
+    """Ensure the retry delay follows the Retry-After header or the exponential backoff"""
+    response = requests.Response()
+    assert get_retry_after(response) is None
+    response.headers["Retry-After"] = "3"
+    assert get_retry_after(response) == 3
+    response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert get_retry_after(response) == 0
+    assert get_retry_delay(5, 3) == 3
+    assert get_retry_delay(1, 10**6) == RETRY_MAX_SLEEP
+    for attempt in range(1, 20):
+        delay = get_retry_delay(attempt)
+        assert 0 <= delay <= min(RETRY_MAX_SLEEP, SLEEP_TIME * 2 ** (attempt - 1))
+
+
+def test_retry_after_cap():
+    """Ensure a long Retry-After requested by the server is capped at RETRY_MAX_SLEEP"""
+    with MockKoiosServer(rows=10, error_rate=0.5, retry_after=3600, seed=1) as server:
+        with KoiosClient(API_BASE_URL=server.base_url, RETRY_MAX_SLEEP=0) as client:
+            start = monotonic()
+            assert client.get_tip()[0]["block_height"] == 10
+            assert monotonic() - start < 5
+        assert server.errors > 0
+
+
+def test_rate_limiter():
+    """Ensure RateLimiter allows a burst and then limits the request rate"""
+    assert RateLimiter
+    limiter = RateLimiter(50, 2)
+    start = monotonic()
+    for _ in range(7):
+        limiter.acquire()
+    assert 0.08 <= monotonic() - start < 0.5
+    limiter.pause(0.1)
+    start = monotonic()
+    limiter.acquire()
+    assert monotonic() - start >= 0.09
+
+
+def test_endpoint_pool():
+    """Ensure EndpointPool routes to the fastest healthy instance"""
+    assert EndpointPool
+    pool = EndpointPool(["http://a", "http://b"], 2, 60)
+    pool.record_success("http://a", 0.5)
+    assert pool.choose() == "http://b"
+    pool.record_success("http://b", 0.1)
+    assert pool.choose() == "http://b"
+    assert pool.choose(["http://b"]) == "http://a"
+    pool.record_failure("http://b")
+    assert pool.choose() == "http://b"
+    pool.record_failure("http://b")
+    assert pool.status()["http://b"]["open"]
+    assert pool.choose() == "http://a"
+    pool.record_failure("http://a")
+    pool.record_failure("http://a")
+    assert pool.choose() == "http://b"
+
+
+def test_single_flight():
+    """Ensure SingleFlight shares one call between the threads making it at the same time"""
+    assert SingleFlight
+    coalescing = SingleFlight()
+    calls = []
+
+    def function():
+        calls.append(1)
+        sleep(0.2)
+        return [len(calls)]
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(
+            executor.map(lambda _: coalescing.do(("tip",), function), range(5))
+        )
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert coalescing.do(("tip",), function) == [2]
+
+
+def test_batch_dispatcher():
+    """Ensure BatchDispatcher sends the items of concurrent callers in one request"""
+    assert BatchDispatcher
+    batches = []
+
+    def send(items: list) -> list:
+        batches.append(items)
+        return [{"tx_hash": item, "num_confirmations": 1} for item in items]
+
+    dispatcher = BatchDispatcher(send, "tx_hash", 0.2, 4)
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(dispatcher.submit, ["a", "b", "c", "d", "e"]))
+    assert [result[0]["tx_hash"] for result in results] == ["a", "b", "c", "d", "e"]
+    assert sorted(len(batch) for batch in batches) == [1, 4]
+
+
+def test_json_decoder():
+    """Ensure the JSON responses are decoded from bytes by the selected decoder"""
+    content = '[{"ticker": "APEX", "name": "Ápex"}]'.encode()
+    for decoder in ("json", "auto"):
+        set_json_decoder(decoder)
+        assert decode_json(content) == [{"ticker": "APEX", "name": "Ápex"}]
+    set_json_decoder(lambda content: content)
+    assert decode_json(content) is content
+    set_json_decoder(JSON_DECODER)
+
+
+def test_query_params():
+    """Ensure the fields of an endpoint function are sent as the select parameter"""
+    assert query_params({}) == {}
+    assert query_params({"_epoch_no": 1}, ["epoch_no", "supply"]) == {
+        "_epoch_no": 1,
+        "select": "epoch_no,supply",
+    }
+    assert query_params({}, "pool_id_bech32,ticker") == {
+        "select": "pool_id_bech32,ticker"
+    }
+
+
+def test_query_filters():
+    """Ensure the filters of an endpoint function are translated to PostgREST operators"""
+    params = query_params(
+        {"policy_id": "eq.abc"},
+        filters={
+            "policy_id": ("neq", "def"),
+            "active_stake": ("gt", 10**12),
+            "ticker": ("in", ["A,B", "C"]),
+            "retiring_epoch": ("is", None),
+            "or": {"ticker": ("like", "*AP*"), "and": [{"a": 1}, {"b": ("not.lt", 2)}]},
+        },
+    )
+    assert params == {
+        "policy_id": ["eq.abc", "neq.def"],
+        "active_stake": "gt.1000000000000",
+        "ticker": 'in.("A,B",C)',
+        "retiring_epoch": "is.null",
+        "or": "(ticker.like.*AP*,and(a.eq.1,b.not.lt.2))",
+    }
+    with pytest.raises(ValueError):
+        query_params({}, filters={"ticker": ("contains", "AP")})
+
+
+def test_post_bulk():
+    """Ensure koios_post_bulk splits the inputs in batches of the endpoint size and keeps their order"""
+    batches = []
+
+    def transport(method, url, params, data=None, headers=None):
+        hashes = json.loads(data)["_tx_hashes"]
+        batches.append(len(hashes))
+        sleep(0.05 if hashes[0] == "0" else 0)
+        body = json.dumps([{"tx_hash": tx_hash} for tx_hash in hashes])
+        return CassetteResponse({"status": 200, "body": body}, url)
+
+    url = API_BASE_URL + "/tx_info"
+    hashes = [str(i) for i in range(250)]
+    with KoiosClient(BULK_WORKERS=3) as client:
+        client.transport = transport
+        with client.use():
+            rows = koios_post_bulk(url, {}, {"_tx_hashes": hashes}, "_tx_hashes")
+            assert [row["tx_hash"] for row in rows] == hashes
+            assert sorted(batches) == [50, 100, 100]
+            batches.clear()
+            rows = koios_post_bulk(url, {}, {"_tx_hashes": hashes[:100]}, "_tx_hashes")
+            assert len(rows) == 100 and batches == [100]
+
+
+def test_accept_encoding():
+    """Ensure the sessions accept the compressed encodings that can be decoded"""
+    encodings = get_accept_encoding().split(", ")
+    assert "gzip" in encodings and "deflate" in encodings
+    session = get_session(API_BASE_URL + "/tip")
+    assert session.headers["Accept-Encoding"] == get_accept_encoding()
+
+
+def test_hooks():
+    """Ensure the hooks receive the request, response and error events"""
+    assert on_request and on_response and on_retry and on_error
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = 200 if self.path.startswith("/api/v1/tip") else 404
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"[]")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/api/v1"
+    events = []
+    hooks = [
+        on_request(lambda event: events.append(("request", event))),
+        on_response(lambda event: events.append(("response", event))),
+        on_error(lambda event: events.append(("error", event))),
+        on_request(lambda event: 1 / 0),
+    ]
+    try:
+        assert koios_get_request(base_url + "/tip", {}) == []
+        with pytest.raises(requests.HTTPError):
+            koios_get_request(base_url + "/unknown", {})
+    finally:
+        for hook in hooks:
+            remove_hook(hook)
+        server.shutdown()
+    assert [kind for kind, event in events] == [
+        "request",
+        "response",
+        "request",
+        "response",
+        "error",
+    ]
+    assert events[0][1].url == base_url + "/tip" and events[0][1].attempt == 1
+    assert events[1][1].status_code == 200 and events[1][1].latency >= 0
+    assert events[4][1].error.response.status_code == 404
+
+
+def test_client():
+    """Ensure each KoiosClient sends its requests with its own settings"""
+    assert KoiosClient
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            tokens.append(self.headers.get("Authorization"))
+            self.send_response(200)
+            self.send_header("Content-Length", "17")
+            self.end_headers()
+            self.wfile.write(b'[{"epoch_no":42}]')
+
+        def log_message(self, *args):
+            pass
+
+    tokens = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/api/v1"
+    first = KoiosClient(KOIOS_API_TOKEN="first", API_BASE_URL=base_url)
+    second = KoiosClient(
+        KOIOS_API_TOKEN="second", API_BASE_URL=base_url, RESPONSE_CACHE=True
+    )
+    try:
+        assert first.get_tip() == [{"epoch_no": 42}]
+        assert second.get_tip() == [{"epoch_no": 42}]
+        assert second.get_tip() == [{"epoch_no": 42}]
+    finally:
+        first.close()
+        second.close()
+        server.shutdown()
+    assert tokens == ["Bearer first", "Bearer second"]
+    assert second.tip_epoch == 42 and first.tip_epoch == 0
+    assert get_client() is default_client
+    with first.use():
+        assert get_client() is first
+    assert get_client() is default_client
+    assert "get_tip" in dir(first) and "iter_blocks" in dir(first)
+
+    def clients():
+        yield get_client()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            yield submit_in_context(executor, get_client).result()
+
+    assert list(first.iterate(clients())) == [first, first]
+    assert first.get_session(base_url) is not default_client.get_session(base_url)
+    with pytest.raises(TypeError):
+        KoiosClient(API_TOKEN="token")
+    with pytest.raises(AttributeError):
+        first.get_unknown()
@@ -0,0 +1,62 @@
+"""Metrics tests"""
+
+from src.koios_api.metrics import *
+
+
+def test_metrics():
+    """Ensure Metrics records the requests, retries, bytes and rows of each endpoint"""
+    assert Metrics
+    metrics = Metrics([0.1, 1])
+    metrics.record_request("tip", 200, 0.05)
+    metrics.payload_stats.record("tip", 100, 200)
+    metrics.record_request("tip", 503, 0.5)
+    metrics.record_request("tip", "error", 5)
+    metrics.record_retry("tip")
+    metrics.record_rows("tip", 1)
+    stats = metrics.snapshot()["tip"]
+    assert stats["requests"] == 3
+    assert stats["status_codes"] == {"200": 1, "503": 1, "error": 1}
+    assert stats["latency"] == {"buckets": {0.1: 1, 1: 2}, "sum": 5.55, "count": 3}
+    assert stats["retries"] == 1
+    assert (stats["wire_bytes"], stats["decoded_bytes"], stats["rows"]) == (100, 200, 1)
+    metrics.clear()
+    assert metrics.snapshot() == {} and metrics.payload_stats.snapshot() == {}
+
+
+def test_metrics_prometheus():
+    """Ensure Metrics exports the metrics in the Prometheus text format"""
+    metrics = Metrics([0.1, 1], PayloadStats())
+    metrics.record_request("tx_info", 200, 0.5)
+    metrics.payload_stats.record("tx_info", 10, 20)
+    metrics.record_rows("tx_info", 3)
+    text = metrics.prometheus()
+    assert "# TYPE koios_requests_total counter" in text
+    assert 'koios_requests_total{endpoint="tx_info",status="200"} 1\n' in text
+    assert (
+        'koios_request_duration_seconds_bucket{endpoint="tx_info",le="0.1"} 0\n' in text
+    )
+    assert (
+        'koios_request_duration_seconds_bucket{endpoint="tx_info",le="1"} 1\n' in text
+    )
+    assert (
+        'koios_request_duration_seconds_bucket{endpoint="tx_info",le="+Inf"} 1\n'
+        in text
+    )
+    assert 'koios_request_duration_seconds_count{endpoint="tx_info"} 1\n' in text
+    assert 'koios_response_wire_bytes_total{endpoint="tx_info"} 10\n' in text
+    assert 'koios_rows_total{endpoint="tx_info"} 3\n' in text
+
+
+def test_payload_stats():
+    """Ensure PayloadStats adds up the wire and decoded bytes of each endpoint"""
+    assert PayloadStats
+    stats = PayloadStats()
+    stats.record("tx_info", 100, 1000)
+    stats.record("tx_info", 50, 400)
+    stats.record("tip", 20, 20)
+    assert stats.snapshot() == {
+        "tx_info": {"responses": 2, "wire_bytes": 150, "decoded_bytes": 1400},
+        "tip": {"responses": 1, "wire_bytes": 20, "decoded_bytes": 20},
+    }
+    stats.clear()
+    assert stats.snapshot() == {}
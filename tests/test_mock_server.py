@@ -0,0 +1,76 @@
+"""Mock server tests"""
+
+from src.koios_api.library import *
+
+from .mock_server import MockKoiosServer
+
+STAKE_ADDRESS = "stake1u8yxtugdv63wxafy9d00nuz6hjyyp4qnggvc9a3vxh8yl0ckml2uz"
+
+
+def test_mock_pages():
+    """Ensure the paginated functions return all the rows of the mock server in order"""
+    with MockKoiosServer(rows=2500) as server:
+        for settings in [{}, {"PARALLEL_PAGES": 3}, {"KEYSET_PAGINATION": True}]:
+            with KoiosClient(API_BASE_URL=server.base_url, **settings) as client:
+                pools = client.get_pool_list()
+                txs = client.get_account_txs(STAKE_ADDRESS)
+            assert [pool["block_height"] for pool in pools] == list(range(1, 2501))
+            assert [tx["block_height"] for tx in txs] == list(range(1, 2501))
+            assert all(tx["stake_address"] == STAKE_ADDRESS for tx in txs)
+        server.reset_stats()
+        with KoiosClient(API_BASE_URL=server.base_url) as client:
+            pools = client.get_pool_list(
+                fields=["pool_id_bech32", "block_height"],
+                filters={"block_height": ("gt", 1500)},
+            )
+        assert len(pools) == 1000 and set(pools[0]) == {
+            "pool_id_bech32",
+            "block_height",
+        }
+        assert server.requests == 2 and server.rows_served == 1000
+        with KoiosClient(API_BASE_URL=server.base_url) as client:
+            pools = client.get_pool_list(
+                filters={"or": {"block_height": ("lt", 3), "hash": ("in", ["9", "a"])}}
+            )
+        assert [pool["block_height"] for pool in pools] == [1, 2]
+        with KoiosClient(API_BASE_URL=server.base_url) as client:
+            pools = client.get_pool_list(
+                filters={
+                    "or": {"block_height": ("lt", 3), "hash": ("in", [f"{9:064x}"])}
+                }
+            )
+        assert [pool["block_height"] for pool in pools] == [1, 2, 10]
+
+
+def test_mock_bulk():
+    """Ensure the bulk functions return one row per input of the mock server, in input order"""
+    hashes = [f"{i:064x}" for i in range(250)]
+    with MockKoiosServer(rows=100) as server:
+        with KoiosClient(API_BASE_URL=server.base_url) as client:
+            txs = client.get_tx_info(hashes)
+        assert [tx["tx_hash"] for tx in txs] == hashes
+        assert server.requests == 3
+
+
+def test_mock_errors():
+    """Ensure the requests failed by the mock server are retried"""
+    with MockKoiosServer(rows=5000, error_rate=0.3, latency=0.001) as server:
+        with KoiosClient(
+            API_BASE_URL=server.base_url, SLEEP_TIME=0, RETRY_ATTEMPTS=0
+        ) as client:
+            pools = client.get_pool_list()
+        assert len(pools) == 5000
+        assert server.errors > 0 and server.requests == 6 + server.errors
+
+
+def test_mock_small_pages():
+    """Ensure pages smaller than the page size of the server do not overlap"""
+    with MockKoiosServer(rows=2500) as server:
+        for settings in [{}, {"PARALLEL_PAGES": 3}, {"KEYSET_PAGINATION": True}]:
+            with KoiosClient(
+                API_BASE_URL=server.base_url, API_RESP_COUNT=500, **settings
+            ) as client:
+                pools = client.get_pool_list()
+                txs = client.get_account_txs(STAKE_ADDRESS)
+            assert [pool["block_height"] for pool in pools] == list(range(1, 2501))
+            assert [tx["block_height"] for tx in txs] == list(range(1, 2501))
@@ -0,0 +1,54 @@
+"""Package tests"""
+
+import ast
+import logging
+import os
+from time import gmtime
+
+import src.koios_api as koios_api
+
+
+def module_names(path: str) -> list:
+    """Return the public names defined at the top level of a module"""
+    names = []
+
+    def walk(body: list):
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                names.append(node.name)
+            elif isinstance(node, ast.Assign):
+                names.extend(t.id for t in node.targets if isinstance(t, ast.Name))
+            elif isinstance(node, ast.If):
+                walk(node.body)
+                walk(node.orelse)
+            elif isinstance(node, ast.Try):
+                walk(node.body)
+
+    with open(path) as file:
+        walk(ast.parse(file.read()).body)
+    return [name for name in dict.fromkeys(names) if not name.startswith("_")]
+
+
+def test_exports():
+    """Ensure every public name of the modules is exported by the package"""
+    directory = os.path.dirname(koios_api.__file__)
+    modules = [
+        file[:-3]
+        for file in os.listdir(directory)
+        if file.endswith(".py") and file != "__init__.py"
+    ]
+    assert sorted(koios_api._exports) == sorted(modules)
+    for module in modules:
+        names = module_names(os.path.join(directory, module + ".py"))
+        assert koios_api._exports[module] == names
+    for name in koios_api.__all__:
+        getattr(koios_api, name)
+    assert "get_tip" in dir(koios_api)
+
+
+def test_logging():
+    """Ensure importing the package does not configure the root logger"""
+    logger = koios_api.logger
+    assert logger.name == "koios_api"
+    assert logging.Formatter.converter is not gmtime
+    assert any(isinstance(h, logging.NullHandler) for h in logger.handlers)
@@ -0,0 +1,210 @@
+"""Schema tests"""
+
+import pickle
+import sys
+from array import array
+
+import pytest
+
+from src.koios_api.library import *
+
+from .mock_server import MockKoiosServer
+
+STAKE_ADDRESS = "stake1u8yxtugdv63wxafy9d00nuz6hjyyp4qnggvc9a3vxh8yl0ckml2uz"
+
+
+def test_records():
+    """Ensure the rows converted to records keep their values in less memory"""
+    assert Record
+    rows = [
+        {"address": "addr1" + "x" * 50, "value": "1000000", "asset_list": []}
+        for _ in range(3)
+    ]
+    size = sys.getsizeof(dict(rows[0]))
+    records = to_records("address_utxos", [dict(row) for row in rows])
+    record = records[0]
+    assert type(record) is get_record_type(
+        "address_utxos", ("address", "value", "asset_list")
+    )
+    assert sys.getsizeof(record) < size
+    assert record.value == record["value"] == record.get("value") == "1000000"
+    assert record.get("tx_hash") is None and "tx_hash" not in record
+    assert record == rows[0] and dict(record) == record._asdict() == rows[0]
+    assert records[1].address is record.address
+    assert pickle.loads(pickle.dumps(records)) == rows
+    assert repr(record).startswith("AddressUtxosRecord(address=")
+
+
+def test_records_fallback():
+    """Ensure the rows with field names that cannot be attributes are kept as dictionaries"""
+    rows = [{"tx_hash": "a"}, {"class": "b"}, {"keys": "c"}, {"1": "d"}, "e"]
+    records = to_records("tx_info", rows)
+    assert isinstance(records[0], Record)
+    assert records[1:] == rows[1:] and all(
+        type(record) is not Record for record in records[1:]
+    )
+
+
+def test_row_format():
+    """Ensure the functions return records with ROW_FORMAT set to records"""
+    with MockKoiosServer(rows=1500) as server:
+        with KoiosClient(API_BASE_URL=server.base_url, ROW_FORMAT="records") as client:
+            pools = client.get_pool_list()
+            txs = client.get_tx_info([f"{i:064x}" for i in range(10)])
+            tip = client.get_tip()
+            rewards = client.get_account_rewards(STAKE_ADDRESS)
+        assert [pool.block_height for pool in pools] == list(range(1, 1501))
+        assert isinstance(rewards[0], Record) and rewards[0].rewards[0]["amount"]
+        assert (
+            all(isinstance(tx, Record) for tx in txs) and txs[3].tx_hash == f"{3:064x}"
+        )
+        assert isinstance(tip[0], Record)
+        with KoiosClient(API_BASE_URL=server.base_url) as client:
+            assert client.get_tip() == tip
+            assert type(client.get_tip()[0]) is dict
+
+
+def test_columns():
+    """Ensure the rows converted to columns store each field in a compact column"""
+    assert DictColumn and make_column and concat_columns
+    rows = [
+        {"pool_id": "pool1", "active_stake": 10, "ratio": 0.5, "ticker": None},
+        {"pool_id": "pool2", "active_stake": 20, "ratio": 1, "ticker": "B"},
+        {"pool_id": "pool1", "active_stake": 30, "ratio": 2.5, "ticker": None},
+    ]
+    columns = to_columns(rows)
+    assert columns.fields == ("pool_id", "active_stake", "ratio", "ticker")
+    assert columns["active_stake"] == array("q", [10, 20, 30])
+    assert columns["ratio"] == array("d", [0.5, 1, 2.5])
+    assert list(columns["pool_id"].codes) == [0, 1, 0]
+    assert columns["pool_id"].values == ["pool1", "pool2"]
+    assert list(columns["ticker"]) == [None, "B", None]
+    assert len(columns) == 3 and list(columns) == rows and columns[-1] == rows[2]
+    columns.extend(to_columns([{"pool_id": "pool3", "active_stake": None}]))
+    assert columns["active_stake"] == [10, 20, 30, None]
+    assert list(columns["ticker"]) == [None, "B", None, None]
+    assert columns["pool_id"].values == ["pool1", "pool2", "pool3"]
+    assert columns.to_dict()["ratio"] == [0.5, 1, 2.5, None]
+    assert to_columns(["a"]) == ["a"]
+
+
+def test_columns_numpy():
+    """Ensure the columns are converted to NumPy arrays"""
+    numpy = pytest.importorskip("numpy")
+    columns = to_columns(
+        [{"stake": 1, "pool": "a", "list": [1]}, {"stake": 2, "pool": None, "list": []}]
+    )
+    arrays = columns.to_numpy()
+    assert arrays["stake"].dtype == numpy.int64 and arrays["stake"].sum() == 3
+    assert list(arrays["pool"]) == ["a", None] and list(arrays["list"]) == [[1], []]
+
+
+def test_join_columns():
+    """Ensure the columns of many pages are joined in place, whatever their type"""
+    pages = [
+        to_columns(
+            [
+                {
+                    "block_height": page * 1000 + row,
+                    "retired": row % 2 == 0,
+                    "relays": [{"port": row}],
+                    "ticker": None if page == 1 else "T",
+                    "margin": 0.5 if page == 2 else 0,
+                }
+                for row in range(1000)
+            ]
+        )
+        for page in range(400)
+    ]
+    retired = pages[0]["retired"]
+    relays = pages[0]["relays"]
+    columns = join_pages(iter(pages))
+    assert columns["retired"] is retired and columns["relays"] is relays
+    assert len(retired) == len(relays) == 400000 and relays[-1] == [{"port": 999}]
+    assert columns["block_height"] == array("q", range(400000))
+    assert columns["margin"].typecode == "d" and columns["margin"][2500] == 0.5
+    assert isinstance(columns["ticker"], DictColumn)
+    assert columns["ticker"][1500] is None and columns["ticker"][2500] == "T"
+
+
+def test_row_format_columns():
+    """Ensure the functions return columns with ROW_FORMAT set to columns"""
+    with MockKoiosServer(rows=2500) as server:
+        for settings in [{}, {"KEYSET_PAGINATION": True}]:
+            with KoiosClient(
+                API_BASE_URL=server.base_url, ROW_FORMAT="columns", **settings
+            ) as client:
+                pools = client.get_pool_list()
+                rows = list(client.iter_pool_list())
+                tip = client.get_tip()
+            assert isinstance(pools, Columns) and len(pools) == 2500
+            assert pools["block_height"] == array("q", range(1, 2501))
+            assert isinstance(pools["pool_id_bech32"], DictColumn)
+            assert rows == list(pools) and type(rows[0]) is dict
+            assert tip[0]["block_height"] == tip["block_height"][0]
+        with KoiosClient(API_BASE_URL=server.base_url, ROW_FORMAT="columns") as client:
+            holders = client.get_asset_addresses(f"{0:056x}")
+        assert holders["quantity"][:2] == array("q", [1000, 2000])
+        assert sum(holders["quantity"]) == 1000 * 2500 * 2501 // 2
+
+
+def test_parse_amounts():
+    """Ensure the string amounts of the rows, and of their nested objects and arrays, are converted to integers"""
+    assert AMOUNT_FIELDS
+    rows = [
+        {
+            "fee": "170000",
+            "deposit": None,
+            "total_output": "1.5",
+            "outputs": [{"value": "2000000", "asset_list": [{"quantity": "7"}]}],
+            "collateral_output": {"value": "5"},
+        }
+    ]
+    parsed = parse_amounts("tx_info", rows)
+    assert parsed[0]["fee"] == 170000 and parsed[0]["deposit"] is None
+    assert parsed[0]["total_output"] == "1.5"
+    assert parsed[0]["outputs"] == [{"value": 2000000, "asset_list": [{"quantity": 7}]}]
+    assert parsed[0]["collateral_output"] == {"value": 5}
+    assert rows[0]["fee"] == "170000" and rows[0]["collateral_output"] == {"value": "5"}
+    assert rows[0]["outputs"] == [
+        {"value": "2000000", "asset_list": [{"quantity": "7"}]}
+    ]
+    tip = [{"block_no": "1"}]
+    assert parse_amounts("tip", tip) is tip
+
+
+def test_format_shared_rows():
+    """Ensure the rows shared by the threads (with SINGLE_FLIGHT) are not modified by format_rows"""
+    rows = [{"address": "addr1", "value": "1000000", "asset_list": [{"quantity": "7"}]}]
+    url = "https://api.koios.rest/api/v1/address_utxos"
+    for settings in [
+        {"NUMERIC_AMOUNTS": True},
+        {"ROW_FORMAT": "records", "NUMERIC_AMOUNTS": True},
+        {"ROW_FORMAT": "columns"},
+    ]:
+        with KoiosClient(**settings) as client, client.use():
+            formatted = format_rows(url, rows)
+        assert list(formatted)[0]["value"] == 1000000
+        assert rows == [
+            {"address": "addr1", "value": "1000000", "asset_list": [{"quantity": "7"}]}
+        ]
+
+
+def test_numeric_amounts():
+    """Ensure the functions return integer amounts with NUMERIC_AMOUNTS set"""
+    with MockKoiosServer(rows=1500) as server:
+        with KoiosClient(API_BASE_URL=server.base_url, NUMERIC_AMOUNTS=True) as client:
+            holders = client.get_asset_addresses(f"{0:056x}")
+            utxos = client.get_utxo_info([f"{i:064x}#0" for i in range(3)])
+        assert [row["quantity"] for row in holders[:2]] == [1000, 2000]
+        assert [utxo["value"] for utxo in utxos] == [1000000, 2000000, 3000000]
+        with KoiosClient(API_BASE_URL=server.base_url, NUMERIC_AMOUNTS=True) as client:
+            rewards = client.get_account_rewards([STAKE_ADDRESS])
+        assert rewards[0]["rewards"][0]["amount"] == 1000000
+        with KoiosClient(
+            API_BASE_URL=server.base_url, NUMERIC_AMOUNTS=True, ROW_FORMAT="columns"
+        ) as client:
+            holders = client.get_asset_addresses(f"{0:056x}")
+        assert holders["quantity"][:2] == array("q", [1000, 2000])
+        with KoiosClient(API_BASE_URL=server.base_url) as client:
+            assert client.get_asset_addresses(f"{0:056x}")[0]["quantity"] == "1000"
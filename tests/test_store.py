@@ -0,0 +1,122 @@
+"""Store tests"""
+
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
+
+from src.koios_api.store import *
+
+from .mock_server import MockKoiosServer
+
+
+def test_chain_store(tmp_path):
+    """Ensure ChainStore returns the stored rows"""
+    assert ChainStore
+    store = ChainStore(str(tmp_path / "koios.db"))
+    rows = [{"tx_hash": "abc", "block_height": 1}]
+    store.put_many("tx_info", {"abc": rows, "def": []})
+    assert store.get_many("tx_info", ["abc", "def", "ghi"]) == {"abc": rows, "def": []}
+    assert store.get_many("block_info", ["abc"]) == {}
+    store.close()
+
+
+def test_chain_store_networks(tmp_path):
+    """Ensure the rows stored for a network are not returned for another one"""
+    path = str(tmp_path / "koios.db")
+    mainnet = ChainStore(path, "https://api.koios.rest/api/v1")
+    preprod = ChainStore(path, "https://preprod.koios.rest/api/v1")
+    mainnet.put_many("epoch_info", {"400": [{"epoch_no": 400}]})
+    assert preprod.get_many("epoch_info", ["400"]) == {}
+    assert mainnet.get_many("epoch_info", ["400"]) == {"400": [{"epoch_no": 400}]}
+    mainnet.close()
+    preprod.close()
+    with MockKoiosServer(rows=10) as server, MockKoiosServer(rows=20) as other:
+        for base_url in [server.base_url, other.base_url]:
+            with KoiosClient(API_BASE_URL=base_url, CHAIN_STORE=path) as client:
+                with client.use():
+                    assert get_chain_store().network == base_url
+
+
+def test_found_rows():
+    """Ensure found_rows returns the inputs found on chain"""
+    rows = [{"datum_hash": "abc"}, {"datum_hash": "def"}]
+    assert found_rows("datum_hash")(["abc", "def", "ghi"], rows) == ["abc", "def"]
+
+
+def test_koios_post_stored(tmp_path):
+    """Ensure koios_post_stored only requests the inputs not stored, and stores the confirmed ones"""
+    hashes = [f"{i:064x}" for i in range(95)]
+    with MockKoiosServer(rows=100) as server:
+        with KoiosClient(
+            API_BASE_URL=server.base_url,
+            CHAIN_STORE=str(tmp_path / "koios.db"),
+            CONFIRMATION_DEPTH=10,
+        ) as client:
+            blocks = client.get_block_info(hashes)
+            assert [block["hash"] for block in blocks] == hashes
+            assert server.requests == 2
+            with client.use():
+                stored = get_chain_store().get_many("block_info", hashes)
+            assert sorted(stored) == hashes[:90]
+            server.reset_stats()
+            again = client.get_block_info(hashes)
+            assert again[:90] == blocks[:90]
+            assert [block["hash"] for block in again] == hashes
+            assert server.requests == 1 and server.rows_served == 5
+            server.reset_stats()
+            assert client.get_block_info(hashes[89::-1]) == blocks[89::-1]
+            assert server.requests == 0
+            server.reset_stats()
+            client.get_block_info(hashes[:3], fields=["hash"])
+            assert server.requests == 1
+
+
+def test_confirmed_rows():
+    """Ensure confirmed_rows and confirmed_txs return the inputs deep enough in the chain"""
+    hashes = [f"{i:064x}" for i in range(100)]
+    rows = [{"hash": "a", "block_height": 90}, {"hash": "b", "block_height": 91}]
+    rows.append({"hash": "c", "block_height": None})
+    with MockKoiosServer(rows=100) as server:
+        with KoiosClient(API_BASE_URL=server.base_url, CONFIRMATION_DEPTH=10) as client:
+            with client.use():
+                assert get_stored_tip()["block_height"] == 100
+                assert confirmed_rows("hash")(["a", "b", "c"], rows) == ["a"]
+                assert confirmed_txs(hashes, []) == hashes[:91]
+
+
+def test_koios_get_stored_epoch(tmp_path):
+    """Ensure koios_get_stored_epoch only stores the epochs that are closed"""
+    url = API_BASE_URL + "/epoch_info"
+    with MockKoiosServer(rows=10) as server:
+        with KoiosClient(
+            API_BASE_URL=server.base_url, CHAIN_STORE=str(tmp_path / "koios.db")
+        ) as client:
+            client.stored_tip = {
+                "time": monotonic(),
+                "block_height": 10,
+                "epoch_no": 10,
+            }
+            with client.use():
+                rows = koios_get_stored_epoch(url, {"_epoch_no": 8}, 8)
+                koios_get_stored_epoch(url, {"_epoch_no": 9}, 9)
+                server.reset_stats()
+                assert koios_get_stored_epoch(url, {"_epoch_no": 8}, 8) == rows
+                assert server.requests == 0
+                koios_get_stored_epoch(url, {"_epoch_no": 9}, 9)
+                koios_get_stored_epoch(url, {"_epoch_no": 8, "select": "epoch_no"}, 8)
+                koios_get_stored_epoch(url, {}, 0)
+                assert server.requests == 3
+
+
+def test_stored_tip_lock(tmp_path):
+    """Ensure the chain store can be opened while the tip is being requested"""
+    with MockKoiosServer(rows=10, latency=0.3) as server:
+        with KoiosClient(
+            API_BASE_URL=server.base_url, CHAIN_STORE=str(tmp_path / "koios.db")
+        ) as client:
+            with client.use(), ThreadPoolExecutor(max_workers=1) as executor:
+                future = submit_in_context(executor, get_stored_tip)
+                sleep(0.1)
+                start = monotonic()
+                assert get_chain_store() is not None
+                assert monotonic() - start < 0.1
+                assert future.result()["block_height"] == 10